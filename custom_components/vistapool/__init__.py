@@ -25,7 +25,7 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN, PLATFORMS, REMOVED_ENTITY_KEYS, TIMER_BLOCKS
-from .coordinator import VistaPoolCoordinator
+from .coordinator import VistaPoolCoordinator, register_cache_store
 from .modbus import VistaPoolModbusClient
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
@@ -68,7 +68,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     client = VistaPoolModbusClient(entry.data)
     coordinator = VistaPoolCoordinator(hass, client, entry, entry.entry_id)
 
-    # Wait for the first update from the coordinator
+    # Start from the register image of the previous run, then wait for the
+    # first update from the coordinator
+    await coordinator.async_load_register_cache()
     await coordinator.async_config_entry_first_refresh()
 
     # Store the coordinator and client in hass.data for easy access
@@ -99,6 +101,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the persisted register image of a removed config entry."""
+    await register_cache_store(hass, entry.entry_id).async_remove()
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the VistaPool integration."""
     from .helpers import get_timer_interval, hhmm_to_seconds
@@ -151,7 +158,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
             _LOGGER.debug("Setting timer %s with data: %s", timer_name, timer_data)
             await coordinator.client.write_timer(timer_name, timer_data)
-            coordinator.request_refresh_with_followup()
+            await coordinator.async_refresh_registers(TIMER_BLOCKS[timer_name])
         except ServiceValidationError:
             raise
         except Exception as e:
@@ -87,7 +87,7 @@ class VistaPoolButton(VistaPoolEntity, ButtonEntity):
             _LOGGER.debug("Syncing time with device...")
             await client.async_write_register(0x0408, prepare_device_time(self.hass))
             await client.async_write_register(0x04F0, 1)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_registers(0x0408)
         elif self._key == "MBF_ESCAPE":
             client = self.coordinator.client
             _LOGGER.debug("Clearing all possible errors...")
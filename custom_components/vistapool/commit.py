@@ -0,0 +1,187 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""VistaPool Integration for Home Assistant - Deferred EEPROM commit scheduling"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+# A commit is sent once no write marked the device dirty for this long [s]
+QUIET_DELAY = 1.0
+# ... but never later than this after the first uncommitted write [s]
+MAX_DELAY = 5.0
+# Failed commits in a row after which the deferred commit stops retrying
+MAX_FAILURES = 3
+
+
+class CommitScheduler:
+    """Coalesces EEPROM save (0x02F0) + EXEC (0x02F5) commits of applied writes.
+
+    mark_dirty() records an applied write; the commit callback runs once no
+    further write arrived for the quiet delay, or at the latest max delay after
+    the first uncommitted write. A burst of writes (a dragged slider, several
+    timers changed in a row) therefore costs a single commit. flush() commits
+    immediately for callers that need the change to be durable. A failed commit
+    keeps the device dirty and is retried after the max delay; after max
+    failures in a row it gives up (see stats) until the next write or flush().
+    """
+
+    def __init__(
+        self,
+        commit: Callable[[], Awaitable[bool]],
+        quiet_delay: float = QUIET_DELAY,
+        max_delay: float = MAX_DELAY,
+        max_failures: int = MAX_FAILURES,
+    ):
+        self._commit = commit
+        self._quiet_delay = quiet_delay
+        self._max_delay = max_delay
+        self._max_failures = max_failures
+        self._failures = 0  # failed commits since the last success or write
+        self._first_dirty: float | None = None
+        self._last_dirty: float | None = None
+        self._task: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+        self._pending_writes = 0
+        self._latencies = deque(maxlen=20)  # first dirty write -> committed [s]
+        self._durations = deque(maxlen=20)  # time to send save + EXEC [s]
+        self.commits = 0
+        self.coalesced_writes = 0
+        self.failed_commits = 0
+        self.last_error: str | None = None
+
+    @property
+    def dirty(self) -> bool:
+        """Whether applied writes are waiting for a commit."""
+        return self._first_dirty is not None
+
+    @property
+    def gave_up(self) -> bool:
+        """Whether pending writes stopped being retried after repeated failures."""
+        return self.dirty and self._failures >= self._max_failures
+
+    def mark_dirty(self) -> None:
+        """Record an applied write and (re)arm the deferred commit."""
+        now = time.monotonic()
+        if self._first_dirty is None:
+            self._first_dirty = now
+        self._last_dirty = now
+        self._pending_writes += 1
+        self._failures = 0
+        self._arm()
+
+    async def flush(self) -> bool:
+        """Commit now if applied writes are pending. Returns False on failure."""
+        if await self._do_commit():
+            return True
+        self._arm()
+        return False
+
+    def cancel(self) -> None:
+        """Stop the deferred commit without committing (the state stays dirty)."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+
+    def _arm(self) -> None:
+        if self.gave_up:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while self.dirty:
+            due = min(
+                self._last_dirty + self._quiet_delay,
+                self._first_dirty + self._max_delay,
+            )
+            remaining = due - time.monotonic()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+            elif not await self._do_commit():
+                if self.gave_up:
+                    _LOGGER.warning(
+                        "EEPROM commit of %d write(s) failed %d times in a row, "
+                        "retrying after the next write: %s",
+                        self._pending_writes,
+                        self._failures,
+                        self.last_error,
+                    )
+                    return
+                await asyncio.sleep(self._max_delay)  # retry a failed commit
+
+    async def _do_commit(self) -> bool:
+        async with self._lock:
+            if not self.dirty:
+                return True
+            first, writes = self._first_dirty, self._pending_writes
+            # Writes arriving while the commit is sent arm a new one
+            self._first_dirty = self._last_dirty = None
+            self._pending_writes = 0
+            start = time.monotonic()
+            try:
+                ok = await self._commit()
+            except asyncio.CancelledError:
+                self._restore(first, writes)
+                raise
+            except Exception as e:
+                _LOGGER.debug("Deferred EEPROM commit failed: %s", e)
+                self.last_error = str(e) or type(e).__name__
+                ok = False
+            else:
+                if not ok:
+                    self.last_error = "save or EXEC rejected"
+            if not ok:
+                self.failed_commits += 1
+                self._failures += 1
+                self._restore(first, writes)
+                return False
+            self._failures = 0
+            self.commits += 1
+            self.coalesced_writes += writes
+            now = time.monotonic()
+            self._latencies.append(now - first)
+            self._durations.append(now - start)
+            _LOGGER.debug("EEPROM commit of %d write(s) sent", writes)
+            return True
+
+    def _restore(self, first: float, writes: int) -> None:
+        """Mark the writes of an unfinished commit as pending again."""
+        self._pending_writes += writes
+        if self._first_dirty is None:
+            self._first_dirty = self._last_dirty = first
+
+    @property
+    def stats(self) -> dict:
+        """Return commit statistics for diagnostics."""
+        return {
+            "pending": self.dirty,
+            "pending_writes": self._pending_writes,
+            "commits": self.commits,
+            "coalesced_writes": self.coalesced_writes,
+            "failed_commits": self.failed_commits,
+            "gave_up": self.gave_up,
+            "last_error": self.last_error,
+            "average_latency": _average(self._latencies),
+            "average_commit_time": _average(self._durations),
+        }
+
+
+def _average(values) -> float | None:
+    return round(sum(values) / len(values), 3) if values else None
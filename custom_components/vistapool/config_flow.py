@@ -24,6 +24,7 @@ from homeassistant.helpers.selector import SelectSelector, SelectSelectorConfig
 
 from .const import (
     DEFAULT_MODBUS_FRAMER,
+    DEFAULT_MODBUS_TRANSPORT,
     DEFAULT_NAME,
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
@@ -82,6 +83,10 @@ class VistaPoolConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     "modbus_framer",
                     default=DEFAULT_MODBUS_FRAMER,
                 ): vol.In(["tcp", "rtu"]),
+                vol.Optional(
+                    "modbus_transport",
+                    default=DEFAULT_MODBUS_TRANSPORT,
+                ): vol.In(["pymodbus", "native"]),
                 vol.Optional(
                     "scan_interval",
                     default=str(DEFAULT_SCAN_INTERVAL),
@@ -159,6 +164,10 @@ class VistaPoolConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     "modbus_framer",
                     default=current.get("modbus_framer", DEFAULT_MODBUS_FRAMER),
                 ): vol.In(["tcp", "rtu"]),
+                vol.Optional(
+                    "modbus_transport",
+                    default=current.get("modbus_transport", DEFAULT_MODBUS_TRANSPORT),
+                ): vol.In(["pymodbus", "native"]),
             }
         )
 
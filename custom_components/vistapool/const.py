@@ -50,15 +50,22 @@ LOGGER = logging.getLogger(__name__)
 
 DEFAULT_TIMER_RESOLUTION = 15  # in minutes
 DEFAULT_SCAN_INTERVAL = 30  # in seconds
+DEFAULT_VERIFY_INTERVAL = 30  # in minutes — every cached page and timer re-read once
 FOLLOW_UP_REFRESH_DELAY = (
     2.0  # seconds — delay before a second refresh after IO entity actions
 )
+REGISTER_CACHE_VERSION = 1  # storage format of the persisted register image
+REGISTER_CACHE_SAVE_DELAY = 10  # seconds — coalesces saves after page reads
 DEFAULT_PORT = 502
 DEFAULT_SLAVE_ID = 1
 DEFAULT_MODBUS_FRAMER = "tcp"  # "tcp" = standard Modbus TCP (MBAP header), "rtu" = RTU over TCP (no MBAP, CRC)
+DEFAULT_MODBUS_TRANSPORT = (
+    "pymodbus"  # "pymodbus" = pymodbus client, "native" = built-in asyncio client
+)
 
 MANUAL_FILTRATION_REGISTER = 0x0413
 EXEC_REGISTER = 0x02F5
+EEPROM_SAVE_REGISTER = 0x02F0
 HEATING_SETPOINT_REGISTER = 0x0416  # MBF_PAR_HEATING_TEMP
 INTELLIGENT_SETPOINT_REGISTER = 0x041C  # MBF_PAR_INTELLIGENT_TEMP
 
@@ -16,25 +16,32 @@
 
 import json
 import logging
+from collections.abc import Callable
 from datetime import timedelta
 
 from homeassistant.const import CONF_NAME
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import slugify
 
 from .const import (
     CAPABILITY_KEYS,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_VERIFY_INTERVAL,
     DOMAIN,
     FOLLOW_UP_REFRESH_DELAY,
     HEATING_SETPOINT_REGISTER,
     INTELLIGENT_SETPOINT_REGISTER,
+    REGISTER_CACHE_SAVE_DELAY,
+    REGISTER_CACHE_VERSION,
     TIMER_BLOCKS,
 )
+from .countdown import CountdownModel
 from .helpers import is_device_time_out_of_sync, parse_version, prepare_device_time
+from .registers import page_of_register, resolve_required_keys, timer_of_register
 
 MAX_SCAN_INTERVAL = timedelta(seconds=180)  # Maximum allowed scan interval (3 minutes)
 
@@ -43,6 +50,233 @@ _FILT_TIMERS = ("filtration1", "filtration2", "filtration3")
 _LOGGER = logging.getLogger(__name__)
 
 
+_MISSING = object()
+
+
+class CoordinatorData(dict):
+    """Coordinator data that records which keys are read while tracking.
+
+    Entities track the keys their state is computed from (see
+    VistaPoolEntity.async_write_ha_state), so an update only needs to reach
+    the entities whose keys changed. Iterating or copying the data counts as
+    reading every key.
+
+    Derived keys (see add_derived) are computed on first access from the
+    arguments they were registered with. Those arguments stand in for the
+    values when diffing updates, so keys no entity reads are never computed.
+
+    The data is updated in place between polls: every modified key remembers
+    what it was compared by before (see take_changes), so an update is diffed
+    by the modified keys only.
+    """
+
+    __slots__ = ("_reads", "_read_all", "_lazy", "_tokens", "_originals", "_written")
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._reads: set | None = None
+        self._read_all = False
+        # Derived keys not computed yet: key -> (compute, args)
+        self._lazy: dict[str, tuple[Callable[..., dict], tuple]] = {}
+        # Arguments every derived key is computed from
+        self._tokens: dict[str, tuple] = {}
+        # State (see _state) of the keys modified since take_changes()
+        self._originals: dict[str, tuple] = {}
+        # Keys assigned or removed since take_written()
+        self._written: set[str] = set()
+
+    def add_derived(
+        self, keys: tuple[str, ...], compute: Callable[..., dict], *args
+    ) -> None:
+        """Register keys whose values compute(*args) returns on first access."""
+        field = (compute, args)
+        for key in keys:
+            self._touch(key)
+            super().pop(key, None)
+            self._lazy[key] = field
+            self._tokens[key] = args
+
+    @property
+    def derived_tokens(self) -> dict[str, tuple]:
+        """Arguments of every derived key (changed arguments: changed value)."""
+        return self._tokens
+
+    def _resolve(self, key) -> None:
+        compute, args = self._lazy[key]
+        for name, value in compute(*args).items():
+            self._lazy.pop(name, None)
+            super().__setitem__(name, value)
+
+    def materialize(self) -> None:
+        """Compute every derived key that has not been read yet."""
+        while self._lazy:
+            self._resolve(next(iter(self._lazy)))
+
+    def _state(self, key) -> tuple:
+        """Return what key is compared by: its derivation arguments or its value."""
+        token = self._tokens.get(key, _MISSING)
+        if token is not _MISSING:
+            return (True, token)
+        return (False, dict.get(self, key, _MISSING))
+
+    def _touch(self, key) -> None:
+        if key not in self._originals:
+            self._originals[key] = self._state(key)
+
+    def take_changes(self) -> frozenset[str]:
+        """Return the keys modified to a new state since the last call."""
+        originals, self._originals = self._originals, {}
+        return frozenset(
+            key for key, state in originals.items() if self._state(key) != state
+        )
+
+    def take_written(self) -> set[str]:
+        """Return the keys assigned or removed since the last call."""
+        written, self._written = self._written, set()
+        return written
+
+    def diff(self, other: "CoordinatorData") -> frozenset[str]:
+        """Return the keys whose state differs from other (a different object)."""
+        keys = (
+            dict.keys(self) | self._lazy.keys() | dict.keys(other) | other._lazy.keys()
+        )
+        return frozenset(key for key in keys if self._state(key) != other._state(key))
+
+    def start_tracking(self) -> None:
+        """Start recording the keys that are read."""
+        self._reads = set()
+        self._read_all = False
+
+    def stop_tracking(self) -> frozenset[str] | None:
+        """Stop recording and return the keys read (None: all keys)."""
+        reads, self._reads = self._reads, None
+        if reads is None or self._read_all:
+            return None
+        return frozenset(reads)
+
+    def get(self, key, default=None):
+        if self._reads is not None:
+            self._reads.add(key)
+        if key in self._lazy:
+            self._resolve(key)
+        return super().get(key, default)
+
+    def __getitem__(self, key):
+        if self._reads is not None:
+            self._reads.add(key)
+        if key in self._lazy:
+            self._resolve(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key) -> bool:
+        if self._reads is not None:
+            self._reads.add(key)
+        return key in self._lazy or super().__contains__(key)
+
+    def __setitem__(self, key, value) -> None:
+        self._touch(key)
+        self._written.add(key)
+        if key in self._lazy:
+            self._resolve(key)
+        self._tokens.pop(key, None)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key) -> None:
+        self._touch(key)
+        self._written.add(key)
+        if key in self._lazy:
+            self._resolve(key)
+        self._tokens.pop(key, None)
+        super().__delitem__(key)
+
+    def pop(self, key, *default):
+        self._touch(key)
+        self._written.add(key)
+        if key in self._lazy:
+            self._resolve(key)
+        self._tokens.pop(key, None)
+        return super().pop(key, *default)
+
+    def update(self, *args, **kwargs) -> None:
+        if len(args) == 1 and not kwargs and hasattr(args[0], "items"):
+            items = args[0].items()  # no intermediate copy of a mapping
+        else:
+            items = dict(*args, **kwargs).items()
+        for key, value in items:
+            self[key] = value
+
+    def __len__(self) -> int:
+        return super().__len__() + len(self._lazy)
+
+    def __eq__(self, other) -> bool:
+        self.materialize()
+        return super().__eq__(other)
+
+    def __ne__(self, other) -> bool:
+        self.materialize()
+        return super().__ne__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        self.materialize()
+        return super().__repr__()
+
+    def _track_all(self) -> None:
+        self.materialize()
+        if self._reads is not None:
+            self._read_all = True
+
+    def __iter__(self):
+        self._track_all()
+        return super().__iter__()
+
+    def keys(self):
+        self._track_all()
+        return super().keys()
+
+    def values(self):
+        self._track_all()
+        return super().values()
+
+    def items(self):
+        self._track_all()
+        return super().items()
+
+    def copy(self) -> dict:
+        self._track_all()
+        return super().copy()
+
+
+# Data keys of every timer block, in the order _timer_data returns them
+_TIMER_DATA_KEYS = {
+    name: tuple(
+        f"{name}_{field}"
+        for field in ("enable", "start", "interval", "period", "countdown", "stop")
+    )
+    for name in TIMER_BLOCKS
+}
+
+
+def _timer_data(name, enable, on, interval, period, countdown) -> dict:
+    """Return the data keys of a timer block (start/stop in seconds since midnight)."""
+    stop = (on + interval) % 86400 if on is not None and interval is not None else None
+    return dict(
+        zip(_TIMER_DATA_KEYS[name], (enable, on, interval, period, countdown, stop))
+    )
+
+
+def _filtration_remaining(*countdowns) -> dict:
+    """Aggregate the remaining filtration time: the largest running countdown."""
+    running = [cd for cd in countdowns if cd is not None and cd > 0]
+    return {"FILTRATION_REMAINING": max(running) if running else None}
+
+
+def register_cache_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the Store holding the persisted register image of a config entry."""
+    return Store(hass, REGISTER_CACHE_VERSION, f"{DOMAIN}.{entry_id}.registers")
+
+
 class VistaPoolCoordinator(DataUpdateCoordinator):
     """Coordinator for VistaPool platform."""
 
@@ -64,6 +298,10 @@ class VistaPoolCoordinator(DataUpdateCoordinator):
             config_entry=entry,
         )
         self.client = client
+        # Time in which cached configuration pages and timers are all re-read
+        self.client.verify_window = (
+            entry.options.get("verify_interval", DEFAULT_VERIFY_INTERVAL) * 60
+        )
         self.entry = entry
         self.entry_id = entry_id
         self.device_name = entry.data.get(CONF_NAME, DOMAIN)
@@ -75,6 +313,112 @@ class VistaPoolCoordinator(DataUpdateCoordinator):
         self._firmware = "?"
         self._model = "Unknown"
         self._follow_up_unsub: CALLBACK_TYPE | None = None
+        # Filtration countdowns extrapolated between timer reads
+        self._countdowns = CountdownModel()
+        self._filtration_relay: bool | None = None
+        # Data keys used by each enabled entity (drives which registers are polled)
+        self._entity_data_keys: dict[object, tuple[str, ...]] = {}
+        # Persisted register image (see async_load_register_cache)
+        self._cache_store: Store | None = None
+        self._saved_cache_generation: int | None = None
+        # Data keys changed by the last update; None means "everything changed"
+        self.changed_keys: frozenset[str] | None = None
+        self._previous_data: CoordinatorData | None = None
+        # Data built from the client's register image and updated in place by
+        # the following polls (see _async_update_data)
+        self._client_data: CoordinatorData | None = None
+        self._notified_context: tuple | None = None
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners after computing which data keys changed."""
+        if self.data is not None and not isinstance(self.data, CoordinatorData):
+            self.data = CoordinatorData(self.data)
+        self.changed_keys = self._compute_changed_keys()
+        super().async_update_listeners()
+
+    def _compute_changed_keys(self) -> frozenset[str] | None:
+        """Compare the data with the previous update.
+
+        Returns None (every entity updates) for the first data and whenever
+        something outside the data that entities depend on changed:
+        availability, winter mode, time sync or the entry options. Derived
+        keys are compared by the arguments they are computed from, so they do
+        not have to be computed for the comparison.
+        """
+        data = self.data
+        previous, self._previous_data = self._previous_data, data
+        # Keys modified in place since the last update (optimistic values,
+        # in-place polls); compared without copying the data
+        modified = data.take_changes() if data is not None else frozenset()
+        context = (
+            self.last_update_success,
+            self.winter_mode,
+            self.auto_time_sync,
+            dict(self.entry.options),
+        )
+        previous_context, self._notified_context = self._notified_context, context
+        if previous is None or data is None or context != previous_context:
+            return None
+        changed = modified if data is previous else data.diff(previous)
+        _LOGGER.debug("%d of %d data keys changed", len(changed), len(data))
+        return changed
+
+    async def async_load_register_cache(self) -> None:
+        """Restore the register image saved by a previous run.
+
+        Called before the first refresh, so that after a restart or reload the
+        first poll reads only MEASURE, the MODBUS page and the pages flagged in
+        MBF_NOTIFICATION instead of every page and timer block.
+        """
+        self._cache_store = register_cache_store(self.hass, self.entry_id)
+        try:
+            data = await self._cache_store.async_load()
+        except Exception as err:  # pragma: no cover
+            _LOGGER.debug("Could not load register cache: %s", err)
+            return
+        if data and self.client.restore_cache(data):
+            self._saved_cache_generation = self.client.cache_generation
+            _LOGGER.debug("Register cache restored (%d values)", len(data["result"]))
+
+    def _schedule_register_cache_save(self) -> None:
+        """Persist the register image if pages or timers were read since the last save."""
+        if self._cache_store is None:
+            return
+        generation = self.client.cache_generation
+        if generation == self._saved_cache_generation:
+            return
+        snapshot = self.client.export_cache()
+        if snapshot is None:
+            return
+        self._saved_cache_generation = generation
+        self._cache_store.async_delay_save(lambda: snapshot, REGISTER_CACHE_SAVE_DELAY)
+
+    @callback
+    def async_register_entity_keys(self, keys) -> CALLBACK_TYPE:
+        """Register the data keys used by an enabled entity.
+
+        Returns a callback that unregisters them again. Entities call this when
+        added to hass; HA removes an entity when it is disabled in the registry,
+        so the required register set always follows the enabled entities.
+        """
+        token = object()
+        self._entity_data_keys[token] = tuple(keys)
+        self._update_required_keys()
+
+        @callback
+        def _unregister() -> None:
+            if self._entity_data_keys.pop(token, None) is not None:
+                self._update_required_keys()
+
+        return _unregister
+
+    def _update_required_keys(self) -> None:
+        """Push the register keys backing the enabled entities to the client."""
+        keys = {k for keys in self._entity_data_keys.values() for k in keys}
+        required = resolve_required_keys(keys)
+        if required != self.client.required_keys:
+            self.client.required_keys = required
 
     def request_refresh_with_followup(
         self, delay: float = FOLLOW_UP_REFRESH_DELAY
@@ -116,7 +460,18 @@ class VistaPoolCoordinator(DataUpdateCoordinator):
             return self.data if self.data is not None else self._capability_snapshot
 
         try:
-            data = await self.client.async_read_all()
+            result = await self.client.async_read_all()
+            changed = self.client.take_changed_keys()
+            prev = self.data
+            prev_remaining = prev.get("FILTRATION_REMAINING") if prev else None
+            h_old = prev.get("MBF_PAR_HEATING_TEMP") if prev else None
+            i_old = prev.get("MBF_PAR_INTELLIGENT_TEMP") if prev else None
+            if changed is None or prev is None or prev is not self._client_data:
+                data = self._client_data = CoordinatorData(result)
+            else:
+                # Only the registers changed since the last poll are taken over
+                data = prev
+                self._take_client_values(data, result, changed)
             self._consecutive_errors = 0
 
             # Reset interval after success
@@ -151,40 +506,31 @@ class VistaPoolCoordinator(DataUpdateCoordinator):
                 if ft not in enabled_timers:
                     enabled_timers.append(ft)
 
-            # Bypass the notification cache for filtration timers while
-            # filtration is running so the countdown values stay fresh.
+            # While filtration runs the countdowns are extrapolated locally and
+            # the filtration timers bypass the notification cache only to
+            # resynchronise: periodically and whenever the relay state changes.
             # Use both the relay bit and the previous countdown to avoid
             # missing cycles when the relay bit is unreliable.
-            prev_remaining = (
-                self.data.get("FILTRATION_REMAINING") if self.data else None
-            )
-            filtration_active = bool(data.get("Filtration Pump")) or bool(
+            filtration_on = bool(data.get("Filtration Pump"))
+            filtration_active = filtration_on or bool(
                 prev_remaining and prev_remaining > 0
             )
+            relay_changed = (
+                self._filtration_relay is not None
+                and filtration_on != self._filtration_relay
+            )
+            self._filtration_relay = filtration_on
+            resync = (
+                self._countdowns.resync_due(_FILT_TIMERS, filtration_active)
+                or relay_changed
+            )
             timers = await self.client.read_all_timers(
                 enabled_timers=enabled_timers,
-                force_read=_FILT_TIMERS if filtration_active else None,
+                force_read=_FILT_TIMERS if resync else None,
             )
 
-            for t_name, t in timers.items():
-                data[f"{t_name}_enable"] = t["enable"]
-                data[f"{t_name}_start"] = t["on"]  # saved as seconds since midnight
-                data[f"{t_name}_interval"] = t["interval"]
-                data[f"{t_name}_period"] = t["period"]
-                data[f"{t_name}_countdown"] = t["countdown"]
-                if t["on"] is not None and t["interval"] is not None:
-                    stop = (t["on"] + t["interval"]) % 86400
-                    data[f"{t_name}_stop"] = stop
-                else:
-                    data[f"{t_name}_stop"] = None
-
-            # Aggregate filtration remaining time from active filtration timers
-            filt_remaining = None
-            for n in (1, 2, 3):
-                cd = data.get(f"filtration{n}_countdown")
-                if cd is not None and cd > 0:
-                    filt_remaining = max(filt_remaining or 0, cd)
-            data["FILTRATION_REMAINING"] = filt_remaining
+            self._apply_timers(data, timers, resync)
+            self._schedule_register_cache_save()
 
             if self.auto_time_sync:
                 if is_device_time_out_of_sync(data, self.hass):
@@ -194,19 +540,7 @@ class VistaPoolCoordinator(DataUpdateCoordinator):
                     )
                     await self.client.async_write_register(0x04F0, 1)
 
-            # Apply developer overrides (for testing UI visibility without hardware)
-            try:
-                if self.entry.options.get("dev_overrides_enabled", False):
-                    raw = self.entry.options.get("dev_overrides", "{}")
-                    overrides = json.loads(raw) if isinstance(raw, str) else raw
-                    if isinstance(overrides, dict):
-                        for k, v in overrides.items():
-                            data[k] = v
-                        _LOGGER.debug("Applied dev overrides: %s", overrides)
-                    else:  # pragma: no cover
-                        _LOGGER.warning("dev_overrides must be a JSON object (dict)")
-            except Exception as dev_err:  # pragma: no cover
-                _LOGGER.warning("Failed to apply dev_overrides: %s", dev_err)
+            self._apply_dev_overrides(data)
 
             # Keep heating and intelligent setpoints synchronized based on the last change.
             # If exactly one changed since the previous snapshot and values differ now,
@@ -214,12 +548,9 @@ class VistaPoolCoordinator(DataUpdateCoordinator):
             # If both changed at once, revert both to previous values to avoid conflicts.
             # If neither changed but they differ, sync intelligent to heating (initial sync).
             try:
-                prev = getattr(self, "data", None)
                 heat = data.get("MBF_PAR_HEATING_TEMP")
                 intel = data.get("MBF_PAR_INTELLIGENT_TEMP")
                 if heat is not None and intel is not None and heat != intel:
-                    h_old = prev.get("MBF_PAR_HEATING_TEMP") if prev else None
-                    i_old = prev.get("MBF_PAR_INTELLIGENT_TEMP") if prev else None
                     heating_changed = h_old is None or heat != h_old
                     intelligent_changed = i_old is None or intel != i_old
 
@@ -254,12 +585,9 @@ class VistaPoolCoordinator(DataUpdateCoordinator):
                         )
                         if h_old is not None and i_old is not None:
                             # Write both back to their old values
-                            await self.client.async_write_register(
-                                HEATING_SETPOINT_REGISTER, int(h_old), apply=False
-                            )
-                            await self.client.async_write_register(
-                                INTELLIGENT_SETPOINT_REGISTER, int(i_old), apply=True
-                            )
+                            async with self.client.transaction(apply=True) as tx:
+                                tx.write(HEATING_SETPOINT_REGISTER, int(h_old))
+                                tx.write(INTELLIGENT_SETPOINT_REGISTER, int(i_old))
                             # Reflect revert in returned data
                             data["MBF_PAR_HEATING_TEMP"] = h_old
                             data["MBF_PAR_INTELLIGENT_TEMP"] = i_old
@@ -321,6 +649,111 @@ class VistaPoolCoordinator(DataUpdateCoordinator):
             _LOGGER.warning("Modbus error – marking all entities unavailable")
             raise UpdateFailed(f"Modbus communication error: {err}") from err
 
+    def _apply_timers(self, data: CoordinatorData, timers: dict, fresh: bool) -> None:
+        """Add the timer data keys and FILTRATION_REMAINING to data.
+
+        The keys are derived lazily (see CoordinatorData.add_derived), so
+        timer keys no entity reads are never built.
+
+        fresh tells whether the filtration timer blocks were read from the
+        device on request (see CountdownModel.countdown).
+        """
+        countdowns = {}
+        for t_name, t in timers.items():
+            countdown = t["countdown"]
+            if t_name in _FILT_TIMERS:
+                countdown = countdowns[t_name] = self._countdowns.countdown(
+                    t_name, countdown, fresh
+                )
+            data.add_derived(
+                _TIMER_DATA_KEYS[t_name],
+                _timer_data,
+                t_name,
+                t["enable"],
+                t["on"],
+                t["interval"],
+                t["period"],
+                countdown,
+            )
+
+        # Aggregate filtration remaining time from active filtration timers
+        data.add_derived(
+            ("FILTRATION_REMAINING",),
+            _filtration_remaining,
+            *(
+                countdowns[ft] if ft in countdowns else data.get(f"{ft}_countdown")
+                for ft in _FILT_TIMERS
+            ),
+        )
+
+    @staticmethod
+    def _take_client_values(data: CoordinatorData, values: dict, changed) -> None:
+        """Update data in place with the client values of the changed keys.
+
+        Keys written locally since the last call (optimistic values, overrides,
+        synced setpoints) are reset to the client values as well, as a data
+        dict rebuilt from the client would be.
+        """
+        for key in data.take_written().union(changed):
+            if key in values:
+                data[key] = values[key]
+        data.take_written()
+
+    def _apply_dev_overrides(self, data: dict) -> None:
+        """Apply developer overrides (for testing UI visibility without hardware)."""
+        try:
+            if self.entry.options.get("dev_overrides_enabled", False):
+                raw = self.entry.options.get("dev_overrides", "{}")
+                overrides = json.loads(raw) if isinstance(raw, str) else raw
+                if isinstance(overrides, dict):
+                    for k, v in overrides.items():
+                        data[k] = v
+                    _LOGGER.debug("Applied dev overrides: %s", overrides)
+                else:  # pragma: no cover
+                    _LOGGER.warning("dev_overrides must be a JSON object (dict)")
+        except Exception as dev_err:  # pragma: no cover
+            _LOGGER.warning("Failed to apply dev_overrides: %s", dev_err)
+
+    async def async_refresh_registers(self, *addresses: int) -> None:
+        """Re-read only the pages and timer blocks holding addresses after a write.
+
+        The result is merged into the current data and pushed to the entities.
+        Falls back to a regular refresh when an address does not belong to a
+        configuration page or timer block, or the targeted read fails.
+        """
+        pages: set[str] = set()
+        timers: set[str] = set()
+        for address in addresses:
+            page = page_of_register(address)
+            if (timer := timer_of_register(address)) is not None:
+                timers.add(timer)
+            elif page is not None and page != "MEASURE":
+                pages.add(page)
+            else:
+                await self.async_request_refresh()
+                return
+        if self.winter_mode or self.data is None:
+            await self.async_request_refresh()
+            return
+        try:
+            result, fresh_timers = await self.client.async_refresh_pages(pages, timers)
+        except Exception as err:
+            _LOGGER.debug("Targeted refresh failed, doing a full refresh: %s", err)
+            await self.async_request_refresh()
+            return
+        changed = self.client.take_changed_keys()
+        data = self.data
+        if changed is None or data is not self._client_data:
+            # The data has to be rebuilt from the client's register image
+            self._client_data = None
+            await self.async_request_refresh()
+            return
+        self._take_client_values(data, result, changed)
+        self._apply_timers(data, fresh_timers, True)
+        self._schedule_register_cache_save()
+        self._apply_dev_overrides(data)
+        self.async_set_updated_data(data)
+
     async def set_auto_time_sync(self, enabled: bool):
         self.auto_time_sync = enabled
         # Update the entry options to reflect the change
@@ -0,0 +1,74 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""VistaPool Integration for Home Assistant - Local timer countdown model"""
+
+import time
+from collections.abc import Iterable
+
+# Running countdowns are re-read from the device at least this often [s]
+RESYNC_INTERVAL = 600
+
+
+class CountdownModel:
+    """Extrapolates running timer countdowns between device reads.
+
+    Every countdown is anchored to the monotonic time at which it was read from
+    the device and decremented locally while the timer runs, so the timer blocks
+    do not have to be re-read on every poll. A resync is due when a countdown
+    has no anchor yet, its anchor is older than the resync interval or the
+    running state changed.
+    """
+
+    def __init__(self, resync_interval: float = RESYNC_INTERVAL):
+        self._resync_interval = resync_interval
+        self._anchors: dict[str, tuple[int, float]] = {}  # name -> (countdown, time)
+        self._running: bool | None = None
+
+    def resync_due(self, names: Iterable[str], running: bool) -> bool:
+        """Return True if the countdowns of names must be read from the device."""
+        changed = self._running is not None and running != self._running
+        self._running = running
+        if changed:
+            return True
+        if not running:
+            return False
+        now = time.monotonic()
+        return any(
+            (anchor := self._anchors.get(name)) is None
+            or now - anchor[1] >= self._resync_interval
+            for name in names
+        )
+
+    def countdown(self, name: str, value: int | None, fresh: bool) -> int | None:
+        """Return the current countdown of a timer block.
+
+        value is the countdown returned by the client and fresh tells whether the
+        block was read from the device on request. A value that differs from the
+        anchored one was read as well (e.g. after an INSTALLER notification), so
+        it becomes the new anchor too.
+        """
+        now = time.monotonic()
+        anchor = self._anchors.get(name)
+        if fresh or anchor is None or value != anchor[0]:
+            self._anchors[name] = (value, now)
+            return value
+        if not self._running or not value:
+            return value
+        return max(value - int(now - anchor[1]), 0)
+
+    def reset(self) -> None:
+        """Forget all anchors; the next running poll reads the device again."""
+        self._anchors.clear()
+        self._running = None
@@ -20,6 +20,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
+from .coordinator import CoordinatorData
 
 
 async def async_get_config_entry_diagnostics(
@@ -48,10 +49,14 @@ async def async_get_config_entry_diagnostics(
     if coordinator is None:
         return diagnostics
 
+    data = getattr(coordinator, "data", {})
+    if isinstance(data, CoordinatorData):
+        data = data.copy()  # computes the lazily derived keys
+
     diagnostics["coordinator"] = {
         "last_update_success": getattr(coordinator, "last_update_success", None),
         "last_update_time": str(getattr(coordinator, "last_update_time", None)),
-        "data": getattr(coordinator, "data", {}),
+        "data": data,
         "update_interval": str(getattr(coordinator, "update_interval", None)),
         "last_exception": str(getattr(coordinator, "last_exception", "")),
         "firmware": getattr(coordinator, "firmware", None),
@@ -63,7 +68,9 @@ async def async_get_config_entry_diagnostics(
     client = getattr(coordinator, "client", None)
     if client and hasattr(client, "connection_stats"):
         diagnostics["connection_stats"] = client.connection_stats
+    if client and hasattr(client, "register_snapshot"):
+        diagnostics["raw_registers"] = client.register_snapshot.raw_pages()
 
-    diagnostics["last_device_data"] = getattr(coordinator, "data", {})
+    diagnostics["last_device_data"] = data
 
     return diagnostics
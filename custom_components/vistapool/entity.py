@@ -19,10 +19,12 @@ This module defines the base entity class for the VistaPool integration.
 It provides common functionality for all entities, including device information,
 """
 
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import slugify as ha_slugify
 
 from .const import DOMAIN, NAME
+from .coordinator import CoordinatorData
 from .helpers import get_machine_name, modbus_regs_to_hex_string, parse_version
 
 
@@ -31,11 +33,53 @@ class VistaPoolEntity(CoordinatorEntity):
 
     _attr_has_entity_name = True
     _winter_mode_active: bool = True
+    # Data keys the last written state was computed from (None: unknown)
+    _read_keys: frozenset[str] | None = None
 
     def __init__(self, coordinator, entry_id) -> None:
         super().__init__(coordinator)
         self._entry_id = entry_id
 
+    @property
+    def data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys this entity reads its state from."""
+        key = getattr(self, "_data_key", None) or getattr(self, "_key", None)
+        return (key,) if key else ()
+
+    async def async_added_to_hass(self) -> None:
+        """Register the entity's data keys so the client polls their registers."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_register_entity_keys(self.data_keys)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only if a key it was computed from has changed."""
+        changed = getattr(self.coordinator, "changed_keys", None)
+        if (
+            isinstance(changed, frozenset)
+            and self._read_keys is not None
+            and changed.isdisjoint(self._read_keys)
+        ):
+            return
+        super()._handle_coordinator_update()
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and record the data keys it was computed from."""
+        data = self.coordinator.data
+        self._read_keys = None
+        if not isinstance(data, CoordinatorData):
+            super().async_write_ha_state()
+            return
+        data.start_tracking()
+        try:
+            super().async_write_ha_state()
+        finally:
+            reads = data.stop_tracking()
+        self._read_keys = reads
+
     @property
     def available(self) -> bool:
         """Return False for control entities while winter mode is active."""
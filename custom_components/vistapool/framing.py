@@ -0,0 +1,249 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""VistaPool Integration for Home Assistant - Modbus framing helpers"""
+
+from collections.abc import Callable
+
+FC20 = 0x20  # Sugar Valley proprietary broadcast function code
+
+# Longest FC20 frame searched for a CRC match (Modbus RTU ADU maximum)
+MAX_FC20_LENGTH = 256
+# Shortest possible RTU frame: unit + function + at least one byte + CRC
+MIN_RTU_LENGTH = 5
+
+
+def _crc16_table() -> tuple[int, ...]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _crc16_table()
+
+
+def crc16(data) -> int:
+    """Return the Modbus RTU CRC16 of data (transmitted little-endian)."""
+    crc = 0xFFFF
+    for byte in data:
+        crc = (crc >> 8) ^ _CRC16_TABLE[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def rtu_frame_length(view, pos: int) -> int | None:
+    """Return the length of the RTU response starting at pos.
+
+    Returns None when the header is not complete yet, and 0 for a function code
+    this integration never receives (the stream cannot be parsed further).
+    """
+    if len(view) - pos < 2:
+        return None
+    function = view[pos + 1]
+    if function & 0x80:
+        return 5  # unit, function|0x80, exception code, CRC
+    if function in (0x03, 0x04):
+        if len(view) - pos < 3:
+            return None
+        return 5 + view[pos + 2]  # unit, function, byte count, data, CRC
+    if function in (0x06, 0x10):
+        return 8  # unit, function, address, value/count, CRC
+    return 0
+
+
+def mbap_frame_length(view, pos: int) -> int | None:
+    """Return the length of the Modbus TCP (MBAP) frame starting at pos.
+
+    Returns None when the header is not complete yet, and 0 when the bytes are
+    not an MBAP header (Protocol Identifier is not 0x0000).
+    """
+    if len(view) - pos < 6:
+        return None
+    if view[pos + 2] or view[pos + 3]:
+        return 0
+    return 6 + (view[pos + 4] << 8 | view[pos + 5])
+
+
+class Fc20FrameSplitter:
+    """Strip Sugar Valley FC20 broadcasts from a Modbus response byte stream.
+
+    Sugar Valley devices broadcast proprietary FC20 frames on the RS485 bus about
+    every 2 seconds and gateways forward them raw (without MBAP header) in both
+    framing modes. The splitter follows response frame boundaries (RTU length from
+    the function code, MBAP length field for Modbus TCP) so it only looks for FC20
+    at the start of a frame. The FC20 payload carries no usable length, so the end
+    of a broadcast is found by CRC: the first length whose trailing two bytes are
+    the CRC of the preceding ones. If no CRC matches (corrupted broadcast), the
+    stream is resynchronised on the next valid response frame.
+
+    Only broadcast bytes are removed; everything else is forwarded. Chunks without
+    any broadcast are returned as the very same object, split chunks are joined
+    once. A partial frame header or a partial broadcast is held back in a reusable
+    buffer until the next chunk arrives.
+    """
+
+    def __init__(
+        self,
+        unit_id: int,
+        rtu: bool,
+        on_broadcast: Callable[[bytes], None] | None = None,
+    ):
+        self._unit = unit_id
+        self._rtu = rtu
+        self._frame_length = rtu_frame_length if rtu else mbap_frame_length
+        self._on_broadcast = on_broadcast
+        self._buffer = bytearray()
+        self._remaining = 0  # bytes of the current response still to forward
+        self.filtered_frames = 0
+        self.recovered_responses = 0
+        self.discarded_bytes = 0
+
+    @property
+    def stats(self) -> dict:
+        """Return filter statistics for diagnostics."""
+        return {
+            "filtered_frames": self.filtered_frames,
+            "recovered_responses": self.recovered_responses,
+            "discarded_bytes": self.discarded_bytes,
+            "buffered_bytes": len(self._buffer),
+        }
+
+    def reset(self) -> None:
+        """Forget any partial frame (e.g. after reconnecting)."""
+        self._buffer.clear()
+        self._remaining = 0
+
+    def _is_fc20_start(self, view, pos: int) -> bool | None:
+        """Whether a broadcast starts at pos (None: not enough bytes to tell)."""
+        available = len(view) - pos
+        if available < 1 or view[pos] != self._unit:
+            return False
+        if available < 2:
+            return None
+        if view[pos + 1] != FC20:
+            return False
+        if self._rtu:
+            return True
+        # Modbus TCP: a response whose Transaction ID is (unit << 8 | 0x20) starts
+        # with the same two bytes but always has Protocol Identifier 0x0000.
+        if available < 4:
+            return None
+        return bool(view[pos + 2] or view[pos + 3])
+
+    def _fc20_length(self, view, pos: int) -> int | None:
+        """Return the length of the CRC-terminated broadcast at pos, if complete."""
+        end = min(len(view), pos + MAX_FC20_LENGTH)
+        crc = 0xFFFF
+        for i in range(pos, end - 2):
+            crc = (crc >> 8) ^ _CRC16_TABLE[(crc ^ view[i]) & 0xFF]
+            if (
+                i - pos + 3 >= MIN_RTU_LENGTH
+                and view[i + 1] == crc & 0xFF
+                and view[i + 2] == crc >> 8
+            ):
+                return i - pos + 3
+        return None
+
+    def _is_valid_frame(self, view, pos: int) -> bool:
+        """Whether a complete, well-formed response for our unit starts at pos."""
+        if self._rtu:
+            if view[pos] != self._unit:
+                return False
+            length = rtu_frame_length(view, pos)
+            if not length or pos + length > len(view):
+                return False
+            frame_crc = view[pos + length - 2] | view[pos + length - 1] << 8
+            return crc16(view[pos : pos + length - 2]) == frame_crc
+        length = mbap_frame_length(view, pos)
+        return bool(length) and len(view) - pos > 6 and view[pos + 6] == self._unit
+
+    def _resync(self, view, pos: int) -> int | None:
+        """Return the position of the next valid response after a broken broadcast."""
+        for candidate in range(pos + 2, len(view)):
+            if self._is_valid_frame(view, candidate):
+                return candidate
+        return None
+
+    def feed(self, data: bytes) -> bytes:
+        """Consume one received chunk and return the bytes to forward (may be empty)."""
+        if self._buffer:
+            self._buffer += data
+            view = memoryview(self._buffer)
+        else:
+            view = memoryview(data)
+        size = len(view)
+        segments: list[tuple[int, int]] = []  # (start, end) ranges to forward
+        start = pos = 0
+        held = size  # where the held-back tail starts (size: nothing held back)
+        frames = stripped = 0
+
+        while pos < size:
+            if self._remaining:
+                step = min(self._remaining, size - pos)
+                self._remaining -= step
+                pos += step
+                continue
+            fc20 = self._is_fc20_start(view, pos)
+            if fc20:
+                length = self._fc20_length(view, pos)
+                skip_to = pos + length if length is not None else None
+                if skip_to is None:
+                    skip_to = self._resync(view, pos)
+                    if skip_to is None:
+                        if size - pos < MAX_FC20_LENGTH:
+                            held = pos  # incomplete broadcast: wait for more bytes
+                        else:
+                            self.discarded_bytes += size - pos
+                            held = size
+                            segments.append((start, pos))
+                            start = pos = size
+                        break
+                    self.discarded_bytes += skip_to - pos
+                self.filtered_frames += 1
+                stripped += 1
+                if self._on_broadcast is not None:
+                    self._on_broadcast(bytes(view[pos:skip_to]))
+                segments.append((start, pos))
+                start = pos = skip_to
+                continue
+            length = self._frame_length(view, pos) if fc20 is False else None
+            if length is None:
+                held = pos  # incomplete header: decide once more bytes arrive
+                break
+            if length == 0:
+                pos = size  # unknown frame: forward the rest, resync on next chunk
+                break
+            frames += 1
+            self._remaining = length
+
+        segments.append((start, min(pos, held)))
+        if stripped:
+            self.recovered_responses += frames
+
+        if held < size:
+            tail = bytes(view[held:])
+        else:
+            tail = b""
+
+        if len(segments) == 1 and segments[0] == (0, size) and not self._buffer:
+            forward = data
+        else:
+            forward = b"".join(view[a:b] for a, b in segments if b > a)
+        view.release()
+        self._buffer.clear()
+        self._buffer += tail
+        return forward
@@ -109,11 +109,10 @@ class VistaPoolLight(VistaPoolEntity, LightEntity):
                 self.function_addr,
                 self.timer_block_addr,
             )
-            await client.async_write_register(
-                self.function_addr, self.function_code
-            )  # Set function (if needed)
-            await client.async_write_register(self.timer_block_addr, 3)  # Always ON
-            await client.async_write_register(EXEC_REGISTER, 1)  # Commit
+            async with client.transaction() as tx:
+                tx.write(self.function_addr, self.function_code)  # Set function
+                tx.write(self.timer_block_addr, 3)  # Always ON
+                tx.write(EXEC_REGISTER, 1)  # Commit
 
         # Optimistic update + schedule follow-up
         self._optimistic_update(True)
@@ -138,8 +137,9 @@ class VistaPoolLight(VistaPoolEntity, LightEntity):
                 self._key,
                 self.timer_block_addr,
             )
-            await client.async_write_register(self.timer_block_addr, 4)  # Always OFF
-            await client.async_write_register(EXEC_REGISTER, 1)  # Commit
+            async with client.transaction() as tx:
+                tx.write(self.timer_block_addr, 4)  # Always OFF
+                tx.write(EXEC_REGISTER, 1)  # Commit
 
         # Optimistic update + schedule follow-up
         self._optimistic_update(False)
@@ -17,38 +17,81 @@
 import asyncio
 import logging
 import time
-from collections import deque
+from collections import ChainMap, deque
 from datetime import datetime, timedelta
 
 from pymodbus.client import AsyncModbusTcpClient
-from pymodbus.exceptions import ConnectionException, ModbusException
+from pymodbus.exceptions import (
+    ConnectionException,
+    ModbusException,
+    ModbusIOException,
+)
 from pymodbus.framer import FramerType
 
-from .const import DEFAULT_MODBUS_FRAMER, TIMER_BLOCKS, is_valid_relay_gpio
+from .commit import CommitScheduler
+from .const import (
+    DEFAULT_MODBUS_FRAMER,
+    DEFAULT_MODBUS_TRANSPORT,
+    DEFAULT_VERIFY_INTERVAL,
+    EEPROM_SAVE_REGISTER,
+    EXEC_REGISTER,
+    TIMER_BLOCKS,
+    is_valid_relay_gpio,
+)
+from .framing import Fc20FrameSplitter
 from .helpers import (
     build_timer_block,
     get_filtration_speed,
-    modbus_regs_to_ascii,
     parse_timer_block,
 )
 from .modbus_compat import modbus_acall
+from .pacing import AdaptivePacer
+from .registers import (
+    FC_READ_INPUT,
+    MAX_READ_COUNT,
+    PAGE_DECODERS,
+    PAGE_READ_PLAN,
+    PAGE_REGISTERS,
+    PAGES,
+    TIMER_BLOCK_SIZE,
+    PageDecoder,
+    RegisterSnapshot,
+    decode_registers,
+    plan_address_reads,
+    plan_reads,
+    plan_timer_reads,
+)
+from .scheduler import (
+    PRIORITY_CONFIG,
+    PRIORITY_MEASURE,
+    PRIORITY_TIMERS,
+    PRIORITY_WRITE,
+    RequestScheduler,
+)
 from .status_mask import (
+    StatusDecoder,
     decode_hidro_status_bits,
     decode_ion_status_bits,
-    decode_named_relay_states,
+    decode_named_relay_items,
     decode_ph_rx_cl_cd_status_bits,
     decode_relay_state,
     decode_uv_lamp_state,
 )
+from .transport import NativeModbusClient
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
+
 AUX_BITMASKS = {
     1: 0x0008,  # AUX1
     2: 0x0010,  # AUX2
     3: 0x0020,  # AUX3
     4: 0x0040,  # AUX4
 }
+RELAY_STATE_REGISTER = 0x010E  # MBF_RELAY_STATE
+# AUX register sequence after the new relay state: 0x0289 = 0, then EXEC
+_AUX_COMMIT_REGISTER = 0x0289
 
 # MBF_NOTIFICATION (0x0110) page-change bitmask constants
 _NOTIF_MODBUS = 0x0001  # MBMSK_NOTIF_MODBUS_CHANGED
@@ -58,9 +101,144 @@ _NOTIF_INSTALLER = 0x0008  # MBMSK_NOTIF_INSTALLER_CHANGED
 _NOTIF_USER = 0x0010  # MBMSK_NOTIF_USER_CHANGED
 _NOTIF_MISC = 0x0020  # MBMSK_NOTIF_MISC_CHANGED
 
-# Safety: force a full register read every N polls so that devices which do not
+# Timer block registers the device changes by itself (countdown, reserved,
+# work time); a timer write built from the cache must not cover them
+_VOLATILE_TIMER_OFFSETS = frozenset({9, 10, 12, 13, 14})
+
+# Time close() waits for pending applied writes to be committed [s]
+_CLOSE_COMMIT_TIMEOUT = 5.0
+
+# Configuration pages in read order and the notification bit that flags each as changed
+_CONFIG_PAGE_NOTIFICATIONS = {
+    "MODBUS": _NOTIF_MODBUS,
+    "GLOBAL": _NOTIF_GLOBAL,
+    "FACTORY": _NOTIF_FACTORY,
+    "INSTALLER": _NOTIF_INSTALLER,
+    "USER": _NOTIF_USER,
+    "MISC": _NOTIF_MISC,
+}
+
+# Configuration registers a confirmed write is decoded into (see _write_through);
+# MEASURE holds input registers and is read on every poll anyway
+_CONFIG_SPECS = tuple(
+    spec for page in _CONFIG_PAGE_NOTIFICATIONS for spec in PAGE_REGISTERS[page]
+)
+
+# Safety: configuration pages and timer blocks served from cache are re-read one
+# per poll in rotation (see _next_verification), so that devices which do not
 # correctly implement the NOTIFICATION register still get periodic refreshes.
-_FULL_READ_INTERVAL = 60
+# Every item is verified once per verify_window seconds.
+_MIN_VERIFY_WINDOW = 60
+
+# Error classes used for recovery decisions and diagnostics (see classify_error)
+ERROR_TRANSPORT = "transport"  # TCP session lost or unusable: reconnect
+ERROR_PROTOCOL = "protocol"  # device answered with a Modbus exception response
+ERROR_TIMEOUT = "timeout"  # no (complete) answer: resync the framer, keep the session
+
+# Consecutive timeouts after which the session is assumed half-open and reopened
+_TIMEOUT_RECONNECT_THRESHOLD = 3
+
+# Attempts per register range within one read cycle (timeouts only, see
+# _read_register_ranges); must not exceed _TIMEOUT_RECONNECT_THRESHOLD
+_RANGE_ATTEMPTS = 2
+
+
+class ModbusProtocolError(ModbusException):
+    """The device rejected a request with a Modbus exception response.
+
+    The request and the answer travelled fine, so the TCP session stays usable.
+    """
+
+    def __init__(self, message: str, address: int, exception_code=None):
+        super().__init__(message)
+        self.address = address
+        self.exception_code = exception_code
+
+
+def classify_error(err: BaseException) -> str:
+    """Return the error class of err or of the exception that caused it.
+
+    Timeouts include pymodbus ModbusIOException ("No response received ...",
+    mismatched transaction or device id), which pymodbus raises instead of the
+    underlying TimeoutError. Anything not recognised is treated as a transport
+    failure, the safe choice that reopens the connection.
+    """
+    seen = set()
+    while err is not None and id(err) not in seen:
+        seen.add(id(err))
+        if isinstance(err, ModbusProtocolError):
+            return ERROR_PROTOCOL
+        if isinstance(err, (TimeoutError, ModbusIOException)):
+            return ERROR_TIMEOUT
+        if isinstance(err, (ConnectionException, ConnectionError)):
+            return ERROR_TRANSPORT
+        err = err.__cause__
+    return ERROR_TRANSPORT
+
+
+class WriteTransaction:
+    """Register writes collected by VistaPoolModbusClient.transaction().
+
+    The writes are sent when the async with block exits without an exception:
+    runs of adjacent addresses become one FC16 request each (in the order they
+    were first written), all written registers are confirmed with ranged
+    readbacks and the configuration is executed (0x02F5) once at the end, or
+    saved (0x02F0) and executed by the deferred commit when save is requested.
+    Writing 0x02F0 or 0x02F5 inside the transaction only requests that final
+    step. The outcome is stored in `result`.
+    """
+
+    def __init__(self, client: "VistaPoolModbusClient", apply: bool = False):
+        self._client = client
+        self._values: dict[int, int] = {}  # address -> value, in write order
+        self.save = apply
+        self.execute = apply
+        self.result: dict[int, int] | None = None
+
+    def write(self, address: int, value, apply: bool = False) -> None:
+        """Queue value (one register or a list) at address."""
+        if apply:
+            self.save = self.execute = True
+        if address == EEPROM_SAVE_REGISTER:
+            self.save = True
+            return
+        if address == EXEC_REGISTER:
+            self.execute = True
+            return
+        values = value if isinstance(value, list) else [value]
+        for offset, register in enumerate(values):
+            self._values[address + offset] = register
+
+    @property
+    def blocks(self) -> list[tuple[int, list[int]]]:
+        """The FC16 requests as (start address, values), in write order.
+
+        A block holds a run of adjacent addresses (at most MAX_READ_COUNT); the
+        blocks are ordered by the first write into each of them.
+        """
+        runs: list[list[int]] = []
+        for address in sorted(self._values):
+            run = runs[-1] if runs else None
+            if run and address == run[-1] + 1 and len(run) < MAX_READ_COUNT:
+                run.append(address)
+            else:
+                runs.append([address])
+        order = {address: index for index, address in enumerate(self._values)}
+        runs.sort(key=lambda run: min(order[address] for address in run))
+        return [(run[0], [self._values[address] for address in run]) for run in runs]
+
+    @property
+    def addresses(self) -> list[int]:
+        """Every register written, in ascending order."""
+        return sorted(self._values)
+
+    async def __aenter__(self) -> "WriteTransaction":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self.result = await self._client.async_write_transaction(self)
+        return False
 
 
 class VistaPoolModbusClient:
@@ -79,6 +257,15 @@ class VistaPoolModbusClient:
                 _framer_str,
             )
             self._framer = FramerType.SOCKET
+        self._transport = (
+            config.get("modbus_transport", DEFAULT_MODBUS_TRANSPORT).strip().lower()
+        )
+        if self._transport not in ("pymodbus", "native"):
+            _LOGGER.warning(
+                "Unknown modbus_transport value '%s', falling back to 'pymodbus'",
+                self._transport,
+            )
+            self._transport = "pymodbus"
         self._client = None  # ← Persistent client instance
         self._client_lock = asyncio.Lock()
 
@@ -105,11 +292,56 @@ class VistaPoolModbusClient:
         self._total_writes = 0
         self._successful_write_ops = 0
 
+        # Adaptive gap between consecutive requests (replaces fixed sleeps)
+        self._pacer = AdaptivePacer()
+        # One request at a time, user writes first (see scheduler.py)
+        self._scheduler = RequestScheduler()
+        # Applied writes share one deferred EEPROM save + EXEC (see commit.py)
+        self._commit_scheduler = CommitScheduler(self._perform_commit)
+        # FC20 broadcast filter of the current connection (see _install_fc20_filter)
+        self._fc20_splitter: Fc20FrameSplitter | None = None
+
+        # Error classification (see classify_error and _handle_request_error)
+        self._error_counts = {ERROR_TRANSPORT: 0, ERROR_PROTOCOL: 0, ERROR_TIMEOUT: 0}
+        self._consecutive_timeouts = 0
+        self._rejected_ranges = {}  # address -> last Modbus exception code
+
+        # Memoized status-bit decoding; changed_status_keys lists the flags that
+        # changed in the last poll
+        self._status_decoder = StatusDecoder()
+        self.changed_status_keys: frozenset[str] = frozenset()
+
+        # Raw page responses and their decoded values (see registers.RegisterSnapshot)
+        self._snapshot = RegisterSnapshot()
+
+        # Raw MBF_RELAY_STATE of the last MEASURE read as (value, monotonic
+        # time, seconds it stays trusted) and the AUX relay changes waiting to
+        # be written in one sequence (see _note_relay_state and
+        # async_write_aux_relays)
+        self._relay_state: tuple[int, float, float] | None = None
+        self._aux_lock = asyncio.Lock()
+        self._aux_pending: dict[int, bool] = {}
+        self._aux_batch: asyncio.Future | None = None
+        self._aux_stats = {
+            "toggles": 0,
+            "sequences": 0,
+            "requests": 0,
+            "cached_state_used": 0,
+        }
+        self._aux_times = deque(maxlen=20)
+
+        # Per-cycle state: pages decoded in the running async_read_all call, so a
+        # retried cycle does not read them again (None outside async_read_all)
+        self._cycle_pages: dict[str, dict] | None = None
+        self._partial_reads = 0
+        self._last_failed_pages: list[str] = []
+
         # Notification-based polling optimization
         self._cached_result: dict = {}  # Last known values for all registers
-        self._polls_since_full_read: int = (
-            _FULL_READ_INTERVAL  # Force full read on first poll
-        )
+        # Keys of _cached_result changed since take_changed_keys(); None after
+        # the image was replaced as a whole
+        self._changed_keys: set[str] | None = None
+        self._full_read_due: bool = True  # Force full read on first poll
         self._last_notification: int = (
             0  # Notification bits from last _perform_read_all
         )
@@ -117,6 +349,214 @@ class VistaPoolModbusClient:
             True  # Whether last _perform_read_all was a full read
         )
         self._cached_timers: dict = {}  # Last known timer values
+        # Bumped on every INSTALLER change notification (and full read); a cached
+        # timer block is fresh while its epoch (when it was read) is the current one
+        self._installer_epoch = 0
+        self._timer_epochs: dict[str, int] = {}
+        self._timer_write_stats = {"from_cache": 0, "read_first": 0, "skipped": 0}
+        # Bumped whenever configuration pages or timers are read from the device,
+        # so the persisted register image is only saved when it changed
+        self._cache_generation = 0
+        # Device identity of a restored register image, checked on the next poll
+        self._restored_identity: list | None = None
+
+        # Round-robin background verification of cached pages and timers
+        self._verify_window: float = DEFAULT_VERIFY_INTERVAL * 60
+        self._verify_position = 0
+        self._last_verification = time.monotonic()
+        self._verify_timers: frozenset[str] = frozenset()  # last read_all_timers set
+        self._pending_timer_verification: str | None = None
+        self._last_verified: str | None = None
+        self._changed_verifications = 0
+
+        # Entity-demand-driven polling: register keys backing enabled entities.
+        # None means "no demand known yet" and every mapped register is read.
+        self._required_keys: frozenset[str] | None = None
+        self._page_plans: dict = {
+            page: (PAGE_REGISTERS[page], PAGE_READ_PLAN[page], PAGE_DECODERS[page])
+            for page in PAGES
+        }
+
+    @property
+    def required_keys(self) -> frozenset[str] | None:
+        """Register keys that must be read, or None to read all mapped registers."""
+        return self._required_keys
+
+    @required_keys.setter
+    def required_keys(self, keys) -> None:
+        self._required_keys = frozenset(keys) if keys is not None else None
+        for page in PAGES:
+            specs = PAGE_REGISTERS[page]
+            # MEASURE is always read in full: it carries MBF_NOTIFICATION and
+            # the live status words every derived binary sensor depends on.
+            if self._required_keys is not None and page != "MEASURE":
+                specs = tuple(s for s in specs if s.key in self._required_keys)
+            ranges = plan_reads(specs)
+            self._page_plans[page] = (specs, ranges, PageDecoder(specs, ranges))
+        _LOGGER.debug(
+            "Read plan updated: %s",
+            {page: len(plan[1]) for page, plan in self._page_plans.items()},
+        )
+
+    @property
+    def verify_window(self) -> float:
+        """Seconds in which every cached page and timer block is re-read once."""
+        return self._verify_window
+
+    @verify_window.setter
+    def verify_window(self, seconds: float) -> None:
+        self._verify_window = max(float(seconds), _MIN_VERIFY_WINDOW)
+
+    def _next_verification(self) -> str | None:
+        """Return the configuration page or timer block to re-read this poll, if any.
+
+        Items are the pages with a non-empty read plan and the timer blocks of the
+        last read_all_timers call. They are verified in rotation, one every
+        verify_window / len(items) seconds, so the refresh of cached values is
+        spread evenly instead of re-reading everything in one long poll.
+        """
+        items = [
+            page for page in _CONFIG_PAGE_NOTIFICATIONS if self._page_plans[page][1]
+        ]
+        items += [name for name in TIMER_BLOCKS if name in self._verify_timers]
+        if not items:
+            return None
+        now = time.monotonic()
+        if now - self._last_verification < self._verify_window / len(items):
+            return None
+        self._last_verification = now
+        item = items[self._verify_position % len(items)]
+        self._verify_position = (self._verify_position + 1) % len(items)
+        self._last_verified = item
+        return item
+
+    def _check_verified(self, item: str, fresh: dict, cached: dict | None) -> None:
+        """Count a verification read that returned values differing from the cache.
+
+        Some registers (device time, counters, timer countdowns) change without a
+        notification, so a difference is logged for diagnostics only.
+        """
+        if not cached:
+            return
+        changed = sorted(k for k, v in fresh.items() if k in cached and cached[k] != v)
+        if changed:
+            self._changed_verifications += 1
+            _LOGGER.debug(
+                "Background verification of %s refreshed %s", item, ", ".join(changed)
+            )
+
+    @property
+    def cache_generation(self) -> int:
+        """Counter that changes whenever the cached register image is refreshed."""
+        return self._cache_generation
+
+    @property
+    def register_snapshot(self) -> RegisterSnapshot:
+        """Raw registers of the pages read since start (see RegisterSnapshot)."""
+        return self._snapshot
+
+    @staticmethod
+    def _device_identity(values: dict) -> list:
+        """Return [firmware version, node id] identifying the device a cache belongs to."""
+        return [
+            values.get("MBF_POWER_MODULE_VERSION"),
+            list(values.get("MBF_POWER_MODULE_NODEID") or []),
+        ]
+
+    def export_cache(self) -> dict | None:
+        """Return the cached register image for persistence (JSON serializable).
+
+        Returns None until the device identity (firmware version and node id)
+        has been read.
+        """
+        identity = self._device_identity(self._cached_result)
+        if identity[0] is None:
+            return None
+        return {
+            "identity": identity,
+            "result": dict(self._cached_result),
+            "timers": dict(self._cached_timers),
+        }
+
+    def take_changed_keys(self) -> frozenset[str] | None:
+        """Return the keys of the cached register image changed since the last call.
+
+        None means the image was replaced meanwhile (restored, discarded or reset
+        on close) and has to be taken over as a whole.
+        """
+        changed, self._changed_keys = self._changed_keys, set()
+        return None if changed is None else frozenset(changed)
+
+    def _store(self, values) -> None:
+        """Merge values into the cached register image, recording changed keys."""
+        cache = self._cached_result
+        changed = self._changed_keys
+        for key, value in values.items():
+            if cache.get(key, _MISSING) != value:
+                cache[key] = value
+                if changed is not None:
+                    changed.add(key)
+
+    def restore_cache(self, data: dict) -> bool:
+        """Seed the cache from an image saved by export_cache.
+
+        The next poll then reads MEASURE, the MODBUS page (to check that the image
+        belongs to the same device and firmware) and the pages flagged in
+        MBF_NOTIFICATION, instead of all pages. Returns False for unusable data.
+        """
+        try:
+            identity = [data["identity"][0], list(data["identity"][1])]
+            result = dict(data["result"])
+            timers = dict(data["timers"])
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            _LOGGER.debug("Ignoring invalid register cache: %s", e)
+            return False
+        if identity[0] is None:
+            return False
+        self._cached_result = result
+        self._changed_keys = None
+        self._cached_timers = timers
+        self._full_read_due = False
+        self._last_notification = 0
+        self._last_was_full_read = False
+        self._restored_identity = identity
+        return True
+
+    def _write_through(self, address: int, registers: list[int]) -> None:
+        """Merge registers confirmed by a write into the cached register image.
+
+        Configuration registers are decoded with the register map and timer
+        blocks are patched and parsed again, so the next poll serves the written
+        values from cache without re-reading the page.
+        """
+        end = address + len(registers)
+        image = dict(zip(range(address, end), registers))
+        specs = [
+            spec
+            for spec in _CONFIG_SPECS
+            if address <= spec.address and spec.address + spec.width <= end
+        ]
+        if specs:
+            self._store(decode_registers(specs, image))
+        updated = bool(specs)
+        for name, base in TIMER_BLOCKS.items():
+            if not (address < base + TIMER_BLOCK_SIZE and base < end):
+                continue
+            cached = self._cached_timers.get(name)
+            if cached is None and not (
+                address <= base and base + TIMER_BLOCK_SIZE <= end
+            ):
+                continue  # partial write to a block that was never read
+            block = build_timer_block(cached or {})
+            for reg in range(max(address, base), min(end, base + TIMER_BLOCK_SIZE)):
+                block[reg - base] = image[reg]
+            self._cached_timers[name] = parse_timer_block(block)
+            if address <= base and base + TIMER_BLOCK_SIZE <= end:
+                self._timer_epochs[name] = self._installer_epoch
+            updated = True
+        if updated:
+            self._cache_generation += 1
+            _LOGGER.debug("Cached register image updated from write at 0x%04X", address)
 
     async def get_client(self) -> AsyncModbusTcpClient:
         """Get or create a Modbus client with retry logic."""
@@ -150,12 +590,22 @@ class VistaPoolModbusClient:
                 await self._safe_close_client()
 
                 # Create new client with optimal settings
-                self._client = AsyncModbusTcpClient(
-                    self._host,
-                    port=self._port,
-                    timeout=5,
-                    framer=self._framer,
-                )
+                if self._transport == "native":
+                    self._client = NativeModbusClient(
+                        self._host,
+                        port=self._port,
+                        unit_id=self._unit,
+                        rtu=self._framer == FramerType.RTU,
+                        timeout=5,
+                        on_broadcast=self._on_fc20_broadcast,
+                    )
+                else:
+                    self._client = AsyncModbusTcpClient(
+                        self._host,
+                        port=self._port,
+                        timeout=5,
+                        framer=self._framer,
+                    )
 
                 # Attempt connection with timeout
                 _LOGGER.debug(
@@ -176,8 +626,13 @@ class VistaPoolModbusClient:
                 self._consecutive_errors = 0
                 self._last_successful_operation = datetime.now()
                 self._backoff_until = None
+                self._pacer.reset_connection()
 
-                self._install_fc20_filter(self._client)
+                if self._transport == "native":
+                    # The native transport strips FC20 broadcasts itself
+                    self._fc20_splitter = self._client.fc20_splitter
+                else:
+                    self._install_fc20_filter(self._client)
 
                 _LOGGER.info(
                     "Modbus connection established successfully to %s:%s",
@@ -218,7 +673,7 @@ class VistaPoolModbusClient:
         )
 
     def _install_fc20_filter(self, client: AsyncModbusTcpClient) -> None:
-        """Install a filter on the pymodbus transport to discard Sugar Valley FC20
+        """Install a filter on the pymodbus transport to strip Sugar Valley FC20
         broadcast frames before pymodbus processes them.
 
         Sugar Valley devices spontaneously broadcast proprietary FC20 (0x20) frames
@@ -226,7 +681,8 @@ class VistaPoolModbusClient:
         forward these raw bytes over TCP without an MBAP header. pymodbus can mistake
         them for responses to pending FC03/FC04 requests, causing read failures.
 
-        The filter works for both framing modes:
+        The received byte stream is passed through a framing.Fc20FrameSplitter which
+        tracks response frame boundaries for both framing modes:
 
         - **RTU framing**: The frame layout is (slave_id, function_code, ...). An FC20
           broadcast is identified by data[0] == unit_id and data[1] == 0x20.
@@ -238,6 +694,10 @@ class VistaPoolModbusClient:
           safely distinguish them from a legitimate response whose TID happens to equal
           (unit_id << 8 | 0x20).
 
+        Only the broadcast bytes are removed (the broadcast ends where its CRC
+        matches), so a response sharing a TCP chunk with a broadcast is still
+        delivered instead of waiting out the pymodbus timeout.
+
         This method monkey-patches ``client.ctx.data_received`` at the instance level.
         The patch is intentionally non-fatal: any exception during installation is caught
         and logged at DEBUG level so future pymodbus changes cannot break the connect flow.
@@ -250,66 +710,17 @@ class VistaPoolModbusClient:
 
             original_data_received = ctx.data_received
             unit_id = self._unit
-            is_rtu = self._framer == FramerType.RTU
-
-            # Small prefix buffer used only in SOCKET framing.  When a TCP read
-            # delivers only 2–3 bytes that start with [unit_id, 0x20] we cannot
-            # yet inspect the MBAP Protocol Identifier at bytes 2-3.  We stash
-            # those bytes here and prepend them to the very next chunk so the
-            # decision (drop FC20 vs forward valid MBAP) is always made with at
-            # least 4 bytes of context.
-            _socket_buf: bytes = b""
+            splitter = Fc20FrameSplitter(
+                unit_id, self._framer == FramerType.RTU, self._on_fc20_broadcast
+            )
 
             def filtered_data_received(data: bytes) -> None:
-                nonlocal _socket_buf
-                # FC20 broadcasts from Sugar Valley: slave_id byte followed by 0x20.
-                # For RTU framing: data[0]=slave_id, data[1]=function_code.
-                # For SOCKET framing: data[0:2]=TID, data[2:4]=Protocol ID (0x0000
-                # for valid Modbus TCP). Raw FC20 broadcasts have no MBAP header, so
-                # bytes 2-3 are NOT 0x0000 — this is the distinguishing signal.
-                if not is_rtu:
-                    # Reassemble any previously buffered prefix.
-                    if _socket_buf:
-                        data = _socket_buf + data
-                        _socket_buf = b""
-                    # If we have [unit_id, 0x20] but not yet the Protocol ID bytes,
-                    # buffer and wait for the next chunk rather than forwarding what
-                    # could be the start of a raw FC20 broadcast.
-                    if (
-                        len(data) >= 2
-                        and data[0] == unit_id
-                        and data[1] == 0x20
-                        and len(data) < 4
-                    ):
-                        _socket_buf = data
-                        return
-                if is_rtu:
-                    is_fc20 = len(data) >= 2 and data[0] == unit_id and data[1] == 0x20
-                else:
-                    is_fc20 = (
-                        len(data) >= 4
-                        and data[0] == unit_id
-                        and data[1] == 0x20
-                        and data[2:4] != b"\x00\x00"
-                    )
-                if is_fc20:
-                    if _LOGGER.isEnabledFor(logging.DEBUG):
-                        _LOGGER.debug(
-                            "FC20 broadcast frame filtered (%d bytes): %s",
-                            len(data),
-                            data.hex(),
-                        )
-                    # Drop the entire chunk.  FC20 is a proprietary Sugar Valley
-                    # broadcast whose internal length field cannot be reliably parsed
-                    # (the observed 27-byte frame has data[6]=0x39=57, giving a
-                    # bogus fc20_len=66).  Attempting to forward trailing bytes based
-                    # on a miscomputed offset would corrupt pymodbus state.  Dropping
-                    # the full chunk is safe: pymodbus will time-out and retry, and
-                    # the next poll cycle will succeed without interference.
-                    return
-                original_data_received(data)
+                forward = splitter.feed(data)
+                if forward:
+                    original_data_received(forward)
 
             ctx.data_received = filtered_data_received
+            self._fc20_splitter = splitter
             _LOGGER.debug(
                 "FC20 broadcast filter installed for unit_id=%d (framer=%s)",
                 unit_id,
@@ -319,6 +730,14 @@ class VistaPoolModbusClient:
         except Exception as exc:
             _LOGGER.debug("Could not install FC20 filter: %s", exc)
 
+    def _on_fc20_broadcast(self, frame: bytes) -> None:
+        """Called for every FC20 broadcast stripped from the response stream."""
+        self._pacer.record_collision()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "FC20 broadcast frame filtered (%d bytes): %s", len(frame), frame.hex()
+            )
+
     async def _is_connection_healthy(self) -> bool:
         """Quick health check for existing connection."""
         if not self._client or not self._client.connected:
@@ -334,9 +753,8 @@ class VistaPoolModbusClient:
         # Perform a lightweight health check
         try:
             result = await asyncio.wait_for(
-                modbus_acall(
+                self._request(
                     self._client.read_holding_registers,
-                    self._unit,
                     address=0x0000,
                     count=1,
                 ),
@@ -370,6 +788,18 @@ class VistaPoolModbusClient:
 
     async def close(self) -> None:
         """Close the client and clean up resources."""
+        # Applied writes must reach the EEPROM before the connection goes away,
+        # but an unreachable device must not hold up unloading
+        if self._commit_scheduler.dirty:
+            try:
+                committed = await asyncio.wait_for(
+                    self.async_commit(), timeout=_CLOSE_COMMIT_TIMEOUT
+                )
+            except TimeoutError:
+                committed = False
+            if not committed:
+                _LOGGER.warning("Pending configuration could not be saved to EEPROM")
+        self._commit_scheduler.cancel()
         async with self._client_lock:
             await self._safe_close_client()
             # Reset all counters
@@ -378,10 +808,14 @@ class VistaPoolModbusClient:
             self._backoff_until = None
             # Reset notification polling state so the next connect starts with a full read
             self._cached_result = {}
-            self._polls_since_full_read = _FULL_READ_INTERVAL
+            self._changed_keys = None
+            self._full_read_due = True
             self._last_notification = 0
             self._last_was_full_read = True
             self._cached_timers = {}
+            self._timer_epochs = {}
+            self._restored_identity = None
+            self._relay_state = None
 
     async def async_read_all(self) -> dict:
         """Read all data with retry logic."""
@@ -389,75 +823,177 @@ class VistaPoolModbusClient:
         max_retries = 2
         last_error = None
 
-        for attempt in range(max_retries):
-            try:
-                result = await self._perform_read_all()
-                # Success
-                self._successful_operations += 1
-                self._last_successful_operation = datetime.now()
-                self._consecutive_errors = 0
-                return result
-
-            except Exception as e:
-                last_error = e
-                self._consecutive_errors += 1
-
-                _LOGGER.warning(
-                    "Read attempt %d/%d failed: %s", attempt + 1, max_retries, e
-                )
+        # Pages read by a failed attempt are kept and not requested again
+        self._cycle_pages = {}
+        try:
+            for attempt in range(max_retries):
+                try:
+                    result = await self._perform_read_all()
+                    # Success
+                    self._successful_operations += 1
+                    self._last_successful_operation = datetime.now()
+                    self._consecutive_errors = 0
+                    return result
+
+                except Exception as e:
+                    last_error = e
+                    self._consecutive_errors += 1
+
+                    _LOGGER.warning(
+                        "Read attempt %d/%d failed: %s", attempt + 1, max_retries, e
+                    )
 
-                # Force reconnection on error
-                async with self._client_lock:
-                    await self._safe_close_client()
-                    self._client = None
+                    await self._handle_request_error(e)
 
-                # Wait before retry (except on last attempt)
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(0.5 * (attempt + 1))
-                    continue
+                    # Wait before retry (except on last attempt)
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(0.5 * (attempt + 1))
+                        continue
+        finally:
+            self._cycle_pages = None
 
         # All retries failed
+        self._relay_state = None
         _LOGGER.error("All read attempts failed: %s", last_error)
         raise last_error
 
+    async def _request(self, func, priority: int = PRIORITY_WRITE, **kwargs):
+        """Send one Modbus request, paced by the adaptive inter-request gap.
+
+        The request waits for the request slot at the given priority (user
+        actions by default; the poll passes its own), so a write issued during
+        a poll cycle goes out right after the request in flight. The pacer
+        learns the gateway turnaround from every answered request (Modbus
+        exception responses included) and backs off when a request times out or
+        the connection fails.
+        """
+        async with self._scheduler.slot(priority):
+            await self._pacer.wait()
+            try:
+                if self._transport == "native":
+                    # Native methods take device_id directly, no signature inspection
+                    response = await func(device_id=self._unit, **kwargs)
+                else:
+                    response = await modbus_acall(func, self._unit, **kwargs)
+            except Exception:
+                self._pacer.record_error()
+                raise
+            self._pacer.record_success()
+        self._consecutive_timeouts = 0
+        return response
+
+    async def _handle_request_error(self, err: BaseException) -> str:
+        """Count a failed operation by class and recover the session accordingly.
+
+        Only transport failures close the connection. A timeout drops any partly
+        received frame so the next response is parsed from a frame boundary, and
+        a Modbus exception response needs no recovery at all. Repeated timeouts
+        are escalated to a transport failure: the gateway is likely gone while
+        the socket still looks open.
+        """
+        kind = classify_error(err)
+        if kind == ERROR_PROTOCOL:
+            # Counted where the exception response was received
+            return kind
+        if kind == ERROR_TIMEOUT:
+            self._error_counts[ERROR_TIMEOUT] += 1
+            self._consecutive_timeouts += 1
+            if self._consecutive_timeouts < _TIMEOUT_RECONNECT_THRESHOLD:
+                self._resync_framer()
+                return kind
+            _LOGGER.debug(
+                "%d consecutive timeouts, reopening the connection",
+                self._consecutive_timeouts,
+            )
+        else:
+            self._error_counts[ERROR_TRANSPORT] += 1
+        self._consecutive_timeouts = 0
+        async with self._client_lock:
+            await self._safe_close_client()
+            self._client = None
+        return kind
+
+    def _record_protocol_error(self, address: int, response) -> None:
+        """Count a Modbus exception response and mark the rejected range."""
+        self._error_counts[ERROR_PROTOCOL] += 1
+        self._rejected_ranges[f"0x{address:04X}"] = getattr(
+            response, "exception_code", None
+        )
+
+    def _resync_framer(self) -> None:
+        """Drop partly received bytes after a timeout, keeping the connection."""
+        client = self._client
+        if client is None:
+            return
+        if self._transport == "native":
+            client.resync()
+            return
+        ctx = getattr(client, "ctx", None)
+        if ctx is not None and hasattr(ctx, "recv_buffer"):
+            ctx.recv_buffer = b""
+        if self._fc20_splitter is not None:
+            self._fc20_splitter.reset()
+
     async def _read_register_ranges(
         self,
         client,
         ranges: list[tuple[int, int]],
         read_func=None,
         label: str = "",
+        priority: int = PRIORITY_CONFIG,
     ) -> list[int]:
         """Read one or more register ranges and return a flat list of values.
 
         WARNING: Device limit for reading registers is 31 at one request!
 
+        A range that times out is requested again (up to _RANGE_ATTEMPTS times)
+        after resynchronising the framer; ranges already read are kept. Exception
+        responses and transport failures are raised right away.
+
         Args:
             client: Connected Modbus client.
             ranges: List of (start_address, count) tuples.
             read_func: The pymodbus read function to use.
                        Defaults to client.read_holding_registers.
             label: Optional label for debug/warning log messages (e.g. "rr01").
+            priority: Request priority (see scheduler.py).
         """
         if read_func is None:
             read_func = client.read_holding_registers
 
         registers: list[int] = []
         for address, count in ranges:
-            await asyncio.sleep(0.05)
-            try:
-                rr = await modbus_acall(
-                    read_func, self._unit, address=address, count=count
-                )
-            except Exception as e:
-                self._failed_reads[f"0x{address:04X}"] = (
-                    self._failed_reads.get(f"0x{address:04X}", 0) + 1
-                )
-                raise ModbusException(f"Read error at 0x{address:04X}: {e}") from e
+            for attempt in range(1, _RANGE_ATTEMPTS + 1):
+                try:
+                    rr = await self._request(
+                        read_func, priority, address=address, count=count
+                    )
+                    break
+                except Exception as e:
+                    self._failed_reads[f"0x{address:04X}"] = (
+                        self._failed_reads.get(f"0x{address:04X}", 0) + 1
+                    )
+                    if attempt < _RANGE_ATTEMPTS and classify_error(e) == ERROR_TIMEOUT:
+                        await self._handle_request_error(e)
+                        if self._client is not None:
+                            _LOGGER.debug(
+                                "Retrying 0x%04X after timeout (attempt %d/%d)",
+                                address,
+                                attempt + 1,
+                                _RANGE_ATTEMPTS,
+                            )
+                            continue
+                    raise ModbusException(f"Read error at 0x{address:04X}: {e}") from e
             if rr.isError():
                 self._failed_reads[f"0x{address:04X}"] = (
                     self._failed_reads.get(f"0x{address:04X}", 0) + 1
                 )
-                raise ModbusException(f"Modbus read error from 0x{address:04X}: {rr}")
+                self._record_protocol_error(address, rr)
+                raise ModbusProtocolError(
+                    f"Modbus read error from 0x{address:04X}: {rr}",
+                    address,
+                    getattr(rr, "exception_code", None),
+                )
             self._successful_addresses.append((f"0x{address:04X}", time.time()))
             registers.extend(rr.registers)
             _log_prefix = f"Raw {label} from" if label else "Raw registers from"
@@ -472,22 +1008,58 @@ class VistaPoolModbusClient:
                 )
         return registers
 
+    async def _read_page(self, client, page: str) -> dict:
+        """Read one register page using its compiled read plan and decode it."""
+        if self._cycle_pages is not None and page in self._cycle_pages:
+            _LOGGER.debug("Reusing %s page read earlier in this cycle", page)
+            return self._cycle_pages[page]
+        _, ranges, decoder = self._page_plans[page]
+        read_func = (
+            client.read_input_registers
+            if PAGES[page].function_code == FC_READ_INPUT
+            else client.read_holding_registers
+        )
+        registers = await self._read_register_ranges(
+            client,
+            ranges,
+            read_func=read_func,
+            label=PAGES[page].label,
+            priority=PRIORITY_MEASURE if page == "MEASURE" else PRIORITY_CONFIG,
+        )
+        # An unchanged response keeps the values decoded from it before
+        values = self._snapshot.set_page(page, decoder, registers)
+        if page != "MEASURE":
+            self._cache_generation += 1
+        elif (relay_state := values.get("MBF_RELAY_STATE")) is not None:
+            self._note_relay_state(relay_state, values.get("MBF_NOTIFICATION"))
+        if self._cycle_pages is not None:
+            self._cycle_pages[page] = values
+        return values
+
+    def _note_relay_state(self, relay_state: int, notification) -> None:
+        """Remember MBF_RELAY_STATE of a MEASURE read for AUX relay writes.
+
+        Like cached configuration pages, the state is trusted while the device
+        reports no change: when MBF_NOTIFICATION was clear and the relays did
+        not switch since the previous MEASURE read, it is reused until the next
+        poll is due (the interval between the two reads). Otherwise, and after
+        an AUX write or a failed poll, AUX writes read it again.
+        """
+        now = time.monotonic()
+        previous = self._relay_state
+        trusted_for = 0.0
+        if previous is not None and previous[0] == relay_state and not notification:
+            trusted_for = now - previous[1]
+        self._relay_state = (relay_state, now, trusted_for)
+
     async def _perform_read_all(self) -> dict:
         result = {}
 
-        def get_safe(regs, idx, transform=None) -> int | None:
-            """Safely get a register value or return None if missing. Optionally apply a transform."""
-            try:
-                val = regs[idx]
-            except IndexError:  # pragma: no cover
-                _LOGGER.warning("Register at index %d is missing in %s", idx, regs)
-                return None
-            if val is None:
-                return None  # pragma: no cover
-            return transform(val) if callable(transform) else val
-
         force_full = True
         notification = 0
+        verify = None
+        failed_pages: list[str] = []
+        pages_read: set[str] = set()
 
         start = time.monotonic()
         try:
@@ -507,77 +1079,75 @@ class VistaPoolModbusClient:
             Always read first – provides live measurements and the MBF_NOTIFICATION register
             (0x0110) which determines which configuration pages need to be refreshed.
             """
-
-            reg01 = await self._read_register_ranges(
-                client,
-                [(0x0100, 18)],  # 0x0100–0x0111
-                read_func=client.read_input_registers,
-                label="rr01",
-            )
-
-            # Example: [0, 0, 820, 709, 0, 0, 140, 50560, 49536, 1280, 1280, 0, 8192, 16928, 0, 0, 9, 0]
-            # fmt: off
-            result.update({
-                "MBF_ION_CURRENT": get_safe(reg01, 0),                              # 0x0100        Ionization level measured
-                "MBF_HIDRO_CURRENT": get_safe(reg01, 1, lambda v: v / 10.0),        # 0x0101        Hydrolysis intensity level
-                "MBF_MEASURE_PH": get_safe(reg01, 2, lambda v: v / 100.0),          # 0x0102 ph     pH level measured in 1/100 (700 = 7.00)
-                "MBF_MEASURE_RX": get_safe(reg01, 3),                               # 0x0103 mV     Redox level measured in mV
-                "MBF_MEASURE_CL": get_safe(reg01, 4, lambda v: v / 100.0),          # 0x0104 ppm    Chlorine level measured in 1/100 ppm (100 = 1.00 ppm)
-                "MBF_MEASURE_CONDUCTIVITY": get_safe(reg01, 5),                     # 0x0105 %      Conductivity level measured in %
-                "MBF_MEASURE_TEMPERATURE": get_safe(reg01, 6, lambda v: v / 10.0),  # 0x0106 °C     Temperature sensor measured in 1/10° C (100 = 10.0°C)
-                "MBF_PH_STATUS": get_safe(reg01, 7),                                # 0x0107 mask   Status of the pH-module
-                "MBF_RX_STATUS": get_safe(reg01, 8),                                # 0x0108 mask   Status of the Rx-module
-                "MBF_CL_STATUS": get_safe(reg01, 9),                                # 0x0109 mask   Status of the Chlorine-module
-                "MBF_CD_STATUS": get_safe(reg01, 10),                               # 0x010A mask   Status of the Conductivity-module
-                "MBF_ION_STATUS": get_safe(reg01, 12),                              # 0x010C mask   Status of the Ionization-module
-                "MBF_HIDRO_STATUS": get_safe(reg01, 13),                            # 0x010D mask   Status of the Hydrolysis-module
-                "MBF_RELAY_STATE": get_safe(reg01, 14),                             # 0x010E mask   Status of each configurable relay
-                "MBF_HIDRO_SWITCH_VALUE": get_safe(reg01, 15),                      # 0x010F        INTERNAL - contains the opening of the hydrolysis PWM.
-                "MBF_NOTIFICATION": get_safe(reg01, 16),                            # 0x0110 mask   Bit field that informs whether a property page has changed since the last time it was queried. (see MBMSK_NOTIF_*). This register makes it possible to refresh the content of the registers maintained by a modbus master in an optimized way, without the need to reread all registers periodically, but only those on a page that has been changed.
-                "MBF_HIDRO_VOLTAGE": get_safe(reg01, 17, lambda v: v / 10.0),       # 0x0111        The voltage applied to the hydrolysis cell (in 1/10 V). This register, together with that of MBF_HIDRO_CURRENT allows extrapolation of water salinity.
-            })
-            # fmt: on
+            result.update(await self._read_page(client, "MEASURE"))
 
             # Extract pH status enum from lower bits of MBF_PH_STATUS
-            _ph_status = get_safe(reg01, 7)
+            _ph_status = result.get("MBF_PH_STATUS")
             result["MBF_PH_STATUS_ALARM"] = (
                 (_ph_status & 0x000F) if _ph_status is not None else None
             )
 
-            # After loading reg01, update result with all decodings:
+            # After loading MEASURE page, update result with all decodings.
+            # Unchanged status words reuse their previous decoding.
+            decode = self._status_decoder.decode
             # fmt: off
-            result.update(
-                {
-                    **decode_ph_rx_cl_cd_status_bits(_ph_status, "pH"),
-                    **decode_ph_rx_cl_cd_status_bits(get_safe(reg01, 8), "Redox"),
-                    **decode_ph_rx_cl_cd_status_bits(get_safe(reg01, 9), "Chlorine"),
-                    **decode_ph_rx_cl_cd_status_bits(get_safe(reg01, 10), "Conductivity"),
-                    **decode_ion_status_bits(get_safe(reg01, 12)),
-                    **decode_hidro_status_bits(get_safe(reg01, 13)),
-                    **decode_relay_state(get_safe(reg01, 14)),
-                }
-            )
+            for decoded in (
+                decode("MBF_PH_STATUS", decode_ph_rx_cl_cd_status_bits, _ph_status, "pH"),
+                decode("MBF_RX_STATUS", decode_ph_rx_cl_cd_status_bits, result.get("MBF_RX_STATUS"), "Redox"),
+                decode("MBF_CL_STATUS", decode_ph_rx_cl_cd_status_bits, result.get("MBF_CL_STATUS"), "Chlorine"),
+                decode("MBF_CD_STATUS", decode_ph_rx_cl_cd_status_bits, result.get("MBF_CD_STATUS"), "Conductivity"),
+                decode("MBF_ION_STATUS", decode_ion_status_bits, result.get("MBF_ION_STATUS")),
+                decode("MBF_HIDRO_STATUS", decode_hidro_status_bits, result.get("MBF_HIDRO_STATUS")),
+                decode("MBF_RELAY_STATE", decode_relay_state, result.get("MBF_RELAY_STATE")),
+            ):
+                result.update(decoded)
             # fmt: on
 
+            # A register image restored from disk is only trusted if it belongs to
+            # the same device and firmware (MODBUS page), otherwise it is dropped
+            # and this poll becomes a full read.
+            if self._restored_identity is not None:
+                identity_page = await self._read_page(client, "MODBUS")
+                result.update(identity_page)
+                pages_read.add("MODBUS")
+                if self._device_identity(identity_page) != self._restored_identity:
+                    _LOGGER.info(
+                        "Device identity changed since the register cache was saved "
+                        "(%s -> %s), discarding it",
+                        self._restored_identity,
+                        self._device_identity(identity_page),
+                    )
+                    self._cached_result = {}
+                    self._changed_keys = None
+                    self._cached_timers = {}
+                    self._full_read_due = True
+                self._restored_identity = None
+
             # ── Notification-based polling optimization ───────────────────────────────────
             # MBF_NOTIFICATION (0x0110) bits indicate which config pages changed since the
-            # last read. Between forced refreshes, only flagged pages are re-read from the
-            # device; the rest use cached values from the previous successful poll.
+            # last read. After the first full read, only flagged pages are re-read from the
+            # device; the rest use cached values from the previous successful poll, and
+            # one cached page or timer block per poll is verified in the background.
             # After consuming the notifications the NOTIFICATION register is cleared to 0.
             notification = result.get("MBF_NOTIFICATION", 0) or 0
-            force_full = self._polls_since_full_read >= _FULL_READ_INTERVAL
+            force_full = self._full_read_due
+            if force_full:
+                # Everything is read now, restart the verification rotation
+                self._last_verification = time.monotonic()
+            else:
+                verify = self._next_verification()
+                if verify in TIMER_BLOCKS:
+                    self._pending_timer_verification = verify
+                    verify = None
 
-            # Overlay fresh MEASURE data on top of the cached config data.
-            merged = dict(self._cached_result)
-            merged.update(result)  # Fresh MEASURE data takes priority over cache.
-            result = merged
+            # Overlay fresh MEASURE data on top of the cached config data. The
+            # cached register image is updated in place from here on and is
+            # returned itself; take_changed_keys() tells callers what changed.
+            self._store(result)
+            result = self._cached_result
 
             if force_full:
-                _LOGGER.debug(
-                    "Full register read (poll %d / %d)",
-                    self._polls_since_full_read,
-                    _FULL_READ_INTERVAL,
-                )
+                _LOGGER.debug("Full register read")
             elif notification:
                 _LOGGER.debug("Partial read – MBF_NOTIFICATION: 0x%04X", notification)
             else:
@@ -586,313 +1156,57 @@ class VistaPoolModbusClient:
                 )
             # ─────────────────────────────────────────────────────────────────────────────
 
-            """
-            Request MODBUS page of registers starting from 0x0000
-            Manages general configuration of the box. This page is reserved for internal purposes
-            """
-            if force_full or (notification & _NOTIF_MODBUS):
-                reg00 = await self._read_register_ranges(
-                    client,
-                    [
-                        (0x0000, 16),  # 0x0000–0x000F
-                        # (0x0022, 2),  # 0x0022–0x0024 (24-36V, 12V, 5V lines)
-                        # (0x006A, 1),  # 0x006A (5V line)
-                        # (0x0072, 1),  # 0x0072 (4-20mA line)
-                    ],
-                    label="rr00",
-                )
-
-                # Example: [1, 3, 1280, 32768, 88, 47, 16707, 20497, 8248, 12592, 0, 0, 0, 22069, 0]
-                # fmt: off
-                result.update({
-                    "MBF_POWER_MODULE_VERSION": get_safe(reg00, 2),     # 0x0002         ! Power module version (MSB=Major, LSB=Minor)
-                    "MBF_POWER_MODULE_NODEID": reg00[4:10],             # 0x0004         ! Power module Node ID (6 register 0x0004 - 0x0009)
-                    "MBF_POWER_MODULE_REGISTER": get_safe(reg00, 12),   # 0x000C         ! Writing an address in this register causes the power module register address to be read out into MBF_POWER_MODULE_DATA, see MBF_POWER_MODULE_REG_*
-                    "MBF_POWER_MODULE_DATA": get_safe(reg00, 13),       # 0x000D         ! power module data as requested in MBF_POWER_MODULE_REGISTER
-                    # Prepared for future use:
-                    # "MBF_VOLT_24_36": get_safe(reg00, 16),            # 0x0022*        ! Current 24-36V line in mV
-                    # "MBF_VOLT_12": get_safe(reg00, 17),               # 0x0023*        ! Current 12V line in mV
-                    # "MBF_VOLT_5": get_safe(reg00, 18),                # 0x006A*        ! 5V line in mV / 0,62069
-                    # "MBF_AMP_4_20_MICRO": get_safe(reg00, 19),        # 0x0072*        ! 2-40mA line in µA * 10 (1=0,01mA)
-                })
-                # fmt: on
-            else:
-                _LOGGER.debug(
-                    "Skipping MODBUS (0x00xx)  page read (no change notification)"
-                )
-
-            """
-            Request GLOBAL page of registers starting from 0x0206
-            Contains global information, such as the amount of time that each power unit has been working.
-            For configuration registers, we have to use function 0x03 (Read Holding Registers)
-            """
-            if force_full or (notification & _NOTIF_GLOBAL):
-                # fmt: off
-                reg02 = await self._read_register_ranges(
-                    client,
-                    [
-                        (0x0206, 20),  # 0x0206–0x0219
-                        (0x0280, 2),   # 0x0280–0x0281 (hidrolysis module version and connectivity)
-                    ],
-                    label="rr02",
-                )
-                # fmt: on
-
-                # Example: [23971, 8, 23971, 8, 26922, 0, 34208, 0, 0, 65426, 0, 0, 0, 0, 64136, 3, 25371, 4, 16, 0]
-                # fmt: off
-                result.update({
-                    "MBF_CELL_RUNTIME_LOW":      get_safe(reg02, 0),            # 0x0206*        ! Cell runtime (32 bit value - low word)
-                    "MBF_CELL_RUNTIME_HIGH":     get_safe(reg02, 1),            # 0x0207*        ! Cell runtime (32 bit value - high word)
-                    "MBF_CELL_RUNTIME_PART_LOW": get_safe(reg02, 2),            # 0x0208*        ! Cell part runtime (32 bit value - low word)
-                    "MBF_CELL_RUNTIME_PART_HIGH":get_safe(reg02, 3),            # 0x0209*        ! Cell part runtime (32 bit value - high word)
-                    # 0x020A–0x020B skipped
-                    "MBF_CELL_BOOST":            get_safe(reg02, 6),            # 0x020C* mask   ! Boost control (see MBMSK_CELL_BOOST_*)
-                    # 0x020D–0x0213 skipped
-                    "MBF_CELL_RUNTIME_POLA_LOW": get_safe(reg02, 14),           # 0x0214*        ! Cell runtime polarity 1 (32 bit value - low word)
-                    "MBF_CELL_RUNTIME_POLA_HIGH":get_safe(reg02, 15),           # 0x0215*        ! Cell runtime polarity 1 (32 bit value - high word)
-                    "MBF_CELL_RUNTIME_POLB_LOW": get_safe(reg02, 16),           # 0x0216*        ! Cell runtime polarity 2 (32 bit value - low word)
-                    "MBF_CELL_RUNTIME_POLB_HIGH":get_safe(reg02, 17),           # 0x0217*        ! Cell runtime polarity 2 (32 bit value - high word)
-                    "MBF_CELL_RUNTIME_POL_CHANGES_LOW": get_safe(reg02, 18),    # 0x0218*        ! Cell runtime polarity change count (32 bit value - low word)
-                    "MBF_CELL_RUNTIME_POL_CHANGES_HIGH":get_safe(reg02, 19),    # 0x0219*        ! Cell runtime polarity change count (32 bit value - high word)
-                    # Hydrolysis module data
-                    "MBF_HIDRO_MODULE_VERSION":      get_safe(reg02, 20),       # 0x0280         ! Hydrolysis module version
-                    "MBF_HIDRO_MODULE_CONNECTIVITY": get_safe(reg02, 21),       # 0x0281         ! Hydrolysis module connection quality (in myriad: 0..10000)
-                })
-                # fmt: on
-            else:
-                _LOGGER.debug(
-                    "Skipping GLOBAL (0x02xx) page read (no change notification)"
-                )
-
-            if force_full or (notification & _NOTIF_FACTORY):
-                """
-                Request FACTORY page of registers starting from 0x0300
-                Contains factory data such as calibration parameters for the different power units.
-                For configuration registers, we have to use function 0x03 (Read Holding Registers)
-                """
-                reg03 = await self._read_register_ranges(
-                    client,
-                    [
-                        (0x0300, 13),  # 0x0300–0x030C
-                        (0x0322, 4),  # 0x0322–0x0325
-                    ],
-                    label="rr03",
-                )
-
-                # [2055, 10, 0, 0, 0, 0, 1000, 50, 0, 14687, 2600, 2, 1297, 125, 2, 100, 100]
-                # fmt: off
-                result.update({
-                    "MBF_PAR_VERSION": get_safe(reg03, 0),                          # 0x0300*        Software version of the PowerBox
-                    "MBF_PAR_MODEL": get_safe(reg03, 1),                            # 0x0301* mask   System model options
-                    "MBF_PAR_SERNUM": get_safe(reg03, 2),                           # 0x0302*        Serial number of the PowerBox
-                    "MBF_PAR_ION_NOM":  get_safe(reg03, 3),                         # 0x0303*        Ionization maximum production level (DO NOT WRITE!)
-                    # 0x0304–0x0305 skipped
-                    "MBF_PAR_HIDRO_NOM":  get_safe(reg03, 6, lambda v: v / 10.0),   # 0x0306*        Hydrolysis maximum production level. (DO NOT WRITE!) If the hydrolysis is set to work in percent mode, this value will be 100. If the hydrolysis module is set to work in g/h production, this module will contain the maximum amount of production in g/h units. (DO NOT WRITE!)
-                    "MBF_PAR_HIDRO_NOM2": get_safe(reg03, 7),                       # 0x0307*        Hydrolysis maximum production level in g/h units (DO NOT WRITE!). This value is probably used only when the hydrolysis module is set to work in g/h production mode.
-                    # 0x0308–0x0309 skipped
-                    "MBF_PAR_SAL_AMPS":  get_safe(reg03, 10),                       # 0x030A         Current command in regulation for which we are going to measure voltage
-                    "MBF_PAR_SAL_CELLK":  get_safe(reg03, 11),                      # 0x030B         Specifies the relationship between the resistance obtained in the measurement process and its equivalence in g / l (grams per liter)
-                    "MBF_PAR_SAL_TCOMP":  get_safe(reg03, 12),                      # 0x030C         Specifies the deviation in temperature from the conductivity.
-                    # 0x030D–0x0321 skipped
-                    "MBF_PAR_HIDRO_MAX_VOLTAGE": get_safe(reg03, 13),               # 0x0322         Allows setting the maximum voltage value that can be reached with the hydrolysis current regulation. The value is specified in tenths of a volt. The default value of this register when the EEPROM is cleared is 80, which is equivalent to a maximum cell operating voltage of 8 volts.
-                    "MBF_PAR_HIDRO_FLOW_SIGNAL": get_safe(reg03, 14),               # 0x0323         Allows to select the operation of the flow detection signal associated with the operation of the hydrolysis (see MBV_PAR_HIDRO_FLOW_SIGNAL*). The default value for this register is 0 (standard detection).
-                    "MBF_PAR_HIDRO_MAX_PWM_STEP_UP": get_safe(reg03, 15),           # 0x0324         This register sets the PWM ramp up of the hydrolysis in pulses per duty cycle. This register makes it possible to adjust the rate at which the power delivered to the cell increases, allowing a gradual rise in power so that the operation of the switching source of the equipment is not saturated. Default 150
-                    "MBF_PAR_HIDRO_MAX_PWM_STEP_DOWN": get_safe(reg03, 16),         # 0x0325         This register sets the PWM down ramp of the hydrolysis in pulses per duty cycle. This register allows adjusting the rate at which the power delivered to the cell decreases, allowing a gradual drop in power so that the switched source of the equipment is not disconnected due to lack of consumption. This gradual fall must be in accordance with the type of cell used, since said cell stores charge once the current stimulus has ceased. Default 20
-                })
-                # fmt: on
-            else:
-                _LOGGER.debug(
-                    "Skipping FACTORY (0x03xx) page read (no change notification)"
-                )
-
-            if force_full or (notification & _NOTIF_INSTALLER):
-                """
-                Request INSTALLER page of registers starting from 0x0400
-                Contains a set of configuration registers related to the equipment installation,
-                such as the relays used for each function, the amount of time that each pump must operate, etc.
-                For configuration registers, we have to use function 0x03 (Read Holding Registers)
-                """
-
-                # Read configuration registers in multiple blocks due to device limits.
-                # Blocks covered:
-                #   0x0408–0x0426  (31 registers) - general config (relay GPIOs, offsets, etc.)
-                #   0x0427–0x0433  (13 registers) - pH/redox/chlorine config
-                #   0x0434–0x04E7  - TIMER_BLOCKS, read separately via read_all_timers()
-                #   0x04E8–0x04EF  ( 8 registers) - FILTVALVE / backwash valve config
-                reg04 = await self._read_register_ranges(
-                    client,
-                    [
-                        (0x0408, 31),  # 0x0408–0x0426
-                        (0x0427, 13),  # 0x0427–0x0433
-                        (0x04E8, 8),  # 0x04E8–0x04EF  FILTVALVE / backwash registers
-                    ],
-                    label="rr04",
-                )
-
-                # Example: [9861, 26670, 1, 0, 0, 0, 0, 1, 3, 1, 2, 0, 0, 0, 25, 0, 25, 10, 0, 0, 28, 480, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
-                # fmt: off
-                result.update({
-                    "MBF_PAR_TIME_LOW": get_safe(reg04, 0),                                     # 0x0408*        System timestamp as unix timestamp (32 bit value - low word).
-                    "MBF_PAR_TIME_HIGH": get_safe(reg04, 1),                                    # 0x0409*        System timestamp as unix timestamp (32 bit value - high word).
-                    "MBF_PAR_PH_ACID_RELAY_GPIO": get_safe(reg04, 2),                           # 0x040A*        Relay number assigned to the acid pump function (only with pH module).
-                    "MBF_PAR_PH_BASE_RELAY_GPIO": get_safe(reg04, 3),                           # 0x040B*        Relay number assigned to the base pump function (only with pH module).
-                    "MBF_PAR_RX_RELAY_GPIO": get_safe(reg04, 4),                                # 0x040C*        Relay number assigned to the Redox level regulation function. If the value is 0, there is no relay assigned, and therefore there is no pump function (ON / OFF should not be displayed)
-                    "MBF_PAR_CL_RELAY_GPIO": get_safe(reg04, 5),                                # 0x040D*        Relay number assigned to the chlorine pump function (only with free chlorine measuring modules).
-                    "MBF_PAR_CD_RELAY_GPIO": get_safe(reg04, 6),                                # 0x040E*        Relay number assigned to the conductivity (brine) pump function (only with conductivity measurement modules).
-                    "MBF_PAR_TEMPERATURE_ACTIVE": get_safe(reg04, 7),                           # 0x040F*        Indicates whether the equipment has a temperature measurement or not.
-                    "MBF_PAR_LIGHTING_GPIO": get_safe(reg04, 8),                                # 0x0410*        Relay number assigned to the lighting function. 0: inactive.
-                    "MBF_PAR_FILT_MODE": get_safe(reg04, 9),                                    # 0x0411*        Filtration mode (see MBV_PAR_FILT_*)
-                    "MBF_PAR_FILT_GPIO": get_safe(reg04, 10),                                   # 0x0412*        Relay selected to perform the filtering function (by default it is relay 2). When this value is at zero, there is no relay assigned and therefore it is understood that the equipment does not control the filtration. In this case, the filter option does not appear in the user menu.
-                    "MBF_PAR_FILT_MANUAL_STATE": get_safe(reg04, 11),                           # 0x0413         Filtration status in manual mode (on = 1; off = 0)
-                    "MBF_PAR_HEATING_MODE": get_safe(reg04, 12),                                # 0x0414         Heating mode: 0 = the equipment is not heated. 1 = the equipment is heating.
-                    "MBF_PAR_HEATING_GPIO": get_safe(reg04, 13),                                # 0x0415         Relay number assigned to perform the heating function (by default it is relay 7). When this value is at zero, there is no relay assigned and therefore it is understood that the equipment does not control the heating. In this case, the filter modes associated with heating will not be displayed.
-                    "MBF_PAR_HEATING_TEMP": get_safe(reg04, 14),                                # 0x0416         Heating mode: Heating setpoint temperature
-                    "MBF_PAR_CLIMA_ONOFF": get_safe(reg04, 15),                                 # 0x0417         Activation of the climate mode (0 = inactive, 1 = active).
-                    "MBF_PAR_SMART_TEMP_HIGH": get_safe(reg04, 16),                             # 0x0418         Smart mode: Upper temperature
-                    "MBF_PAR_SMART_TEMP_LOW": get_safe(reg04, 17),                              # 0x0419         Smart mode: Lower temperature
-                    "MBF_PAR_SMART_ANTI_FREEZE": get_safe(reg04, 18),                           # 0x041A         Smart mode: Antifreeze mode activated (1) or not (0).
-                    "MBF_PAR_SMART_INTERVAL_REDUCTION": get_safe(reg04, 19),                    # 0x041B         Smart mode: This register is read-only and reports to the outside what percentage (0 to 100%) is being applied to the nominal filtration time. 100% means that the total programmed time is being filtered.
-                    "MBF_PAR_INTELLIGENT_TEMP": get_safe(reg04, 20),                            # 0x041C         Intelligent mode: Setpoint temperature
-                    "MBF_PAR_INTELLIGENT_FILT_MIN_TIME": get_safe(reg04, 21),                   # 0x041D         Intelligent mode: Minimum filtration time in minutes
-                    "MBF_PAR_INTELLIGENT_BONUS_TIME": get_safe(reg04, 22),                      # 0x041E         Intelligent mode: Bonus time for the current set of intervals
-                    "MBF_PAR_INTELLIGENT_TT_NEXT_INTERVAL": get_safe(reg04, 23),                # 0x041F         Intelligent mode: Time to next filtration interval. When it reaches 0 an interval is started and the number of seconds is reloaded for the next interval (2x3600)
-                    "MBF_PAR_INTELLIGENT_INTERVALS": get_safe(reg04, 24),                       # 0x0420         Intelligent mode: Number of started intervals. When it reaches 12 it is reset to 0 and the bonus time is reloaded with the value of MBF_PAR_INTELLIGENT_FILT_MIN_TIME
-                    "MBF_PAR_FILTRATION_STATE": get_safe(reg04, 25),                            # 0x0421         Filtration state: 0 is off and 1 is on. The filtration state is regulated according to the MBF_PAR_FILT_MANUAL_STATE register if the filtration mode held in register MBF_PAR_FILT_MODE is set to FILT_MODE_MANUAL (0).
-                    "MBF_PAR_HEATING_DELAY_TIME": get_safe(reg04, 26),                          # 0x0422         Timer in seconds that counts up when the heating is to be enabled. Once this counter reaches 60 seconds, the heating is then enabled. This counter is for internal use only.
-                    "MBF_PAR_FILTERING_TIME_LOW": get_safe(reg04, 27),                          # 0x0423         Internal timer for the intelligent filtering mode (32-bit value - low word). It counts the filtering time done during a given day. This register is only for internal use and should not be modified by the user.
-                    "MBF_PAR_FILTERING_TIME_HIGH": get_safe(reg04, 28),                         # 0x0424         Internal timer for the intelligent filtering mode (32-bit value - high word)
-                    "MBF_PAR_INTELLIGENT_INTERVAL_TIME_LOW": get_safe(reg04, 29),               # 0x0425         Internal timer that counts the filtration interval assigned to the the intelligent mode (32-bit value - low word). This register is only for internal use and should not be modified by the user.
-                    "MBF_PAR_INTELLIGENT_INTERVAL_TIME_HIGH": get_safe(reg04, 30),              # 0x0426         Internal timer that counts the filtration interval assigned to the the intelligent mode (32-bit value - high word)
-                    "MBF_PAR_UV_MODE": get_safe(reg04, 31),                                     # 0x0427         UV mode active or not - see MBV_PAR_UV_MODE*. To enable UV support for a given device, add the mask MBMSK_MODEL_UV to the MBF_PAR_MODEL register.
-                    "MBF_PAR_UV_HIDE_WARN": get_safe(reg04, 32),                                # 0x0428  mask   Suppression for warning messages in the UV mode (see MBMSK_UV_HIDE_WARN_*)
-                    "MBF_PAR_UV_RELAY_GPIO": get_safe(reg04, 33),                               # 0x0429         Relay number assigned to the UV function.
-                    "MBF_PAR_PH_PUMP_REP_TIME_ON": get_safe(reg04, 34),                         # 0x042A  mask   Time that the pH pump will be turn on in the repetitive mode (see MBMSK_PH_PUMP_*). Contains a special time format, see desc for MBMSK_PH_PUMP_TIME.
-                    "MBF_PAR_PH_PUMP_REP_TIME_OFF": get_safe(reg04, 35),                        # 0x042B  mask   Time that the pH pump will be turn off in the repetitive mode. Contains a special time format, see desc for MBMSK_PH_PUMP_TIME, has no upper configuration bit 0x8000
-                    "MBF_PAR_HIDRO_COVER_ENABLE": get_safe(reg04, 36),                          # 0x042C  mask   Options for the hydrolysis/electrolysis module (see MBMSK_HIDRO_*)
-                    "MBF_PAR_HIDRO_COVER_REDUCTION": get_safe(reg04, 37),                       # 0x042D         Configured levels for the cover reduction and the hydrolysis shutdown temperature options: LSB = Percentage for the cover reduction, MSB = Temperature level for the hydrolysis shutdown (see MBMSK_HIDRO_*)
-                    "MBF_PAR_PUMP_RELAY_TIME_OFF": get_safe(reg04, 38),                         # 0x042E         Time level in minutes or seconds that the dosing pump must remain off when the temporized pump mode is selected. This time level register applies to all pumps except pH. Contains a special time format, see desc for MBMSK_PH_PUMP_TIME, has no upper configuration bit 0x8000
-                    "MBF_PAR_PUMP_RELAY_TIME_ON": get_safe(reg04, 39),                          # 0x042F         Time level in minutes or seconds that the dosing pump must remain on when the temporized pump mode is selected. This time level register applies to all pumps except pH. Contains a special time format, see desc for MBMSK_PH_PUMP_TIME, has no upper configuration bit 0x8000
-                    "MBF_PAR_RELAY_PH": get_safe(reg04, 40),                                    # 0x0430         Determine what pH regulation configuration the equipment has (see MBV_PAR_RELAY_PH_*)
-                    "MBF_PAR_RELAY_MAX_TIME": get_safe(reg04, 41),                              # 0x0431         Maximum amount of time in seconds, that a dosing pump can operate before rising an alarm signal. The behavior of the system when the dosing time is exceeded is regulated by the type of action stored in the MBF_PAR_RELAY_MODE register.
-                    "MBF_PAR_RELAY_MODE": get_safe(reg04, 42),                                  # 0x0432         Behavior of the system when the dosing time is exceeded (see MBMSK_PAR_RELAY_MODE_* and MBV_PAR_RELAY_MODE_*)
-                    "MBF_PAR_RELAY_ACTIVATION_DELAY": get_safe(reg04, 43, lambda v: v + 10),    # 0x0433         Delay time in seconds for the pH pump when the measured pH value is outside the allowable pH setpoints. The system internally adds an extra time of 10 seconds to the value stored here. The pump starts the dosing operation once the condition of pH out of valid interval is maintained during the time specified in this register.
-                    # FILTVALVE / backwash registers (0x04E8–0x04EF) at reg04 indices 44–51
-                    "MBF_PAR_FILTVALVE_ENABLE": get_safe(reg04, 44),                            # 0x04E8        Filter cleaning mode (0 = off, 1 = Besgo valve)
-                    "MBF_PAR_FILTVALVE_MODE": get_safe(reg04, 45),                              # 0x04E9        Filter cleaning valve timing mode (MBV_PAR_CTIMER_ENABLED/ALWAYS_ON/ALWAYS_OFF)
-                    "MBF_PAR_FILTVALVE_GPIO": get_safe(reg04, 46),                              # 0x04EA        Relay assigned to the filter cleaning function
-                    "MBF_PAR_FILTVALVE_PERIOD_MINUTES": get_safe(reg04, 49),                    # 0x04ED        Period in minutes between cleaning actions
-                    "MBF_PAR_FILTVALVE_INTERVAL": get_safe(reg04, 50),                          # 0x04EE        Cleaning action duration in seconds
-                    "MBF_PAR_FILTVALVE_REMAINING": get_safe(reg04, 51),                         # 0x04EF        Remaining backwash time in seconds (> 0 = backwash active)
-
-                })
-                # fmt: on
-            else:
-                _LOGGER.debug(
-                    "Skipping INSTALLER (0x04xx) page read (no change notification)"
-                )
-
-            # Decode UV Lamp relay state after INSTALLER data is available in result
-            # (MBF_PAR_UV_RELAY_GPIO comes from INSTALLER page or cache merge)
-            _uv_gpio = result.get("MBF_PAR_UV_RELAY_GPIO", 0) or 0
-            result.update(decode_uv_lamp_state(result.get("MBF_RELAY_STATE"), _uv_gpio))
-
-            # Decode named relay states using dynamic GPIO mapping.
-            # Each functional relay (Filtration, Light, pH Acid Pump, Heating) is
-            # assigned to a physical relay output via MBF_PAR_*_RELAY_GPIO registers.
-            result.update(
-                decode_named_relay_states(
-                    result.get("MBF_RELAY_STATE"),
-                    {
-                        "pH Acid Pump": result.get("MBF_PAR_PH_ACID_RELAY_GPIO", 0)
-                        or 0,
-                        "Filtration Pump": result.get("MBF_PAR_FILT_GPIO", 0) or 0,
-                        "Pool Light": result.get("MBF_PAR_LIGHTING_GPIO", 0) or 0,
-                        "Heating": result.get("MBF_PAR_HEATING_GPIO", 0) or 0,
-                    },
-                )
-            )
-
-            if force_full or (notification & _NOTIF_USER):
-                # MBF_PAR_RELAY_PH:
-                #   0: The equipment works with an acid and base pump
-                #   1: The equipment works with acid pump only
-                #   2: The equipment works with base pump only
-
-                """
-                Request USER page of registers starting from 0x0500
-                Contains user configuration registers, such as the production level
-                for the ionization and the hydrolysis, or the set points for the pH, redox, or chlorine regulation loops.
-                For configuration registers, we have to use function 0x03 (Read Holding Registers)
-                """
-                reg05 = await self._read_register_ranges(
-                    client,
-                    [(0x0502, 14)],  # 0x0502–0x050F
-                    label="rr05",
-                )
-
-                # Example: [650, 0, 750, 700, 0, 0, 700, 0, 100, 0, 0, 0, 5000, 0]
-                # fmt: off
-                result.update({
-                    "MBF_PAR_HIDRO": get_safe(reg05, 0, lambda v: v / 10.0),    # 0x0502        Hydrolisis target production level
-                    "MBF_PAR_PH1": get_safe(reg05, 2, lambda v: v / 100.0),     # 0x0504        Higher limit of the pH regulation system
-                    "MBF_PAR_PH2": get_safe(reg05, 3, lambda v: v / 100.0),     # 0x0505        Lower limit of the pH regulation system
-                    # 0x0506–0x0507 skipped
-                    "MBF_PAR_RX1": get_safe(reg05, 6),                          # 0x0508        Set point for the redox regulation system
-                    # 0x0509 skipped
-                    "MBF_PAR_CL1": get_safe(reg05, 8, lambda v: v / 100.0),     # 0x050A        Set point for the chlorine regulation system
-                    # 0x050B-0x050E skipped
-                    "MBF_PAR_FILTRATION_CONF": get_safe(reg05, 13),             # 0x050F* mask   ! filtration type and speed
-                })
-                # fmt: on
-            else:
-                _LOGGER.debug(
-                    "Skipping USER (0x05xx) page read (no change notification)"
-                )
-
-            if force_full or (notification & _NOTIF_MISC):
-                """
-                Request MISC page of registers starting from 0x0600
-                Contains the configuration parameters for the screen controllers (language, colours, sound, etc).
-                For configuration registers, we have to use function 0x03 (Read Holding Registers)
-                """
-                reg06 = await self._read_register_ranges(
-                    client,
-                    [
-                        # Includes full NAME_BOLD 0x0608-0x060B and NAME_LIGHT 0x060C-0x060F
-                        (0x0600, 16),  # 0x0600–0x060F
-                    ],
-                    label="rr06",
-                )
+            # Configuration pages (FC03) in read order, see registers.PAGES.
+            # Read ranges are compiled from registers.REGISTER_MAP.
+            # Pages without any register backing an enabled entity are skipped.
+            for page, notif_bit in _CONFIG_PAGE_NOTIFICATIONS.items():
+                if page in pages_read:
+                    continue
+                if not self._page_plans[page][1]:
+                    _LOGGER.debug(
+                        "Skipping %s (%s) page read (no enabled entity needs it)",
+                        page,
+                        PAGES[page].label,
+                    )
+                elif force_full or (notification & notif_bit) or page == verify:
+                    try:
+                        values = await self._read_page(client, page)
+                        if page == verify and not notification & notif_bit:
+                            self._check_verified(page, values, self._cached_result)
+                        self._store(values)
+                    except Exception as e:
+                        # Partial success: the page keeps its cached values and
+                        # is read again next poll. A lost connection fails the
+                        # cycle so async_read_all can reconnect and resume.
+                        if classify_error(e) == ERROR_TRANSPORT:
+                            raise
+                        failed_pages.append(page)
+                        _LOGGER.warning(
+                            "Reading %s (%s) page failed, keeping cached values: %s",
+                            page,
+                            PAGES[page].label,
+                            e,
+                        )
+                else:
+                    _LOGGER.debug(
+                        "Skipping %s (%s) page read (no change notification)",
+                        page,
+                        PAGES[page].label,
+                    )
 
-                # Example: [9, 6, 25604, 5, 0, 2240, 545, 1281, 0, 0, 0, 0, 0, 0, 0, 0]
-                # fmt: off
-                result.update({
-                    "MBF_PAR_UICFG_MACHINE": get_safe(reg06, 0),                # 0x0600        Machine type (see MBV_PAR_MACH_* and  kNeoPoolMachineNames[])
-                    "MBF_PAR_UICFG_LANGUAGE": get_safe(reg06, 1),               # 0x0601        Selected language (see MBV_PAR_LANG_*)
-                    "MBF_PAR_UICFG_BACKLIGHT": get_safe(reg06, 2),              # 0x0602        Display backlight function (see MBV_PAR_BACKLIGHT_*)
-                    "MBF_PAR_UICFG_SOUND": get_safe(reg06, 3),                  # 0x0603 mask   Audible alerts (see MBMSK_PAR_SOUND_*)
-                    "MBF_PAR_UICFG_PASSWORD": get_safe(reg06, 4),               # 0x0604        System password encoded in BCD
-                    "MBF_PAR_UICFG_VISUAL_OPTIONS": get_safe(reg06, 5),         # 0x0605 mask   Stores the different display options for the user interface menus (bitmask). Some bits allow you to hide options that are normally visible (bits 0 to 3) while other bits allow you to show options that are normally hidden (bits 9 to 15)
-                    "MBF_PAR_UICFG_VISUAL_OPTIONS_EXT": get_safe(reg06, 6),     # 0x0606 mask   This register stores additional display options for the user interface menus (see MBMSK_VOE_*)
-                    "MBF_PAR_UICFG_MACH_VISUAL_STYLE": get_safe(reg06, 7),      # 0x0607 mask   This register is an expansion of register MBF_PAR_UICFG_MACHINE and MBF_PAR_UICFG_VISUAL_OPTIONS. If MBF_PAR_UICFG_MACHINE is MBV_PAR_MACH_GENERIC then the lower part (8 bits LSB) is used to store the type of color selected. Colors and styles correspond to those listed in MBF_PAR_UICFG_MACHINE (see MBV_PAR_MACH_*). The upper part (8-bit MSB) contains extra bits MBMSK_VS_FORCE_UNITS_GRH, MBMSK_VS_FORCE_UNITS_PERCENTAGE and MBMSK_ELECTROLISIS
-                    "MBF_PAR_UICFG_MACH_NAME_BOLD": modbus_regs_to_ascii(reg06[8:12]),   # 0x0608         Machine name bold part title displayed during startup if MBF_PAR_UICFG_MACHINE is MBV_PAR_MACH_GENERIC. Note: Only lowercase letters (a-z) can be used. 4 register (0x608 to 0x60B) ASCIIZ string with up to 8 characters
-                    "MBF_PAR_UICFG_MACH_NAME_LIGHT": modbus_regs_to_ascii(reg06[12:16]), # 0x060C         Machine name normal intensity part title displayed during startup if MBF_PAR_UICFG_MACHINE is MBV_PAR_MACH_GENERIC. Note: Only lowercase letters (a-z) can be used. 4 register (0x060C to 0x060F) ASCIIZ string with up to 8 characters
-                    # Prepared for future use:
-                    # "MBF_PAR_UICFG_MACH_NAME_AUX1": modbus_regs_to_ascii(reg06[16:21]), # 0x0610         Aux1 relay name: 5 register ASCIIZ string with up to 10 characters
-                    # "MBF_PAR_UICFG_MACH_NAME_AUX2": modbus_regs_to_ascii(reg06[21:26]), # 0x0615         Aux2 relay name: 5 register ASCIIZ string with up to 10 characters
-                    # "MBF_PAR_UICFG_MACH_NAME_AUX3": modbus_regs_to_ascii(reg06[26:31]), # 0x061A         Aux3 relay name: 5 register ASCIIZ string with up to 10 characters
-                    # "MBF_PAR_UICFG_MACH_NAME_AUX4": modbus_regs_to_ascii(reg06[31:36]), # 0x061F         Aux4 relay name: 5 register ASCIIZ string with up to 10 characters
-                })
-                # fmt: on
-            else:
+            if notification and failed_pages:
                 _LOGGER.debug(
-                    "Skipping MISC (0x06xx) page read (no change notification)"
+                    "MBF_NOTIFICATION (0x%04X) left set, %s to be read again",
+                    notification,
+                    ", ".join(failed_pages),
                 )
-
-            if notification:
+            elif notification:
                 try:
-                    await modbus_acall(
-                        client.write_registers, self._unit, address=0x0110, values=[0]
+                    await self._request(
+                        client.write_registers,
+                        PRIORITY_MEASURE,
+                        address=0x0110,
+                        values=[0],
                     )
                     _LOGGER.debug(
                         "MBF_NOTIFICATION register cleared (was 0x%04X)", notification
@@ -908,12 +1222,57 @@ class VistaPoolModbusClient:
         finally:
             end = time.monotonic()
             self._response_times.append(end - start)
-        if force_full:
-            self._polls_since_full_read = 0
-        else:
-            self._polls_since_full_read += 1
+        # An incomplete full read is repeated on the next poll
+        if force_full and not failed_pages:
+            self._full_read_due = False
         self._last_notification = notification
         self._last_was_full_read = force_full
+        if force_full or notification & _NOTIF_INSTALLER:
+            self._installer_epoch += 1  # cached timer blocks may be outdated
+        self._last_failed_pages = failed_pages
+        if failed_pages:
+            self._partial_reads += 1
+
+        # Only apply the filtration fixup when the INSTALLER page was actually
+        # read this cycle (see _decode_derived).
+        installer_fresh = (
+            force_full or bool(notification & _NOTIF_INSTALLER) or verify == "INSTALLER"
+        ) and "INSTALLER" not in failed_pages
+        self._store(self._decode_derived(result, installer_fresh))
+        self.changed_status_keys = self._status_decoder.take_changed_keys()
+
+        # _LOGGER.debug("All Results: %s", result)
+        return result
+
+    def _decode_derived(self, result: dict, installer_fresh: bool) -> dict:
+        """Return the values derived from the measurements and configuration in result."""
+        derived = {}
+        # Decode UV Lamp relay state after INSTALLER data is available in result
+        # (MBF_PAR_UV_RELAY_GPIO comes from INSTALLER page or cache merge)
+        relay_state = result.get("MBF_RELAY_STATE")
+        _uv_gpio = result.get("MBF_PAR_UV_RELAY_GPIO", 0) or 0
+        derived.update(
+            self._status_decoder.decode(
+                "UV Lamp", decode_uv_lamp_state, relay_state, _uv_gpio
+            )
+        )
+
+        # Decode named relay states using dynamic GPIO mapping.
+        # Each functional relay (Filtration, Light, pH Acid Pump, Heating) is
+        # assigned to a physical relay output via MBF_PAR_*_RELAY_GPIO registers.
+        derived.update(
+            self._status_decoder.decode(
+                "named relays",
+                decode_named_relay_items,
+                relay_state,
+                (
+                    ("pH Acid Pump", result.get("MBF_PAR_PH_ACID_RELAY_GPIO", 0) or 0),
+                    ("Filtration Pump", result.get("MBF_PAR_FILT_GPIO", 0) or 0),
+                    ("Pool Light", result.get("MBF_PAR_LIGHTING_GPIO", 0) or 0),
+                    ("Heating", result.get("MBF_PAR_HEATING_GPIO", 0) or 0),
+                ),
+            )
+        )
 
         # Fixup: on some installations the filtration relay bit in
         # MBF_RELAY_STATE is not set even when the filtration pump is running.
@@ -922,8 +1281,8 @@ class VistaPoolModbusClient:
         # only re-read on notification or periodic full reads. When it comes from
         # cache it may be stale, so we must NOT let a stale cached value override
         # the fresh relay bit from MBF_RELAY_STATE (read every poll cycle).
-        # Only apply the fixup when the INSTALLER page was actually read this cycle.
-        installer_fresh = force_full or bool(notification & _NOTIF_INSTALLER)
+        # Only apply the fixup when the INSTALLER page was actually read
+        # (installer_fresh).
         filt_gpio = result.get("MBF_PAR_FILT_GPIO", 0) or 0
         filtration_state = result.get("MBF_PAR_FILTRATION_STATE")
         if (
@@ -932,7 +1291,7 @@ class VistaPoolModbusClient:
             and filtration_state in (0, 1)
         ):
             authoritative = filtration_state == 1
-            if result.get("Filtration Pump") != authoritative:
+            if derived.get("Filtration Pump") != authoritative:
                 _LOGGER.debug(
                     "MBF_RELAY_STATE filtration relay (GPIO %d) disagrees with "
                     "MBF_PAR_FILTRATION_STATE (%d); patching Filtration Pump to %s",
@@ -940,29 +1299,23 @@ class VistaPoolModbusClient:
                     filtration_state,
                     authoritative,
                 )
-                result["Filtration Pump"] = authoritative
+                derived["Filtration Pump"] = authoritative
                 relay_state = result.get("MBF_RELAY_STATE", 0) or 0
                 bit = 1 << (filt_gpio - 1)
                 if authoritative:
-                    result["MBF_RELAY_STATE"] = relay_state | bit
+                    derived["MBF_RELAY_STATE"] = relay_state | bit
                 else:
-                    result["MBF_RELAY_STATE"] = relay_state & ~bit
+                    derived["MBF_RELAY_STATE"] = relay_state & ~bit
 
         # Derive hydrolysis module presence:
         # MBF_PAR_MODEL bit 1 (MBMSK_MODEL_HIDRO) OR MBF_HIDRO_STATUS bit 6 (CTRL_ACTIVE)
-        result["Hydrolysis module detected"] = bool(
+        derived["Hydrolysis module detected"] = bool(
             (result.get("MBF_PAR_MODEL") or 0) & 0x0002
         ) or bool((result.get("MBF_HIDRO_STATUS") or 0) & 0x0040)
 
         # Add filtration speed and type
-        result["FILTRATION_SPEED"] = get_filtration_speed(result)
-
-        # Update cache after fixup and derived fields so partial reads
-        # start from consistent values including derived flags.
-        self._cached_result.update(result)
-
-        # _LOGGER.debug("All Results: %s", result)
-        return result
+        derived["FILTRATION_SPEED"] = get_filtration_speed(ChainMap(derived, result))
+        return derived
 
     async def async_write_register(
         self, address: int, value, apply: bool = False
@@ -972,13 +1325,132 @@ class VistaPoolModbusClient:
             result = await self._perform_write_register(address, value, apply)
             self._last_successful_operation = datetime.now()
             return result
-        except Exception:
+        except Exception as e:
             self._consecutive_errors += 1
-            async with self._client_lock:
-                await self._safe_close_client()
-                self._client = None
+            await self._handle_request_error(e)
+            raise
+
+    def transaction(self, apply: bool = False) -> WriteTransaction:
+        """Return a context collecting register writes sent as one batch.
+
+        async with client.transaction(apply=True) as tx:
+            tx.write(HEATING_SETPOINT_REGISTER, value)
+            tx.write(INTELLIGENT_SETPOINT_REGISTER, value)
+        """
+        return WriteTransaction(self, apply)
+
+    async def async_write_transaction(self, tx: WriteTransaction) -> dict | None:
+        """Send the writes of a transaction (see WriteTransaction)."""
+        try:
+            result = await self._perform_write_transaction(tx)
+            self._last_successful_operation = datetime.now()
+            return result
+        except Exception as e:
+            self._consecutive_errors += 1
+            await self._handle_request_error(e)
+            raise
+
+    async def _perform_write_transaction(self, tx: WriteTransaction) -> dict | None:
+        """Write, confirm, save and execute a transaction.
+
+        Returns {address: confirmed value} for every written register, or None
+        if the device rejected a request.
+        """
+        blocks = tx.blocks
+        label = f"0x{blocks[0][0]:04X}" if blocks else "transaction"
+        start = time.monotonic()
+        self._total_writes += 1
+        try:
+            client = await self.get_client()
+            if client is None or not client.connected:
+                raise ModbusException(
+                    f"Modbus client connection failed to {self._host}:{self._port}"
+                )
+            for address, values in blocks:
+                result = await self._request(
+                    client.write_registers, address=address, values=values
+                )
+                if result.isError():
+                    self._failed_writes[f"0x{address:04X}"] = (
+                        self._failed_writes.get(f"0x{address:04X}", 0) + 1
+                    )
+                    self._record_protocol_error(address, result)
+                    _LOGGER.error("Write failed at 0x%04X: %s", address, result)
+                    return None
+                _LOGGER.debug("Wrote register(s) at 0x%04X: %s", address, values)
+
+            # One readback per window of MAX_READ_COUNT registers
+            confirmed: dict[int, int] = {}
+            written = tx.addresses
+            for address, count in plan_address_reads(
+                written, MAX_READ_COUNT, MAX_READ_COUNT
+            ):
+                confirm = await self._request(
+                    client.read_holding_registers, address=address, count=count
+                )
+                if confirm.isError():
+                    self._record_protocol_error(address, confirm)
+                    _LOGGER.error("Read failed at 0x%04X: %s", address, confirm)
+                    return None
+                self._write_through(address, confirm.registers)
+                confirmed.update(
+                    zip(range(address, address + count), confirm.registers)
+                )
+
+            if tx.save:
+                self._commit_scheduler.mark_dirty()
+            elif tx.execute and not await self._save_and_execute(client, False, True):
+                return None
+
+            self._successful_write_ops += 1
+            self._successful_writes.append((label, time.time()))
+            return {address: confirmed.get(address) for address in written}
+
+        except Exception as e:
+            self._failed_writes[label] = self._failed_writes.get(label, 0) + 1
+            raise ModbusException(f"Modbus TCP write exception at {label}: {e}") from e
+        finally:
+            self._write_response_times.append(time.monotonic() - start)
+
+    async def async_commit(self) -> bool:
+        """Save and execute pending applied writes now instead of deferred.
+
+        Returns False if the commit failed; it is then retried later.
+        """
+        return await self._commit_scheduler.flush()
+
+    async def _perform_commit(self) -> bool:
+        """Save the configuration to EEPROM and execute it (commit callback)."""
+        try:
+            client = await self.get_client()
+            if client is None or not client.connected:
+                return False
+            return await self._save_and_execute(client, True, True)
+        except Exception as e:
+            self._consecutive_errors += 1
+            await self._handle_request_error(e)
             raise
 
+    async def _save_and_execute(self, client, save: bool, execute: bool) -> bool:
+        """Save the configuration to EEPROM (0x02F0) and/or execute it (0x02F5)."""
+        if save:
+            result = await self._request(
+                client.write_registers, address=EEPROM_SAVE_REGISTER, values=[1]
+            )
+            if result.isError():  # pragma: no cover
+                _LOGGER.error("EEPROM save failed (0x02F0): %s", result)
+                return False
+            _LOGGER.debug("EEPROM save triggered (0x02F0)")
+        if execute:
+            result = await self._request(
+                client.write_registers, address=EXEC_REGISTER, values=[1]
+            )
+            if result.isError():  # pragma: no cover
+                _LOGGER.error("EXEC failed (0x02F5): %s", result)
+                return False
+            _LOGGER.debug("Config EXEC triggered (0x02F5)")
+        return True
+
     def _calculate_avg_response_time(self):
         if not self._response_times:
             return None
@@ -990,8 +1462,8 @@ class VistaPoolModbusClient:
         """
         Write one or more Modbus registers using function 0x10 (Write Multiple Registers).
 
-        If apply=True, the configuration is saved to EEPROM (0x02F0)
-        and executed (0x02F5) after the write.
+        If apply=True, the configuration is saved to EEPROM (0x02F0) and
+        executed (0x02F5) by the deferred commit (see async_commit).
         """
         start = time.monotonic()
         self._total_writes += 1
@@ -1010,9 +1482,8 @@ class VistaPoolModbusClient:
             if not isinstance(value, list):
                 value = [value]
 
-            result = await modbus_acall(
+            result = await self._request(
                 client.write_registers,
-                self._unit,
                 address=address,
                 values=value,
             )
@@ -1020,44 +1491,28 @@ class VistaPoolModbusClient:
                 self._failed_writes[f"0x{address:04X}"] = (
                     self._failed_writes.get(f"0x{address:04X}", 0) + 1
                 )
+                self._record_protocol_error(address, result)
                 _LOGGER.error("Write failed at 0x%04X: %s", address, result)
                 return None
             _LOGGER.debug("Wrote register(s) at 0x%04X: %s", address, value)
 
             # Confirm the write
-            await asyncio.sleep(0.05)
             # Read back the register to confirm the write
-            confirm = await modbus_acall(
+            confirm = await self._request(
                 client.read_holding_registers,
-                self._unit,
                 address=address,
                 count=len(value),
             )
             if confirm.isError():
+                self._record_protocol_error(address, confirm)
                 _LOGGER.error("Read failed at 0x%04X: %s", address, confirm)
                 return None
+            self._write_through(address, confirm.registers)
 
-            # If apply is True, save the configuration to EEPROM and execute
+            # If apply is True, save the configuration to EEPROM and execute it
+            # once the burst of applied writes is over
             if apply:
-                await asyncio.sleep(0.1)
-                result = await modbus_acall(
-                    client.write_registers, self._unit, address=0x02F0, values=[1]
-                )
-
-                if result.isError():  # pragma: no cover
-                    _LOGGER.error("EEPROM save failed (0x02F0): %s", result)
-                    return None
-                _LOGGER.debug("EEPROM save triggered (0x02F0)")
-
-                await asyncio.sleep(0.1)
-                result = await modbus_acall(
-                    client.write_registers, self._unit, address=0x02F5, values=[1]
-                )
-                if result.isError():  # pragma: no cover
-                    _LOGGER.error("EXEC failed (0x02F5): %s", result)
-                    return None
-                _LOGGER.debug("Config EXEC triggered (0x02F5)")
-                await asyncio.sleep(0.1)
+                self._commit_scheduler.mark_dirty()
 
             # Return useful dict if everything succeeded
             self._successful_write_ops += 1
@@ -1083,14 +1538,44 @@ class VistaPoolModbusClient:
 
     """ Manual controller for AUX relays (1-4) """
 
-    async def async_write_aux_relay(self, relay_index, on) -> dict | None:
-        """Write state of an AUX relay (1-4) using function 0x10 (Write Multiple Registers)."""
-        if relay_index not in AUX_BITMASKS:  # pragma: no cover
-            _LOGGER.error("Invalid AUX relay index: %s (expected 1–4)", relay_index)
-            return None
-        aux_bit = AUX_BITMASKS[relay_index]
-        addr = 0x010E
+    async def async_write_aux_relay(self, relay_index, on) -> None:
+        """Switch one AUX relay (1-4) on or off.
+
+        The toggle is batched with AUX toggles requested concurrently (see
+        async_write_aux_relays). Raises ValueError for an invalid relay index
+        and ModbusException if the write sequence fails.
+        """
+        await self.async_write_aux_relays({relay_index: on})
+
+    async def async_write_aux_relays(self, states: dict[int, bool]) -> None:
+        """Switch several AUX relays (index 1-4 -> on) in one write sequence.
+
+        Calls made while a sequence is being written are merged into the next
+        one, so toggling several AUX switches at once costs a single sequence.
+        """
+        invalid = set(states) - set(AUX_BITMASKS)
+        if invalid:
+            raise ValueError(f"Invalid AUX relay index: {sorted(invalid)}")
+        if self._aux_batch is None:
+            self._aux_batch = asyncio.get_running_loop().create_future()
+        batch = self._aux_batch
+        self._aux_pending.update(states)
+        async with self._aux_lock:
+            if self._aux_batch is batch:  # not written by a concurrent call yet
+                pending, self._aux_pending = self._aux_pending, {}
+                self._aux_batch = None
+                try:
+                    await self._perform_write_aux_relays(pending)
+                except Exception as e:
+                    batch.set_exception(e)
+                else:
+                    batch.set_result(None)
+        await batch
+
+    async def _perform_write_aux_relays(self, states: dict[int, bool]) -> None:
+        addr = RELAY_STATE_REGISTER
         start = time.monotonic()
+        requests = 0
         self._total_writes += 1
         try:
             client = await self.get_client()
@@ -1101,46 +1586,71 @@ class VistaPoolModbusClient:
                 raise ModbusException(
                     f"Modbus client connection failed to {self._host}:{self._port}"
                 )
-            # Read current relay state
-            current_result = await modbus_acall(
-                client.read_input_registers, self._unit, address=addr, count=1
-            )
-            if current_result.isError():
-                raise ModbusException(
-                    f"Modbus read error from 0x{addr:04X}: {current_result}"
-                )
-            current = current_result.registers[0]
-            # Set or clear the aux bit
-            if on:
-                value = current | aux_bit
+            # Current relay state: reused while the last poll trusts it
+            if (
+                self._relay_state is not None
+                and start - self._relay_state[1] <= self._relay_state[2]
+            ):
+                current = self._relay_state[0]
+                self._aux_stats["cached_state_used"] += 1
             else:
-                value = current & ~aux_bit
-            await modbus_acall(
-                client.write_registers, self._unit, address=addr, values=[1]
-            )
-            await modbus_acall(
-                client.write_registers, self._unit, address=addr, values=[value]
-            )
+                current_result = await self._request(
+                    client.read_input_registers, address=addr, count=1
+                )
+                requests += 1
+                if current_result.isError():
+                    self._record_protocol_error(addr, current_result)
+                    raise ModbusProtocolError(
+                        f"Modbus read error from 0x{addr:04X}: {current_result}",
+                        addr,
+                        getattr(current_result, "exception_code", None),
+                    )
+                current = current_result.registers[0]
+            # Set or clear the aux bits
+            value = current
+            for relay_index, on in states.items():
+                if on:
+                    value |= AUX_BITMASKS[relay_index]
+                else:
+                    value &= ~AUX_BITMASKS[relay_index]
+            # The controller may change relays after the write, read them again
+            self._relay_state = None
+            for address, values in (
+                (addr, [1]),
+                (addr, [value]),
+                (_AUX_COMMIT_REGISTER, [0]),
+                (EXEC_REGISTER, [1]),
+            ):
+                result = await self._request(
+                    client.write_registers, address=address, values=values
+                )
+                requests += 1
+                if result.isError():
+                    self._record_protocol_error(address, result)
+                    raise ModbusProtocolError(
+                        f"Modbus write error at 0x{address:04X}: {result}",
+                        address,
+                        getattr(result, "exception_code", None),
+                    )
             _LOGGER.debug("Wrote relay state at 0x%04X: 0x%04X", addr, value)
-            await modbus_acall(
-                client.write_registers, self._unit, address=0x0289, values=[0]
-            )
-            await modbus_acall(
-                client.write_registers, self._unit, address=0x02F5, values=[1]
-            )
             self._successful_write_ops += 1
             self._successful_writes.append((f"0x{addr:04X}", time.time()))
+            self._aux_stats["toggles"] += len(states)
+            self._aux_stats["sequences"] += 1
 
         except Exception as e:
             self._failed_writes[f"0x{addr:04X}"] = (
                 self._failed_writes.get(f"0x{addr:04X}", 0) + 1
             )
+            await self._handle_request_error(e)
             raise ModbusException(
                 f"Modbus TCP AUX relay write failed at 0x{addr:04X}: {e}"
             ) from e
         finally:
             end = time.monotonic()
             self._write_response_times.append(end - start)
+            self._aux_stats["requests"] += requests
+            self._aux_times.append(end - start)
 
     async def read_all_timers(self, enabled_timers=None, force_read=None) -> dict:
         """Read timers with retry."""
@@ -1148,11 +1658,9 @@ class VistaPoolModbusClient:
             result = await self._perform_read_all_timers(enabled_timers, force_read)
             self._last_successful_operation = datetime.now()
             return result
-        except Exception:
+        except Exception as e:
             self._consecutive_errors += 1
-            async with self._client_lock:
-                await self._safe_close_client()
-                self._client = None
+            await self._handle_request_error(e)
             raise
 
     async def _perform_read_all_timers(
@@ -1171,6 +1679,12 @@ class VistaPoolModbusClient:
             set(enabled_timers) if enabled_timers is not None else set(TIMER_BLOCKS)
         )
         force_read = set(force_read or ()) & effective_timers
+        # Background verification (see _next_verification) of one timer block
+        self._verify_timers = frozenset(effective_timers)
+        verify = self._pending_timer_verification
+        self._pending_timer_verification = None
+        if verify in effective_timers:
+            force_read.add(verify)
 
         # Skip timer reads if the INSTALLER page has not changed since the last poll
         # and this is not a forced full read.
@@ -1191,63 +1705,135 @@ class VistaPoolModbusClient:
             raise ModbusException(
                 f"Modbus client connection failed to {self._host}:{self._port}"
             )
-        for name, addr in TIMER_BLOCKS.items():
+        # Use cache for non-forced timers when INSTALLER page hasn't changed
+        needed = [
+            name
+            for name in TIMER_BLOCKS
+            if name in effective_timers
+            and not (
+                can_use_cache and name not in force_read and name in self._cached_timers
+            )
+        ]
+        fresh = await self._read_timer_blocks(client, needed)
+        for name in TIMER_BLOCKS:
             if name not in effective_timers:
                 continue
-            # Use cache for non-forced timers when INSTALLER page hasn't changed
-            if can_use_cache and name not in force_read and name in self._cached_timers:
+            if name not in needed:
                 timers[name] = self._cached_timers[name]
-                continue
-            try:
-                rr = await modbus_acall(
-                    client.read_holding_registers, self._unit, address=addr, count=15
-                )
-            except Exception as e:
-                self._failed_reads[f"0x{addr:04X}"] = (
-                    self._failed_reads.get(f"0x{addr:04X}", 0) + 1
-                )
-                _LOGGER.error("Timer block read error at 0x%04X: %s", addr, e)
-                continue
-            if rr.isError():
-                self._failed_reads[f"0x{addr:04X}"] = (
-                    self._failed_reads.get(f"0x{addr:04X}", 0) + 1
-                )
-                _LOGGER.error("Modbus read error from 0x%04X: %s", addr, rr)
-                continue
-            _LOGGER.debug("Raw rr-%s from 0x%04X: %s", name, addr, rr.registers)
-            self._successful_addresses.append((f"0x{addr:04X}", time.time()))
-            timers[name] = parse_timer_block(rr.registers)
-            await asyncio.sleep(0.05)
+            elif name in fresh:
+                timers[name] = fresh[name]
+                if name == verify:
+                    self._check_verified(
+                        name, fresh[name], self._cached_timers.get(name)
+                    )
 
         end = time.monotonic()
         self._response_times.append(end - start)
         self._cached_timers.update(timers)
         return timers
 
+    async def _read_timer_blocks(self, client, names) -> dict:
+        """Read timer blocks and return the successfully parsed ones by name.
+
+        The blocks are contiguous: they are read in chunks of up to 31 registers
+        and the register image is sliced back into blocks of 15. A failed chunk
+        only drops the blocks it covers.
+        """
+        image: dict[int, int] = {}
+        for address, count in plan_timer_reads(names):
+            try:
+                registers = await self._read_register_ranges(
+                    client, [(address, count)], label="timers", priority=PRIORITY_TIMERS
+                )
+            except Exception as e:
+                _LOGGER.error("Timer region read error at 0x%04X: %s", address, e)
+                if await self._handle_request_error(e) == ERROR_TRANSPORT:
+                    break  # connection closed, the remaining chunks would fail too
+                continue
+            image.update(zip(range(address, address + count), registers))
+        timers = {}
+        for name in names:
+            addr = TIMER_BLOCKS[name]
+            block = [image.get(a) for a in range(addr, addr + TIMER_BLOCK_SIZE)]
+            if None in block:
+                continue  # (part of) the block was not read
+            timers[name] = parse_timer_block(block)
+            self._timer_epochs[name] = self._installer_epoch
+            self._cache_generation += 1
+        return timers
+
+    async def async_refresh_pages(self, pages=(), timers=()) -> tuple[dict, dict]:
+        """Re-read single configuration pages and timer blocks, e.g. after a write.
+
+        Returns (result, timers): the cached register image with the pages read
+        again and the derived values updated (see take_changed_keys), and the
+        timer blocks read again.
+        MEASURE and MBF_NOTIFICATION are left to the next regular poll.
+        """
+        pages = [page for page in _CONFIG_PAGE_NOTIFICATIONS if page in set(pages)]
+        start = time.monotonic()
+        try:
+            client = await self.get_client()
+            if client is None or not client.connected:  # pragma: no cover
+                raise ModbusException(
+                    f"Modbus client connection failed to {self._host}:{self._port}"
+                )
+            # Applied writes are committed first so the pages are read back
+            # after EXEC; a failed commit stays pending and is retried
+            await self._commit_scheduler.flush()
+            values = {}
+            for page in pages:
+                if self._page_plans[page][1]:
+                    values.update(await self._read_page(client, page))
+            fresh_timers = await self._read_timer_blocks(client, list(timers))
+        except Exception as e:
+            self._consecutive_errors += 1
+            await self._handle_request_error(e)
+            raise
+        finally:
+            self._response_times.append(time.monotonic() - start)
+        self._last_successful_operation = datetime.now()
+        self._store(values)
+        result = self._cached_result
+        self._store(self._decode_derived(result, "INSTALLER" in pages))
+        self._cached_timers.update(fresh_timers)
+        _LOGGER.debug("Refreshed pages %s and timers %s", pages, sorted(fresh_timers))
+        return result, fresh_timers
+
     async def write_timer(self, block_name, timer_data) -> bool:
         """Write register with retry."""
         try:
             result = await self._perform_write_timer(block_name, timer_data)
             self._last_successful_operation = datetime.now()
             return result
-        except Exception:
+        except Exception as e:
             self._consecutive_errors += 1
-            async with self._client_lock:
-                await self._safe_close_client()
-                self._client = None
+            await self._handle_request_error(e)
             raise
 
+    def _fresh_cached_timer(self, block_name) -> dict | None:
+        """Return the cached timer block if no INSTALLER change was seen since it was read."""
+        if self._full_read_due:
+            return None
+        if self._timer_epochs.get(block_name) != self._installer_epoch:
+            return None
+        return self._cached_timers.get(block_name)
+
     async def _perform_write_timer(self, block_name, timer_data) -> bool:
         """
         Writes only requested fields to a timer block. Preserves all other fields.
         Only update 'on' and 'interval' (and optionally other editable fields).
         Other values (enable, period, function, ...) are preserved as read.
+
+        A fresh cached block (see _fresh_cached_timer) replaces the read before
+        the write; then only the changed registers are written, unless they
+        span the registers the device updates itself. Nothing is written when
+        the requested values are already set.
         """
         addr = TIMER_BLOCKS[block_name]
         start = time.monotonic()
         self._total_writes += 1
 
-        # 1. Read current timer block from Modbus
         client = await self.get_client()
         try:
             if client is None or not client.connected:
@@ -1258,61 +1844,81 @@ class VistaPoolModbusClient:
                     "Modbus client connection failed to %s:%s", self._host, self._port
                 )
                 return False
-            rr = await modbus_acall(
-                client.read_holding_registers, self._unit, address=addr, count=15
-            )
-            if rr.isError():
-                self._failed_writes[f"0x{addr:04X}"] = (
-                    self._failed_writes.get(f"0x{addr:04X}", 0) + 1
-                )
-                _LOGGER.error(
-                    "Could not read timer block at 0x%04X before write: %s", addr, rr
-                )
-                return False
-            current_regs = rr.registers
-            current_data = parse_timer_block(current_regs)
-
-            # 2. Update only requested fields
-            for k, v in timer_data.items():
-                current_data[k] = v
 
-            # 3. Build block for write (preserve other fields)
-            regs = build_timer_block(current_data)
-            for idx, reg in enumerate(regs):
-                if not isinstance(reg, int):  # pragma: no cover
-                    _LOGGER.error("Register %d is not int: %r", idx, reg)
+            # 1. Current timer block: from the cache when fresh, else from Modbus
+            write_addr = None
+            cached = self._fresh_cached_timer(block_name)
+            if cached is not None:
+                current_regs = build_timer_block(cached)
+                regs = build_timer_block({**cached, **timer_data})
+                changed = [i for i, reg in enumerate(regs) if reg != current_regs[i]]
+                if not changed:
+                    self._timer_write_stats["skipped"] += 1
+                    _LOGGER.debug("Timer block %s already up to date", block_name)
+                    return True
+                first, last = changed[0], changed[-1]
+                if _VOLATILE_TIMER_OFFSETS.isdisjoint(range(first, last + 1)):
+                    self._timer_write_stats["from_cache"] += 1
+                    write_addr, regs = addr + first, regs[first : last + 1]
+            if write_addr is None:
+                rr = await self._request(
+                    client.read_holding_registers, address=addr, count=15
+                )
+                if rr.isError():
+                    self._failed_writes[f"0x{addr:04X}"] = (
+                        self._failed_writes.get(f"0x{addr:04X}", 0) + 1
+                    )
+                    self._record_protocol_error(addr, rr)
+                    _LOGGER.error(
+                        "Could not read timer block at 0x%04X before write: %s",
+                        addr,
+                        rr,
+                    )
+                    return False
+                current_regs = rr.registers
+                current_data = parse_timer_block(current_regs)
+
+                # 2. Update only requested fields
+                for k, v in timer_data.items():
+                    current_data[k] = v
+
+                # 3. Build block for write (preserve other fields)
+                regs = build_timer_block(current_data)
+                for idx, reg in enumerate(regs):
+                    if not isinstance(reg, int):  # pragma: no cover
+                        _LOGGER.error("Register %d is not int: %r", idx, reg)
+                if regs == list(current_regs):
+                    self._write_through(addr, regs)
+                    self._timer_write_stats["skipped"] += 1
+                    _LOGGER.debug("Timer block %s already up to date", block_name)
+                    return True
+                self._timer_write_stats["read_first"] += 1
+                write_addr = addr
 
             _LOGGER.debug(
-                "Timer block %s (0x%04X) to write: %s", block_name, addr, regs
+                "Timer block %s (0x%04X) to write at 0x%04X: %s",
+                block_name,
+                addr,
+                write_addr,
+                regs,
             )
 
-            # 4. Write full block back to Modbus
-            if client is None or not client.connected:  # pragma: no cover
-                _LOGGER.error(
-                    "Modbus client connection failed to %s:%s", self._host, self._port
-                )
-                return False
-            result = await modbus_acall(
-                client.write_registers, self._unit, address=addr, values=regs
+            # 4. Write the block (or its changed registers) back to Modbus
+            result = await self._request(
+                client.write_registers, address=write_addr, values=regs
             )
             if result.isError():
                 self._failed_writes[f"0x{addr:04X}"] = (
                     self._failed_writes.get(f"0x{addr:04X}", 0) + 1
                 )
+                self._record_protocol_error(addr, result)
                 _LOGGER.error("Timer block write error at 0x%04X: %s", addr, result)
                 return False
 
             _LOGGER.debug("Wrote timer block %s (0x%04X): %s", block_name, addr, regs)
-            await asyncio.sleep(0.1)
-            # Write to EEPROM and execute
-            await modbus_acall(
-                client.write_registers, self._unit, address=0x02F0, values=[1]
-            )
-            await asyncio.sleep(0.1)
-            await modbus_acall(
-                client.write_registers, self._unit, address=0x02F5, values=[1]
-            )
-            await asyncio.sleep(0.1)
+            self._write_through(write_addr, regs)
+            # Write to EEPROM and execute (deferred, coalesced with other writes)
+            self._commit_scheduler.mark_dirty()
 
             self._successful_write_ops += 1
             self._successful_writes.append((f"0x{addr:04X}", time.time()))
@@ -1341,6 +1947,7 @@ class VistaPoolModbusClient:
             "host": self._host,
             "port": self._port,
             "unit_id": self._unit,
+            "transport": self._transport,
             "connected": getattr(self._client, "connected", False),
             "total_operations": self._total_operations,
             "successful_operations": self._successful_operations,
@@ -1375,4 +1982,33 @@ class VistaPoolModbusClient:
             "write_average_response_time": self._calculate_avg_write_response_time(),
             "failed_writes_by_address": dict(self._failed_writes),
             "last_successful_writes": list(self._successful_writes),
+            "errors_by_class": dict(self._error_counts),
+            "partial_reads": self._partial_reads,
+            "last_failed_pages": list(self._last_failed_pages),
+            "rejected_ranges": dict(self._rejected_ranges),
+            "verification": {
+                "window": self._verify_window,
+                "last_item": self._last_verified,
+                "changed_items": self._changed_verifications,
+            },
+            "request_pacing": self._pacer.stats,
+            "request_scheduling": self._scheduler.stats,
+            "timer_writes": dict(self._timer_write_stats),
+            "aux_relay_writes": {
+                **self._aux_stats,
+                "requests_per_toggle": (
+                    round(self._aux_stats["requests"] / self._aux_stats["toggles"], 2)
+                    if self._aux_stats["toggles"]
+                    else None
+                ),
+                "average_time": (
+                    round(sum(self._aux_times) / len(self._aux_times), 4)
+                    if self._aux_times
+                    else None
+                ),
+            },
+            "eeprom_commits": self._commit_scheduler.stats,
+            "fc20_filter": (
+                self._fc20_splitter.stats if self._fc20_splitter is not None else None
+            ),
         }
@@ -228,14 +228,13 @@ class VistaPoolNumber(VistaPoolEntity, NumberEntity):
                 HEATING_SETPOINT_REGISTER,
                 INTELLIGENT_SETPOINT_REGISTER,
             ):
-                # Write both sequentially to ensure both modes share same target
-                await client.async_write_register(HEATING_SETPOINT_REGISTER, raw)
-                await client.async_write_register(
-                    INTELLIGENT_SETPOINT_REGISTER, raw, apply=True
-                )
+                # Write both in one transaction so both modes share same target
+                async with client.transaction(apply=True) as tx:
+                    tx.write(HEATING_SETPOINT_REGISTER, raw)
+                    tx.write(INTELLIGENT_SETPOINT_REGISTER, raw)
             else:
                 await client.async_write_register(self._register, raw, apply=True)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_registers(self._register)
         except asyncio.CancelledError:  # pragma: no cover
             pass
 
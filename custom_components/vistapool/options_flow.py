@@ -23,7 +23,11 @@ from homeassistant.const import CONF_NAME
 from homeassistant.helpers.selector import SelectSelector, SelectSelectorConfig
 from homeassistant.util import slugify
 
-from .const import DEFAULT_SCAN_INTERVAL, DEFAULT_TIMER_RESOLUTION
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TIMER_RESOLUTION,
+    DEFAULT_VERIFY_INTERVAL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,6 +70,14 @@ class VistaPoolOptionsFlowHandler(config_entries.OptionsFlow):
             ): SelectSelector(
                 SelectSelectorConfig(options=[str(v) for v in [1, 5, 10, 15, 30, 60]])
             ),
+            vol.Optional(
+                "verify_interval",
+                default=str(options.get("verify_interval", DEFAULT_VERIFY_INTERVAL)),
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=[str(v) for v in [10, 15, 30, 60, 120, 240]]
+                )
+            ),
             vol.Optional(
                 "measure_when_filtration_off",
                 default=options.get("measure_when_filtration_off", False),
@@ -122,7 +134,7 @@ class VistaPoolOptionsFlowHandler(config_entries.OptionsFlow):
 
         if user_input is not None:
             # Coerce selector string values back to int before saving
-            for _key in ("scan_interval", "timer_resolution"):
+            for _key in ("scan_interval", "timer_resolution", "verify_interval"):
                 if _key in user_input:
                     user_input[_key] = int(user_input[_key])
             if (user_input.get("unlock_advanced") or "").strip() == expected:
@@ -0,0 +1,127 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""VistaPool Integration for Home Assistant - Adaptive Modbus request pacing"""
+
+import asyncio
+import time
+
+# Gap used before anything is known about the gateway (the former fixed delay)
+INITIAL_GAP = 0.05
+# Upper bound for the gap after repeated errors
+MAX_GAP = 1.0
+# Smallest gap applied after an error or collision, before doubling
+BACKOFF_STEP = 0.05
+# On success the gap shrinks by this factor towards the turnaround floor
+SHRINK_FACTOR = 0.5
+# Gaps below this are treated as zero (no sleep at all)
+MIN_SLEEP = 0.001
+# Slow (serial) links keep a quiet time proportional to their turnaround
+TURNAROUND_FACTOR = 0.25
+# Smoothing of the turnaround and error-rate moving averages
+EWMA_ALPHA = 0.2
+
+
+class AdaptivePacer:
+    """Adaptive gap between consecutive Modbus requests to one gateway.
+
+    The gap starts at INITIAL_GAP and halves on every successful request, down to
+    a floor derived from the measured request turnaround. Fast Ethernet-attached
+    gateways therefore end up with no delay at all, while RS485 gateways keep a
+    short quiet time on the bus. Timeouts, errors and FC20 broadcasts colliding
+    with a pending request double the gap again (up to MAX_GAP).
+    """
+
+    def __init__(self, initial_gap: float = INITIAL_GAP, max_gap: float = MAX_GAP):
+        self._gap = initial_gap
+        self._max_gap = max_gap
+        self._turnaround: float | None = None  # EWMA of request turnaround [s]
+        self._error_rate = 0.0  # EWMA of failed requests (0..1)
+        self._sent_at: float | None = None
+        self._last_done: float | None = None
+        self.requests = 0
+        self.errors = 0
+        self.collisions = 0
+
+    @property
+    def gap(self) -> float:
+        """Current gap between the end of one request and the next one [s]."""
+        return self._gap
+
+    @property
+    def in_flight(self) -> bool:
+        """Whether a request is waiting for its response."""
+        return self._sent_at is not None
+
+    async def wait(self) -> None:
+        """Sleep for whatever remains of the gap, then mark a request as sent."""
+        if self._last_done is not None and self._gap >= MIN_SLEEP:
+            remaining = self._last_done + self._gap - time.monotonic()
+            if remaining >= MIN_SLEEP:
+                await asyncio.sleep(remaining)
+        self._sent_at = time.monotonic()
+        self.requests += 1
+
+    def record_success(self) -> None:
+        """Register a response and shrink the gap towards the turnaround floor."""
+        now = time.monotonic()
+        if self._sent_at is not None:
+            turnaround = now - self._sent_at
+            self._turnaround = (
+                turnaround
+                if self._turnaround is None
+                else self._turnaround + EWMA_ALPHA * (turnaround - self._turnaround)
+            )
+        self._error_rate *= 1 - EWMA_ALPHA
+        floor = min((self._turnaround or 0.0) * TURNAROUND_FACTOR, self._max_gap)
+        gap = self._gap * SHRINK_FACTOR
+        self._gap = max(floor, gap if gap >= MIN_SLEEP else 0.0)
+        self._sent_at = None
+        self._last_done = now
+
+    def record_error(self) -> None:
+        """Register a failed request (timeout, exception response) and back off."""
+        self.errors += 1
+        self._error_rate += EWMA_ALPHA * (1 - self._error_rate)
+        self._back_off()
+        self._sent_at = None
+        self._last_done = time.monotonic()
+
+    def record_collision(self) -> None:
+        """Register an FC20 broadcast; back off if it hit a pending request."""
+        self.collisions += 1
+        if self.in_flight:
+            self._back_off()
+
+    def reset_connection(self) -> None:
+        """Forget per-connection timing (learned gap and averages are kept)."""
+        self._sent_at = None
+        self._last_done = None
+
+    def _back_off(self) -> None:
+        self._gap = min(self._max_gap, max(self._gap * 2, BACKOFF_STEP))
+
+    @property
+    def stats(self) -> dict:
+        """Return pacing statistics for diagnostics."""
+        return {
+            "gap": round(self._gap, 4),
+            "average_turnaround": (
+                round(self._turnaround, 4) if self._turnaround is not None else None
+            ),
+            "error_rate": round(self._error_rate, 3),
+            "requests": self.requests,
+            "errors": self.errors,
+            "fc20_collisions": self.collisions,
+        }
@@ -0,0 +1,503 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+VistaPool Integration for Home Assistant - Register Map
+
+This module contains the declarative NeoPool register map used by the Modbus client.
+Every decoded register is described once (address, page, scale, sign, width) and
+a small planner compiles the table into the minimal set of read requests per page,
+respecting the device limit of 31 registers per request. PageDecoder compiles the
+same table against a read plan into the decoder run on every response, and
+RegisterSnapshot keeps the raw responses with the values decoded from them.
+"""
+
+from array import array
+from typing import NamedTuple
+
+from .const import CAPABILITY_KEYS, TIMER_BLOCKS
+from .helpers import modbus_regs_to_ascii
+
+# WARNING: Device limit for reading registers is 31 at one request!
+MAX_READ_COUNT = 31
+
+# Largest run of unused registers that is still read through instead of splitting
+# the request. Each extra request costs a full bus turnaround plus ~13 bytes of
+# framing on RTU, while bridging 8 registers costs 16 bytes of payload.
+MAX_READ_GAP = 8
+
+# Every timer block (const.TIMER_BLOCKS) is 15 holding registers
+TIMER_BLOCK_SIZE = 15
+
+# Modbus function codes used for reading
+FC_READ_HOLDING = 0x03
+FC_READ_INPUT = 0x04
+
+# Register kinds
+KIND_UINT = "uint"  # single register, optionally signed/scaled
+KIND_LIST = "list"  # raw list of `width` registers
+KIND_ASCII = "ascii"  # ASCIIZ string packed into `width` registers
+
+
+class PageSpec(NamedTuple):
+    """Register page: function code used for reading and log label."""
+
+    function_code: int
+    label: str
+
+
+class RegisterSpec(NamedTuple):
+    """Single decoded entry of the register map."""
+
+    key: str
+    address: int
+    page: str
+    divisor: float | None = None  # value / divisor (e.g. 100.0 for 1/100 units)
+    offset: int = 0  # value + offset (applied after the divisor)
+    signed: bool = False  # interpret as 16-bit two's complement
+    width: int = 1  # number of registers (KIND_LIST / KIND_ASCII)
+    kind: str = KIND_UINT
+
+
+# Page order is also the read order used by the client: MEASURE always comes
+# first because it carries MBF_NOTIFICATION (0x0110).
+# fmt: off
+PAGES: dict[str, PageSpec] = {
+    "MEASURE":   PageSpec(FC_READ_INPUT, "rr01"),    # 0x01xx  Measurements (hydrolysis current, pH, redox, ...)
+    "MODBUS":    PageSpec(FC_READ_HOLDING, "rr00"),  # 0x00xx  General configuration of the box, reserved for internal purposes
+    "GLOBAL":    PageSpec(FC_READ_HOLDING, "rr02"),  # 0x02xx  Global information, e.g. runtime of each power unit
+    "FACTORY":   PageSpec(FC_READ_HOLDING, "rr03"),  # 0x03xx  Factory data such as calibration parameters
+    "INSTALLER": PageSpec(FC_READ_HOLDING, "rr04"),  # 0x04xx  Installation config (relay functions, pump times, ...)
+    "USER":      PageSpec(FC_READ_HOLDING, "rr05"),  # 0x05xx  User config (production levels, set points)
+    "MISC":      PageSpec(FC_READ_HOLDING, "rr06"),  # 0x06xx  Screen controller config (language, colours, sound, ...)
+}
+# fmt: on
+
+# fmt: off
+REGISTER_MAP: tuple[RegisterSpec, ...] = (
+    # ── MEASURE (FC04) ───────────────────────────────────────────────────────────
+    # Example: [0, 0, 820, 709, 0, 0, 140, 50560, 49536, 1280, 1280, 0, 8192, 16928, 0, 0, 9, 0]
+    RegisterSpec("MBF_ION_CURRENT", 0x0100, "MEASURE"),                         # Ionization level measured
+    RegisterSpec("MBF_HIDRO_CURRENT", 0x0101, "MEASURE", divisor=10.0),         # Hydrolysis intensity level
+    RegisterSpec("MBF_MEASURE_PH", 0x0102, "MEASURE", divisor=100.0),           # ph     pH level measured in 1/100 (700 = 7.00)
+    RegisterSpec("MBF_MEASURE_RX", 0x0103, "MEASURE"),                          # mV     Redox level measured in mV
+    RegisterSpec("MBF_MEASURE_CL", 0x0104, "MEASURE", divisor=100.0),           # ppm    Chlorine level measured in 1/100 ppm (100 = 1.00 ppm)
+    RegisterSpec("MBF_MEASURE_CONDUCTIVITY", 0x0105, "MEASURE"),                # %      Conductivity level measured in %
+    RegisterSpec("MBF_MEASURE_TEMPERATURE", 0x0106, "MEASURE", divisor=10.0),   # °C     Temperature sensor measured in 1/10° C (100 = 10.0°C)
+    RegisterSpec("MBF_PH_STATUS", 0x0107, "MEASURE"),                           # mask   Status of the pH-module
+    RegisterSpec("MBF_RX_STATUS", 0x0108, "MEASURE"),                           # mask   Status of the Rx-module
+    RegisterSpec("MBF_CL_STATUS", 0x0109, "MEASURE"),                           # mask   Status of the Chlorine-module
+    RegisterSpec("MBF_CD_STATUS", 0x010A, "MEASURE"),                           # mask   Status of the Conductivity-module
+    RegisterSpec("MBF_ION_STATUS", 0x010C, "MEASURE"),                          # mask   Status of the Ionization-module
+    RegisterSpec("MBF_HIDRO_STATUS", 0x010D, "MEASURE"),                        # mask   Status of the Hydrolysis-module
+    RegisterSpec("MBF_RELAY_STATE", 0x010E, "MEASURE"),                         # mask   Status of each configurable relay
+    RegisterSpec("MBF_HIDRO_SWITCH_VALUE", 0x010F, "MEASURE"),                  # INTERNAL - contains the opening of the hydrolysis PWM.
+    RegisterSpec("MBF_NOTIFICATION", 0x0110, "MEASURE"),                        # mask   Bit field that informs whether a property page has changed since the last time it was queried (see MBMSK_NOTIF_*).
+    RegisterSpec("MBF_HIDRO_VOLTAGE", 0x0111, "MEASURE", divisor=10.0),         # The voltage applied to the hydrolysis cell (in 1/10 V). Together with MBF_HIDRO_CURRENT allows extrapolation of water salinity.
+
+    # ── MODBUS ───────────────────────────────────────────────────────────────────
+    # Example: [1, 3, 1280, 32768, 88, 47, 16707, 20497, 8248, 12592, 0, 0, 0, 22069, 0]
+    RegisterSpec("MBF_POWER_MODULE_VERSION", 0x0002, "MODBUS"),                 # ! Power module version (MSB=Major, LSB=Minor)
+    RegisterSpec("MBF_POWER_MODULE_NODEID", 0x0004, "MODBUS", width=6, kind=KIND_LIST),  # ! Power module Node ID (6 register 0x0004 - 0x0009)
+    RegisterSpec("MBF_POWER_MODULE_REGISTER", 0x000C, "MODBUS"),                # ! Writing an address in this register causes the power module register address to be read out into MBF_POWER_MODULE_DATA, see MBF_POWER_MODULE_REG_*
+    RegisterSpec("MBF_POWER_MODULE_DATA", 0x000D, "MODBUS"),                    # ! power module data as requested in MBF_POWER_MODULE_REGISTER
+    # Prepared for future use:
+    # RegisterSpec("MBF_VOLT_24_36", 0x0022, "MODBUS"),                         # ! Current 24-36V line in mV
+    # RegisterSpec("MBF_VOLT_12", 0x0023, "MODBUS"),                            # ! Current 12V line in mV
+    # RegisterSpec("MBF_VOLT_5", 0x006A, "MODBUS"),                             # ! 5V line in mV / 0,62069
+    # RegisterSpec("MBF_AMP_4_20_MICRO", 0x0072, "MODBUS"),                     # ! 2-40mA line in µA * 10 (1=0,01mA)
+
+    # ── GLOBAL ───────────────────────────────────────────────────────────────────
+    # Example: [23971, 8, 23971, 8, 26922, 0, 34208, 0, 0, 65426, 0, 0, 0, 0, 64136, 3, 25371, 4, 16, 0]
+    RegisterSpec("MBF_CELL_RUNTIME_LOW", 0x0206, "GLOBAL"),                     # ! Cell runtime (32 bit value - low word)
+    RegisterSpec("MBF_CELL_RUNTIME_HIGH", 0x0207, "GLOBAL"),                    # ! Cell runtime (32 bit value - high word)
+    RegisterSpec("MBF_CELL_RUNTIME_PART_LOW", 0x0208, "GLOBAL"),                # ! Cell part runtime (32 bit value - low word)
+    RegisterSpec("MBF_CELL_RUNTIME_PART_HIGH", 0x0209, "GLOBAL"),               # ! Cell part runtime (32 bit value - high word)
+    RegisterSpec("MBF_CELL_BOOST", 0x020C, "GLOBAL"),                           # mask   ! Boost control (see MBMSK_CELL_BOOST_*)
+    RegisterSpec("MBF_CELL_RUNTIME_POLA_LOW", 0x0214, "GLOBAL"),                # ! Cell runtime polarity 1 (32 bit value - low word)
+    RegisterSpec("MBF_CELL_RUNTIME_POLA_HIGH", 0x0215, "GLOBAL"),               # ! Cell runtime polarity 1 (32 bit value - high word)
+    RegisterSpec("MBF_CELL_RUNTIME_POLB_LOW", 0x0216, "GLOBAL"),                # ! Cell runtime polarity 2 (32 bit value - low word)
+    RegisterSpec("MBF_CELL_RUNTIME_POLB_HIGH", 0x0217, "GLOBAL"),               # ! Cell runtime polarity 2 (32 bit value - high word)
+    RegisterSpec("MBF_CELL_RUNTIME_POL_CHANGES_LOW", 0x0218, "GLOBAL"),         # ! Cell runtime polarity change count (32 bit value - low word)
+    RegisterSpec("MBF_CELL_RUNTIME_POL_CHANGES_HIGH", 0x0219, "GLOBAL"),        # ! Cell runtime polarity change count (32 bit value - high word)
+    RegisterSpec("MBF_HIDRO_MODULE_VERSION", 0x0280, "GLOBAL"),                 # ! Hydrolysis module version
+    RegisterSpec("MBF_HIDRO_MODULE_CONNECTIVITY", 0x0281, "GLOBAL"),            # ! Hydrolysis module connection quality (in myriad: 0..10000)
+
+    # ── FACTORY ──────────────────────────────────────────────────────────────────
+    # Example: [2055, 10, 0, 0, 0, 0, 1000, 50, 0, 14687, 2600, 2, 1297, 125, 2, 100, 100]
+    RegisterSpec("MBF_PAR_VERSION", 0x0300, "FACTORY"),                         # Software version of the PowerBox
+    RegisterSpec("MBF_PAR_MODEL", 0x0301, "FACTORY"),                           # mask   System model options
+    RegisterSpec("MBF_PAR_SERNUM", 0x0302, "FACTORY"),                          # Serial number of the PowerBox
+    RegisterSpec("MBF_PAR_ION_NOM", 0x0303, "FACTORY"),                         # Ionization maximum production level (DO NOT WRITE!)
+    RegisterSpec("MBF_PAR_HIDRO_NOM", 0x0306, "FACTORY", divisor=10.0),         # Hydrolysis maximum production level: 100 in percent mode, otherwise max production in g/h (DO NOT WRITE!)
+    RegisterSpec("MBF_PAR_HIDRO_NOM2", 0x0307, "FACTORY"),                      # Hydrolysis maximum production level in g/h units (DO NOT WRITE!), probably used only in g/h production mode.
+    RegisterSpec("MBF_PAR_SAL_AMPS", 0x030A, "FACTORY"),                        # Current command in regulation for which we are going to measure voltage
+    RegisterSpec("MBF_PAR_SAL_CELLK", 0x030B, "FACTORY"),                       # Relationship between the measured resistance and its equivalence in g / l (grams per liter)
+    RegisterSpec("MBF_PAR_SAL_TCOMP", 0x030C, "FACTORY"),                       # Deviation in temperature from the conductivity.
+    RegisterSpec("MBF_PAR_HIDRO_MAX_VOLTAGE", 0x0322, "FACTORY"),               # Maximum cell voltage of the hydrolysis current regulation in 1/10 V (default 80 = 8 V)
+    RegisterSpec("MBF_PAR_HIDRO_FLOW_SIGNAL", 0x0323, "FACTORY"),               # Operation of the hydrolysis flow detection signal (see MBV_PAR_HIDRO_FLOW_SIGNAL*), default 0 (standard detection).
+    RegisterSpec("MBF_PAR_HIDRO_MAX_PWM_STEP_UP", 0x0324, "FACTORY"),           # PWM ramp up of the hydrolysis in pulses per duty cycle. Default 150
+    RegisterSpec("MBF_PAR_HIDRO_MAX_PWM_STEP_DOWN", 0x0325, "FACTORY"),         # PWM down ramp of the hydrolysis in pulses per duty cycle. Default 20
+
+    # ── INSTALLER ────────────────────────────────────────────────────────────────
+    # 0x0434–0x04E7 are TIMER_BLOCKS, read separately via read_all_timers().
+    # Example: [9861, 26670, 1, 0, 0, 0, 0, 1, 3, 1, 2, 0, 0, 0, 25, 0, 25, 10, 0, 0, 28, 480, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+    RegisterSpec("MBF_PAR_TIME_LOW", 0x0408, "INSTALLER"),                      # System timestamp as unix timestamp (32 bit value - low word).
+    RegisterSpec("MBF_PAR_TIME_HIGH", 0x0409, "INSTALLER"),                     # System timestamp as unix timestamp (32 bit value - high word).
+    RegisterSpec("MBF_PAR_PH_ACID_RELAY_GPIO", 0x040A, "INSTALLER"),            # Relay number assigned to the acid pump function (only with pH module).
+    RegisterSpec("MBF_PAR_PH_BASE_RELAY_GPIO", 0x040B, "INSTALLER"),            # Relay number assigned to the base pump function (only with pH module).
+    RegisterSpec("MBF_PAR_RX_RELAY_GPIO", 0x040C, "INSTALLER"),                 # Relay number assigned to the Redox level regulation function. 0 = no relay assigned (no pump function)
+    RegisterSpec("MBF_PAR_CL_RELAY_GPIO", 0x040D, "INSTALLER"),                 # Relay number assigned to the chlorine pump function (only with free chlorine measuring modules).
+    RegisterSpec("MBF_PAR_CD_RELAY_GPIO", 0x040E, "INSTALLER"),                 # Relay number assigned to the conductivity (brine) pump function (only with conductivity measurement modules).
+    RegisterSpec("MBF_PAR_TEMPERATURE_ACTIVE", 0x040F, "INSTALLER"),            # Indicates whether the equipment has a temperature measurement or not.
+    RegisterSpec("MBF_PAR_LIGHTING_GPIO", 0x0410, "INSTALLER"),                 # Relay number assigned to the lighting function. 0: inactive.
+    RegisterSpec("MBF_PAR_FILT_MODE", 0x0411, "INSTALLER"),                     # Filtration mode (see MBV_PAR_FILT_*)
+    RegisterSpec("MBF_PAR_FILT_GPIO", 0x0412, "INSTALLER"),                     # Relay selected to perform the filtering function (default relay 2). 0 = the equipment does not control the filtration.
+    RegisterSpec("MBF_PAR_FILT_MANUAL_STATE", 0x0413, "INSTALLER"),             # Filtration status in manual mode (on = 1; off = 0)
+    RegisterSpec("MBF_PAR_HEATING_MODE", 0x0414, "INSTALLER"),                  # Heating mode: 0 = the equipment is not heated. 1 = the equipment is heating.
+    RegisterSpec("MBF_PAR_HEATING_GPIO", 0x0415, "INSTALLER"),                  # Relay number assigned to the heating function (default relay 7). 0 = the equipment does not control the heating.
+    RegisterSpec("MBF_PAR_HEATING_TEMP", 0x0416, "INSTALLER"),                  # Heating mode: Heating setpoint temperature
+    RegisterSpec("MBF_PAR_CLIMA_ONOFF", 0x0417, "INSTALLER"),                   # Activation of the climate mode (0 = inactive, 1 = active).
+    RegisterSpec("MBF_PAR_SMART_TEMP_HIGH", 0x0418, "INSTALLER"),               # Smart mode: Upper temperature
+    RegisterSpec("MBF_PAR_SMART_TEMP_LOW", 0x0419, "INSTALLER"),                # Smart mode: Lower temperature
+    RegisterSpec("MBF_PAR_SMART_ANTI_FREEZE", 0x041A, "INSTALLER"),             # Smart mode: Antifreeze mode activated (1) or not (0).
+    RegisterSpec("MBF_PAR_SMART_INTERVAL_REDUCTION", 0x041B, "INSTALLER"),      # Smart mode: read-only percentage (0 to 100%) applied to the nominal filtration time.
+    RegisterSpec("MBF_PAR_INTELLIGENT_TEMP", 0x041C, "INSTALLER"),              # Intelligent mode: Setpoint temperature
+    RegisterSpec("MBF_PAR_INTELLIGENT_FILT_MIN_TIME", 0x041D, "INSTALLER"),     # Intelligent mode: Minimum filtration time in minutes
+    RegisterSpec("MBF_PAR_INTELLIGENT_BONUS_TIME", 0x041E, "INSTALLER"),        # Intelligent mode: Bonus time for the current set of intervals
+    RegisterSpec("MBF_PAR_INTELLIGENT_TT_NEXT_INTERVAL", 0x041F, "INSTALLER"),  # Intelligent mode: Time to next filtration interval (reloaded with 2x3600 when it reaches 0)
+    RegisterSpec("MBF_PAR_INTELLIGENT_INTERVALS", 0x0420, "INSTALLER"),         # Intelligent mode: Number of started intervals (reset to 0 at 12)
+    RegisterSpec("MBF_PAR_FILTRATION_STATE", 0x0421, "INSTALLER"),              # Filtration state: 0 is off and 1 is on.
+    RegisterSpec("MBF_PAR_HEATING_DELAY_TIME", 0x0422, "INSTALLER"),            # Internal counter in seconds before the heating is enabled (at 60 seconds).
+    RegisterSpec("MBF_PAR_FILTERING_TIME_LOW", 0x0423, "INSTALLER"),            # Internal timer for the intelligent filtering mode (32-bit value - low word).
+    RegisterSpec("MBF_PAR_FILTERING_TIME_HIGH", 0x0424, "INSTALLER"),           # Internal timer for the intelligent filtering mode (32-bit value - high word)
+    RegisterSpec("MBF_PAR_INTELLIGENT_INTERVAL_TIME_LOW", 0x0425, "INSTALLER"), # Internal timer of the intelligent mode filtration interval (32-bit value - low word).
+    RegisterSpec("MBF_PAR_INTELLIGENT_INTERVAL_TIME_HIGH", 0x0426, "INSTALLER"),# Internal timer of the intelligent mode filtration interval (32-bit value - high word)
+    RegisterSpec("MBF_PAR_UV_MODE", 0x0427, "INSTALLER"),                       # UV mode active or not - see MBV_PAR_UV_MODE*.
+    RegisterSpec("MBF_PAR_UV_HIDE_WARN", 0x0428, "INSTALLER"),                  # mask   Suppression for warning messages in the UV mode (see MBMSK_UV_HIDE_WARN_*)
+    RegisterSpec("MBF_PAR_UV_RELAY_GPIO", 0x0429, "INSTALLER"),                 # Relay number assigned to the UV function.
+    RegisterSpec("MBF_PAR_PH_PUMP_REP_TIME_ON", 0x042A, "INSTALLER"),           # mask   Time that the pH pump will be turned on in the repetitive mode (see MBMSK_PH_PUMP_*).
+    RegisterSpec("MBF_PAR_PH_PUMP_REP_TIME_OFF", 0x042B, "INSTALLER"),          # mask   Time that the pH pump will be turned off in the repetitive mode.
+    RegisterSpec("MBF_PAR_HIDRO_COVER_ENABLE", 0x042C, "INSTALLER"),            # mask   Options for the hydrolysis/electrolysis module (see MBMSK_HIDRO_*)
+    RegisterSpec("MBF_PAR_HIDRO_COVER_REDUCTION", 0x042D, "INSTALLER"),         # LSB = Percentage for the cover reduction, MSB = Temperature level for the hydrolysis shutdown
+    RegisterSpec("MBF_PAR_PUMP_RELAY_TIME_OFF", 0x042E, "INSTALLER"),           # Off time of the dosing pumps (except pH) in the temporized pump mode.
+    RegisterSpec("MBF_PAR_PUMP_RELAY_TIME_ON", 0x042F, "INSTALLER"),            # On time of the dosing pumps (except pH) in the temporized pump mode.
+    RegisterSpec("MBF_PAR_RELAY_PH", 0x0430, "INSTALLER"),                      # pH regulation configuration (see MBV_PAR_RELAY_PH_*)
+    RegisterSpec("MBF_PAR_RELAY_MAX_TIME", 0x0431, "INSTALLER"),                # Maximum time in seconds a dosing pump can operate before raising an alarm.
+    RegisterSpec("MBF_PAR_RELAY_MODE", 0x0432, "INSTALLER"),                    # Behavior of the system when the dosing time is exceeded (see MBMSK_PAR_RELAY_MODE_*)
+    RegisterSpec("MBF_PAR_RELAY_ACTIVATION_DELAY", 0x0433, "INSTALLER", offset=10),  # pH pump delay in seconds; the system internally adds an extra 10 seconds.
+    RegisterSpec("MBF_PAR_FILTVALVE_ENABLE", 0x04E8, "INSTALLER"),              # Filter cleaning mode (0 = off, 1 = Besgo valve)
+    RegisterSpec("MBF_PAR_FILTVALVE_MODE", 0x04E9, "INSTALLER"),                # Filter cleaning valve timing mode (MBV_PAR_CTIMER_ENABLED/ALWAYS_ON/ALWAYS_OFF)
+    RegisterSpec("MBF_PAR_FILTVALVE_GPIO", 0x04EA, "INSTALLER"),                # Relay assigned to the filter cleaning function
+    RegisterSpec("MBF_PAR_FILTVALVE_PERIOD_MINUTES", 0x04ED, "INSTALLER"),      # Period in minutes between cleaning actions
+    RegisterSpec("MBF_PAR_FILTVALVE_INTERVAL", 0x04EE, "INSTALLER"),            # Cleaning action duration in seconds
+    RegisterSpec("MBF_PAR_FILTVALVE_REMAINING", 0x04EF, "INSTALLER"),           # Remaining backwash time in seconds (> 0 = backwash active)
+
+    # ── USER ─────────────────────────────────────────────────────────────────────
+    # Example: [650, 0, 750, 700, 0, 0, 700, 0, 100, 0, 0, 0, 5000, 0]
+    RegisterSpec("MBF_PAR_HIDRO", 0x0502, "USER", divisor=10.0),                # Hydrolisis target production level
+    RegisterSpec("MBF_PAR_PH1", 0x0504, "USER", divisor=100.0),                 # Higher limit of the pH regulation system
+    RegisterSpec("MBF_PAR_PH2", 0x0505, "USER", divisor=100.0),                 # Lower limit of the pH regulation system
+    RegisterSpec("MBF_PAR_RX1", 0x0508, "USER"),                                # Set point for the redox regulation system
+    RegisterSpec("MBF_PAR_CL1", 0x050A, "USER", divisor=100.0),                 # Set point for the chlorine regulation system
+    RegisterSpec("MBF_PAR_FILTRATION_CONF", 0x050F, "USER"),                    # mask   ! filtration type and speed
+
+    # ── MISC ─────────────────────────────────────────────────────────────────────
+    # Example: [9, 6, 25604, 5, 0, 2240, 545, 1281, 0, 0, 0, 0, 0, 0, 0, 0]
+    RegisterSpec("MBF_PAR_UICFG_MACHINE", 0x0600, "MISC"),                      # Machine type (see MBV_PAR_MACH_* and kNeoPoolMachineNames[])
+    RegisterSpec("MBF_PAR_UICFG_LANGUAGE", 0x0601, "MISC"),                     # Selected language (see MBV_PAR_LANG_*)
+    RegisterSpec("MBF_PAR_UICFG_BACKLIGHT", 0x0602, "MISC"),                    # Display backlight function (see MBV_PAR_BACKLIGHT_*)
+    RegisterSpec("MBF_PAR_UICFG_SOUND", 0x0603, "MISC"),                        # mask   Audible alerts (see MBMSK_PAR_SOUND_*)
+    RegisterSpec("MBF_PAR_UICFG_PASSWORD", 0x0604, "MISC"),                     # System password encoded in BCD
+    RegisterSpec("MBF_PAR_UICFG_VISUAL_OPTIONS", 0x0605, "MISC"),               # mask   Display options for the user interface menus
+    RegisterSpec("MBF_PAR_UICFG_VISUAL_OPTIONS_EXT", 0x0606, "MISC"),           # mask   Additional display options for the user interface menus (see MBMSK_VOE_*)
+    RegisterSpec("MBF_PAR_UICFG_MACH_VISUAL_STYLE", 0x0607, "MISC"),            # mask   Expansion of MBF_PAR_UICFG_MACHINE and MBF_PAR_UICFG_VISUAL_OPTIONS (colour style, MBMSK_VS_FORCE_UNITS_*, MBMSK_ELECTROLISIS)
+    RegisterSpec("MBF_PAR_UICFG_MACH_NAME_BOLD", 0x0608, "MISC", width=4, kind=KIND_ASCII),   # Machine name bold part (ASCIIZ, up to 8 characters, 0x0608 to 0x060B)
+    RegisterSpec("MBF_PAR_UICFG_MACH_NAME_LIGHT", 0x060C, "MISC", width=4, kind=KIND_ASCII),  # Machine name normal intensity part (ASCIIZ, up to 8 characters, 0x060C to 0x060F)
+    # Prepared for future use:
+    # RegisterSpec("MBF_PAR_UICFG_MACH_NAME_AUX1", 0x0610, "MISC", width=5, kind=KIND_ASCII),  # Aux1 relay name: up to 10 characters
+    # RegisterSpec("MBF_PAR_UICFG_MACH_NAME_AUX2", 0x0615, "MISC", width=5, kind=KIND_ASCII),  # Aux2 relay name: up to 10 characters
+    # RegisterSpec("MBF_PAR_UICFG_MACH_NAME_AUX3", 0x061A, "MISC", width=5, kind=KIND_ASCII),  # Aux3 relay name: up to 10 characters
+    # RegisterSpec("MBF_PAR_UICFG_MACH_NAME_AUX4", 0x061F, "MISC", width=5, kind=KIND_ASCII),  # Aux4 relay name: up to 10 characters
+)
+# fmt: on
+
+
+# Register keys needed regardless of which entities are enabled: capability checks
+# done by the _should_skip_* functions, derived values and coordinator logic.
+ALWAYS_REQUIRED_KEYS = (
+    *CAPABILITY_KEYS,
+    "MBF_POWER_MODULE_VERSION",  # firmware version (coordinator)
+    "MBF_POWER_MODULE_NODEID",  # device identity of the persisted register cache, device info
+    "MBF_PAR_FILTRATION_STATE",  # filtration relay fixup
+    "MBF_PAR_FILT_MODE",  # manual filtration / timer availability
+    "MBF_PAR_HEATING_TEMP",  # setpoint synchronisation
+    "MBF_PAR_INTELLIGENT_TEMP",  # setpoint synchronisation
+    "MBF_PAR_TIME_LOW",  # automatic time sync
+    "MBF_PAR_TIME_HIGH",  # automatic time sync
+    "MBF_PAR_UICFG_MACHINE",  # hydrolysis units (is_hydrolysis_in_percent)
+    "MBF_PAR_UICFG_MACH_VISUAL_STYLE",  # hydrolysis units (is_hydrolysis_in_percent)
+    "MBF_PAR_VERSION",  # device info
+    "MBF_PAR_UICFG_MACH_NAME_BOLD",  # device info (get_machine_name)
+    "MBF_PAR_UICFG_MACH_NAME_LIGHT",  # device info (get_machine_name)
+)
+
+# Entity keys that are not registers themselves, mapped to the registers they are
+# decoded from. Keys derived only from the MEASURE page need no entry here.
+DERIVED_KEY_SOURCES = {
+    "Filtration Pump": ("MBF_PAR_FILT_GPIO", "MBF_PAR_FILTRATION_STATE"),
+    "pH Acid Pump": ("MBF_PAR_PH_ACID_RELAY_GPIO",),
+    "Pool Light": ("MBF_PAR_LIGHTING_GPIO",),
+    "Heating": ("MBF_PAR_HEATING_GPIO",),
+    "UV Lamp": ("MBF_PAR_UV_RELAY_GPIO",),
+    "Hydrolysis module detected": ("MBF_PAR_MODEL",),
+    "Device Time Out Of Sync": ("MBF_PAR_TIME_LOW", "MBF_PAR_TIME_HIGH"),
+    "FILTRATION_SPEED": ("MBF_PAR_FILTRATION_CONF",),
+    "MBF_PAR_FILTRATION_SPEED": ("MBF_PAR_FILTRATION_CONF",),
+    "MBF_PAR_HIDRO_SHUTDOWN_TEMPERATURE": ("MBF_PAR_HIDRO_COVER_REDUCTION",),
+}
+
+
+def plan_reads(
+    specs,
+    max_count: int = MAX_READ_COUNT,
+    max_gap: int = MAX_READ_GAP,
+) -> list[tuple[int, int]]:
+    """Compile register specs into the minimal list of (start_address, count) reads.
+
+    Addresses are merged greedily in ascending order. A run of unused registers
+    of up to `max_gap` is read through when it keeps the request within `max_count`,
+    because one longer request is cheaper than two round trips on the bus.
+    """
+    return plan_address_reads(
+        {spec.address + i for spec in specs for i in range(spec.width)},
+        max_count,
+        max_gap,
+    )
+
+
+def plan_timer_reads(
+    names,
+    max_count: int = MAX_READ_COUNT,
+    max_gap: int = MAX_READ_GAP,
+) -> list[tuple[int, int]]:
+    """Compile timer block names into (start_address, count) reads.
+
+    The blocks occupy the contiguous region 0x0434-0x04E7, so adjacent blocks are
+    fetched together in requests of up to `max_count` registers that may cross
+    block boundaries; the caller slices the responses back into blocks.
+    """
+    return plan_address_reads(
+        {TIMER_BLOCKS[name] + i for name in names for i in range(TIMER_BLOCK_SIZE)},
+        max_count,
+        max_gap,
+    )
+
+
+def plan_address_reads(
+    addresses,
+    max_count: int = MAX_READ_COUNT,
+    max_gap: int = MAX_READ_GAP,
+) -> list[tuple[int, int]]:
+    """Merge register addresses into (start_address, count) reads (see plan_reads)."""
+    ranges: list[tuple[int, int]] = []
+    start = end = None
+    for address in sorted(addresses):
+        if (
+            start is not None
+            and address - end - 1 <= max_gap
+            and address - start < max_count
+        ):
+            end = address
+            continue
+        if start is not None:
+            ranges.append((start, end - start + 1))
+        start = end = address
+    if start is not None:
+        ranges.append((start, end - start + 1))
+    return ranges
+
+
+def decode_registers(specs, image: dict[int, int]) -> dict:
+    """Decode specs from a register image ({address: raw value}).
+
+    Registers missing from the image (e.g. short responses) decode to None.
+    """
+    result = {}
+    for spec in specs:
+        if spec.kind == KIND_UINT:
+            value = image.get(spec.address)
+            if value is not None:
+                if spec.signed and value & 0x8000:
+                    value -= 0x10000
+                if spec.divisor:
+                    value = value / spec.divisor
+                value += spec.offset
+            result[spec.key] = value
+            continue
+        regs = [
+            image[address]
+            for address in range(spec.address, spec.address + spec.width)
+            if address in image
+        ]
+        result[spec.key] = (
+            modbus_regs_to_ascii(regs) if spec.kind == KIND_ASCII else regs
+        )
+    return result
+
+
+# Response position of registers outside the read plan; never reached, so they
+# decode like registers missing from a short response
+_NOT_READ = 1 << 30
+
+
+class PageDecoder:
+    """Register specs compiled against their read plan.
+
+    Every spec is resolved once to its position in the flat register list that
+    _read_register_ranges returns for the plan, so decoding a response is a
+    walk over precomputed (key, position, scaling) tuples without building an
+    address image or dispatching on the register kind. The result equals
+    decode_registers over the same response.
+    """
+
+    __slots__ = ("_plain", "_scaled", "_blocks")
+
+    def __init__(self, specs, ranges: list[tuple[int, int]]):
+        positions = {}
+        for start, count in ranges:
+            for address in range(start, start + count):
+                positions[address] = len(positions)
+        plain, scaled, blocks = [], [], []
+        for spec in specs:
+            if spec.kind != KIND_UINT:
+                block = tuple(
+                    positions[address]
+                    for address in range(spec.address, spec.address + spec.width)
+                    if address in positions
+                )
+                blocks.append((spec.key, block, spec.kind == KIND_ASCII))
+                continue
+            position = positions.get(spec.address, _NOT_READ)
+            if spec.divisor or spec.offset or spec.signed:
+                scaled.append(
+                    (spec.key, position, spec.divisor, spec.offset, spec.signed)
+                )
+            else:
+                plain.append((spec.key, position))
+        self._plain = tuple(plain)
+        self._scaled = tuple(scaled)
+        self._blocks = tuple(blocks)
+
+    def decode(self, registers: list[int], into: dict | None = None) -> dict:
+        """Decode a flat response into `into` (a new dict if None) and return it.
+
+        Registers missing from a short response decode to None.
+        """
+        result = {} if into is None else into
+        size = len(registers)
+        for key, position in self._plain:
+            result[key] = registers[position] if position < size else None
+        for key, position, divisor, offset, signed in self._scaled:
+            if position >= size:
+                result[key] = None
+                continue
+            value = registers[position]
+            if signed and value & 0x8000:
+                value -= 0x10000
+            if divisor:
+                value = value / divisor
+            result[key] = value + offset
+        for key, block, ascii_ in self._blocks:
+            regs = [registers[position] for position in block if position < size]
+            result[key] = modbus_regs_to_ascii(regs) if ascii_ else regs
+        return result
+
+
+class RegisterSnapshot:
+    """Raw page responses with the values decoded from them.
+
+    Every page is kept as the array('H') returned for its read plan together
+    with the decoder of that plan and the decoded values. A page stored again
+    with identical registers keeps those values, so an unchanged response is
+    not decoded again. The raw registers are exported for diagnostics.
+    """
+
+    def __init__(self) -> None:
+        self._pages: dict[str, tuple[PageDecoder, array, dict]] = {}
+
+    def set_page(self, page: str, decoder: PageDecoder, registers) -> dict:
+        """Store the response for page and return its decoded values.
+
+        The returned dict is shared with the snapshot and must not be modified.
+        """
+        buffer = array("H", registers)
+        current = self._pages.get(page)
+        if current is not None and current[0] is decoder and current[1] == buffer:
+            return current[2]
+        values = decoder.decode(buffer)
+        self._pages[page] = (decoder, buffer, values)
+        return values
+
+    def raw_pages(self) -> dict[str, list[int]]:
+        """Return the raw registers of every stored page (JSON serializable)."""
+        return {page: buffer.tolist() for page, (_, buffer, _) in self._pages.items()}
+
+
+def resolve_required_keys(data_keys) -> frozenset[str]:
+    """Return the register keys needed to serve the given coordinator data keys.
+
+    The result always contains ALWAYS_REQUIRED_KEYS. Keys that are neither
+    registers nor listed in DERIVED_KEY_SOURCES (timers, MEASURE status bits, ...)
+    do not require any configuration register.
+    """
+    required = {key for key in ALWAYS_REQUIRED_KEYS if key in REGISTER_KEYS}
+    for key in data_keys:
+        if key in REGISTER_KEYS:
+            required.add(key)
+        required.update(DERIVED_KEY_SOURCES.get(key, ()))
+    return frozenset(required)
+
+
+REGISTER_KEYS = frozenset(spec.key for spec in REGISTER_MAP)
+
+# Register specs and compiled read plan per page (computed once at import time)
+PAGE_REGISTERS: dict[str, tuple[RegisterSpec, ...]] = {
+    page: tuple(spec for spec in REGISTER_MAP if spec.page == page) for page in PAGES
+}
+PAGE_READ_PLAN: dict[str, list[tuple[int, int]]] = {
+    page: plan_reads(specs) for page, specs in PAGE_REGISTERS.items()
+}
+PAGE_DECODERS: dict[str, PageDecoder] = {
+    page: PageDecoder(specs, PAGE_READ_PLAN[page])
+    for page, specs in PAGE_REGISTERS.items()
+}
+
+# Page holding each mapped register address
+_PAGE_BY_ADDRESS: dict[int, str] = {
+    spec.address + i: spec.page for spec in REGISTER_MAP for i in range(spec.width)
+}
+
+
+def page_of_register(address: int) -> str | None:
+    """Return the page a mapped register belongs to, or None if it is not mapped."""
+    return _PAGE_BY_ADDRESS.get(address)
+
+
+def timer_of_register(address: int) -> str | None:
+    """Return the name of the timer block containing address, if any."""
+    for name, base in TIMER_BLOCKS.items():
+        if base <= address < base + TIMER_BLOCK_SIZE:
+            return name
+    return None
@@ -0,0 +1,121 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""VistaPool Integration for Home Assistant - Prioritised Modbus request slots"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+
+# Request priorities, most urgent first
+PRIORITY_WRITE = 0  # user actions: writes, their read-backs and commits
+PRIORITY_MEASURE = 1  # MEASURE page and MBF_NOTIFICATION handling
+PRIORITY_CONFIG = 2  # configuration pages
+PRIORITY_TIMERS = 3  # timer blocks
+
+PRIORITY_NAMES = {
+    PRIORITY_WRITE: "write",
+    PRIORITY_MEASURE: "measure",
+    PRIORITY_CONFIG: "config",
+    PRIORITY_TIMERS: "timers",
+}
+
+
+class RequestScheduler:
+    """Hands out the single request slot of a device by priority.
+
+    Every Modbus request runs inside slot(priority). While a request is in
+    flight the others queue; when it completes the most urgent waiter goes next
+    (FIFO within one priority). A poll cycle therefore yields between its
+    requests: a user write issued during a full read waits for at most the
+    request in flight instead of the whole cycle, and the read continues where
+    it stopped afterwards.
+    """
+
+    def __init__(self):
+        self._busy = False
+        self._queue: list[tuple[int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+        self._max_wait = dict.fromkeys(PRIORITY_NAMES, 0.0)
+        self.granted = dict.fromkeys(PRIORITY_NAMES, 0)
+        self.preemptions = 0
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for the slot."""
+        return sum(1 for *_, waiter in self._queue if not waiter.done())
+
+    @asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_WRITE):
+        """Hold the request slot for one request."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        if not self._busy and not self._queue:
+            self._busy = True
+            self.granted[priority] += 1
+            return
+        start = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._order), waiter)
+        heapq.heappush(self._queue, entry)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release()  # granted just before the cancellation
+            elif entry in self._queue:
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+            raise
+        self.granted[priority] += 1
+        self._max_wait[priority] = max(
+            self._max_wait[priority], time.monotonic() - start
+        )
+
+    def _release(self) -> None:
+        while self._queue:
+            priority, order, waiter = heapq.heappop(self._queue)
+            if waiter.done():
+                continue
+            if any(
+                queued_order < order and queued_priority > priority
+                for queued_priority, queued_order, _ in self._queue
+            ):
+                self.preemptions += 1
+            waiter.set_result(None)  # the slot passes on, _busy stays set
+            return
+        self._busy = False
+
+    @property
+    def stats(self) -> dict:
+        """Return scheduling statistics for diagnostics."""
+        return {
+            "queued": self.queued,
+            "preemptions": self.preemptions,
+            "granted": {
+                PRIORITY_NAMES[priority]: count
+                for priority, count in self.granted.items()
+            },
+            "max_wait": {
+                PRIORITY_NAMES[priority]: round(wait, 4)
+                for priority, wait in self._max_wait.items()
+            },
+        }
@@ -165,7 +165,7 @@ class VistaPoolSelect(VistaPoolEntity, SelectEntity):
                     return
             await client.async_write_register(self._register or 0x041D, minutes)
             await asyncio.sleep(0.2)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_registers(self._register or 0x041D)
             self.async_write_ha_state()
             return
 
@@ -183,7 +183,7 @@ class VistaPoolSelect(VistaPoolEntity, SelectEntity):
                     return
             await client.async_write_register(self._register or 0x04ED, minutes)
             await asyncio.sleep(0.2)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_registers(self._register or 0x04ED)
             self.async_write_ha_state()
             return
         if self._select_type == "timer_time":
@@ -314,7 +314,7 @@ class VistaPoolSelect(VistaPoolEntity, SelectEntity):
             write_val = max(0, seconds - 10)
             await client.async_write_register(0x0433, write_val)
             await asyncio.sleep(0.2)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_registers(0x0433)
             self.async_write_ha_state()
             return
 
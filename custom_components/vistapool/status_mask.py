@@ -23,8 +23,68 @@ WARNING: DO NOT change names of this keys, they are used in the code !!!
 #     Each relay name has 5 register ASCIIZ string with up to 10 characters.
 #     (MBF_PAR_UICFG_MACH_NAME_AUX1, MBF_PAR_UICFG_MACH_NAME_AUX2, MBF_PAR_UICFG_MACH_NAME_AUX3, MBF_PAR_UICFG_MACH_NAME_AUX4)
 
+from collections import OrderedDict
+from collections.abc import Callable
+
 from .const import is_valid_relay_gpio
 
+# Sensor module status flags decoded by decode_ph_rx_cl_cd_status_bits
+# (key suffix, bit mask); the keys are formatted once per unit below.
+_SENSOR_STATUS_BITS = (
+    (" flow sensor problem", 0x0008),
+    (" module control status", 0x0400),
+    (" pump active", 0x1000),
+    (" control module", 0x2000),
+    (" measurement active", 0x4000),
+    (" measurement module detected", 0x8000),
+)
+_SENSOR_STATUS_UNITS = ("pH", "Redox", "Chlorine", "Conductivity")
+
+
+def _sensor_status_keys(unit: str) -> tuple[tuple[str, int], ...]:
+    keys = tuple((f"{unit}{suffix}", mask) for suffix, mask in _SENSOR_STATUS_BITS)
+    # Bit 11 is the acid pump — only meaningful for the pH module
+    if unit == "pH":
+        keys += ((f"{unit} acid pump active", 0x0800),)
+    return keys
+
+
+_SENSOR_STATUS_KEYS = {unit: _sensor_status_keys(unit) for unit in _SENSOR_STATUS_UNITS}
+
+_AUX_RELAY_BITS = (
+    ("AUX1", 0x0008),
+    ("AUX2", 0x0010),
+    ("AUX3", 0x0020),
+    ("AUX4", 0x0040),
+)
+
+_ION_STATUS_BITS = (
+    ("ION On Target", 0x0001),
+    ("ION Low Flow", 0x0002),
+    ("ION Reserved", 0x0004),
+    ("ION Program time exceeded", 0x0008),
+    ("ION in dead time", 0x1000),
+    ("ION in Pol1", 0x2000),
+    ("ION in Pol2", 0x4000),
+)
+
+_HIDRO_STATUS_BITS = (
+    ("HIDRO On Target", 0x0001),
+    ("HIDRO Low Flow", 0x0002),
+    ("HIDRO Reserved", 0x0004),
+    ("HIDRO Cell Flow FL1", 0x0008),  # if present
+    ("Pool Cover", 0x0010),
+    ("HIDRO Module active", 0x0020),
+    ("HIDRO Module regulated", 0x0040),
+    ("HIDRO Activated by the RX module", 0x0080),
+    ("HIDRO Chlorine shock mode", 0x0100),
+    ("HIDRO Chlorine flow indicator FL2", 0x0200),  # if present
+    ("HIDRO Activated by the CL module", 0x0400),
+    ("HIDRO in dead time", 0x1000),
+    ("HIDRO in Pol1", 0x2000),
+    ("HIDRO in Pol2", 0x4000),
+)
+
 
 def decode_uv_lamp_state(relay_state: int | None, uv_relay_gpio: int) -> dict:
     """Decode the UV Lamp relay bit from MBF_RELAY_STATE.
@@ -49,12 +109,7 @@ def decode_relay_state(value: int | None) -> dict:
     # Bits 3-6: AUX1-AUX4 (always at fixed positions)
     if value is None:
         return {}
-    return {
-        "AUX1": bool(value & 0x0008),
-        "AUX2": bool(value & 0x0010),
-        "AUX3": bool(value & 0x0020),
-        "AUX4": bool(value & 0x0040),
-    }
+    return {key: bool(value & mask) for key, mask in _AUX_RELAY_BITS}
 
 
 def decode_named_relay_states(
@@ -78,6 +133,13 @@ def decode_named_relay_states(
     return result
 
 
+def decode_named_relay_items(
+    relay_state: int | None, gpio_items: tuple[tuple[str, int], ...]
+) -> dict:
+    """decode_named_relay_states with the GPIO map as hashable (name, gpio) items."""
+    return decode_named_relay_states(relay_state, dict(gpio_items))
+
+
 def decode_ph_rx_cl_cd_status_bits(status: int | None, unit: str) -> dict:
     """Decode the status bits for pH, Redox, Chlorine, and Conductivity sensors."""
     # Status bits are 16 bits, where each bit represents a status flag
@@ -90,18 +152,8 @@ def decode_ph_rx_cl_cd_status_bits(status: int | None, unit: str) -> dict:
     # Bit 15: Measurement module detected
     if status is None:
         return {}
-    result = {
-        f"{unit} flow sensor problem": bool(status & 0x0008),
-        f"{unit} module control status": bool(status & 0x0400),
-        f"{unit} pump active": bool(status & 0x1000),
-        f"{unit} control module": bool(status & 0x2000),
-        f"{unit} measurement active": bool(status & 0x4000),
-        f"{unit} measurement module detected": bool(status & 0x8000),
-    }
-    # Bit 11 is the acid pump — only meaningful for the pH module
-    if unit == "pH":
-        result[f"{unit} acid pump active"] = bool(status & 0x0800)
-    return result
+    keys = _SENSOR_STATUS_KEYS.get(unit) or _sensor_status_keys(unit)
+    return {key: bool(status & mask) for key, mask in keys}
 
 
 def decode_ion_status_bits(status: int | None) -> dict:
@@ -118,15 +170,7 @@ def decode_ion_status_bits(status: int | None) -> dict:
     # Note: ION measurement module is always detected if ION sensor is present
     if status is None:
         return {}
-    return {
-        "ION On Target": bool(status & 0x0001),
-        "ION Low Flow": bool(status & 0x0002),
-        "ION Reserved": bool(status & 0x0004),
-        "ION Program time exceeded": bool(status & 0x0008),
-        "ION in dead time": bool(status & 0x1000),
-        "ION in Pol1": bool(status & 0x2000),
-        "ION in Pol2": bool(status & 0x4000),
-    }
+    return {key: bool(status & mask) for key, mask in _ION_STATUS_BITS}
 
 
 def decode_hidro_status_bits(status: int | None) -> dict:
@@ -150,19 +194,59 @@ def decode_hidro_status_bits(status: int | None) -> dict:
     # Note: HIDRO measurement module is always detected if HIDRO sensor is present
     if status is None:
         return {}
-    return {
-        "HIDRO On Target": bool(status & 0x0001),
-        "HIDRO Low Flow": bool(status & 0x0002),
-        "HIDRO Reserved": bool(status & 0x0004),
-        "HIDRO Cell Flow FL1": bool(status & 0x0008),  # if present
-        "Pool Cover": bool(status & 0x0010),
-        "HIDRO Module active": bool(status & 0x0020),
-        "HIDRO Module regulated": bool(status & 0x0040),
-        "HIDRO Activated by the RX module": bool(status & 0x0080),
-        "HIDRO Chlorine shock mode": bool(status & 0x0100),
-        "HIDRO Chlorine flow indicator FL2": bool(status & 0x0200),  # if present
-        "HIDRO Activated by the CL module": bool(status & 0x0400),
-        "HIDRO in dead time": bool(status & 0x1000),
-        "HIDRO in Pol1": bool(status & 0x2000),
-        "HIDRO in Pol2": bool(status & 0x4000),
-    }
+    return {key: bool(status & mask) for key, mask in _HIDRO_STATUS_BITS}
+
+
+class StatusDecoder:
+    """Memoizing front end for the decoders above.
+
+    The status words in MEASURE rarely change, so every source (a status
+    register, or the relay state with its GPIO map) remembers the arguments it
+    was last decoded from and returns the same dict while they are unchanged.
+    Other combinations are kept in a small LRU cache keyed by source and
+    arguments, so a relay toggling back and forth is not decoded again.
+    The returned dicts are shared and must not be modified.
+
+    The keys whose values changed are collected until take_changed_keys() is
+    called, once per poll.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self._maxsize = maxsize
+        self._cache: OrderedDict[tuple, dict] = OrderedDict()
+        self._previous: dict[str, tuple[tuple, dict]] = {}
+        self._changed: set[str] = set()
+
+    def decode(self, source: str, func: Callable[..., dict], *args) -> dict:
+        """Return func(*args), reusing the result for unchanged arguments.
+
+        args must be hashable (pass a GPIO map as a tuple of items).
+        """
+        previous = self._previous.get(source)
+        if previous is not None and previous[0] == args:
+            return previous[1]
+        key = (source, args)
+        decoded = self._cache.get(key)
+        if decoded is None:
+            decoded = func(*args)
+            self._cache[key] = decoded
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        if previous is None:
+            self._changed.update(decoded)
+        else:
+            old = previous[1]
+            self._changed.update(
+                name
+                for name in old.keys() | decoded.keys()
+                if old.get(name) != decoded.get(name)
+            )
+        self._previous[source] = (args, decoded)
+        return decoded
+
+    def take_changed_keys(self) -> frozenset[str]:
+        """Return the keys changed since the last call and start collecting anew."""
+        changed, self._changed = frozenset(self._changed), set()
+        return changed
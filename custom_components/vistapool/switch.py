@@ -165,11 +165,10 @@ class VistaPoolSwitch(VistaPoolEntity, SwitchEntity):
                 self.function_addr,
                 self.timer_block_addr,
             )
-            await client.async_write_register(
-                self.function_addr, self.function_code
-            )  # Set function (if needed)
-            await client.async_write_register(self.timer_block_addr, 3)  # Always on
-            await client.async_write_register(EXEC_REGISTER, 1)  # Commit
+            async with client.transaction() as tx:
+                tx.write(self.function_addr, self.function_code)  # Set function
+                tx.write(self.timer_block_addr, 3)  # Always on
+                tx.write(EXEC_REGISTER, 1)  # Commit
         elif self._switch_type == "climate_mode":
             _LOGGER.debug(
                 "Setting climate mode ON via register 0x%04X", self.function_addr
@@ -237,8 +236,9 @@ class VistaPoolSwitch(VistaPoolEntity, SwitchEntity):
                 self._key,
                 self.timer_block_addr,
             )
-            await client.async_write_register(self.timer_block_addr, 4)  # Always off
-            await client.async_write_register(EXEC_REGISTER, 1)  # Commit
+            async with client.transaction() as tx:
+                tx.write(self.timer_block_addr, 4)  # Always off
+                tx.write(EXEC_REGISTER, 1)  # Commit
         elif self._switch_type == "climate_mode":
             _LOGGER.debug(
                 "Setting climate mode OFF via register 0x%04X", self.function_addr
@@ -0,0 +1,250 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""VistaPool Integration for Home Assistant - Native asyncio Modbus transport
+
+A minimal Modbus client implementing only what this integration needs: FC03, FC04
+and FC16 over Modbus TCP (MBAP) or RTU over TCP (CRC16). It exposes the subset of
+the pymodbus AsyncModbusTcpClient interface used by VistaPoolModbusClient, so the
+two are interchangeable. Sugar Valley FC20 broadcasts are stripped by the
+framing.Fc20FrameSplitter before responses are parsed.
+"""
+
+import asyncio
+import logging
+import struct
+from collections.abc import Callable
+
+from .framing import Fc20FrameSplitter, crc16, mbap_frame_length, rtu_frame_length
+
+_LOGGER = logging.getLogger(__name__)
+
+FC_READ_HOLDING_REGISTERS = 0x03
+FC_READ_INPUT_REGISTERS = 0x04
+FC_WRITE_MULTIPLE_REGISTERS = 0x10
+
+
+class ModbusResponse:
+    """Decoded response PDU (subset of the pymodbus response interface)."""
+
+    __slots__ = ("function_code", "registers", "exception_code")
+
+    def __init__(self, function_code: int, registers=None, exception_code: int = 0):
+        self.function_code = function_code
+        self.registers = registers if registers is not None else []
+        self.exception_code = exception_code
+
+    def isError(self) -> bool:
+        """Return True for a Modbus exception response (pymodbus naming)."""
+        return self.exception_code != 0
+
+    def __repr__(self) -> str:
+        if self.exception_code:
+            return (
+                f"ExceptionResponse(fc=0x{self.function_code:02X}, "
+                f"code={self.exception_code})"
+            )
+        return (
+            f"ModbusResponse(fc=0x{self.function_code:02X}, registers={self.registers})"
+        )
+
+
+class _ModbusProtocol(asyncio.Protocol):
+    def __init__(self, client: "NativeModbusClient"):
+        self._client = client
+
+    def data_received(self, data: bytes) -> None:
+        self._client._data_received(data)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._client._connection_lost(exc)
+
+
+class NativeModbusClient:
+    """Modbus TCP / RTU-over-TCP client for a single NeoPool unit.
+
+    Requests are serialized (one outstanding request, as on the RS485 bus).
+    With MBAP framing the Transaction ID of every response is matched, so a late
+    answer to a timed-out request is discarded instead of being taken as the
+    answer to the next one. RTU responses are CRC-checked and matched by
+    function code.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 502,
+        *,
+        unit_id: int = 1,
+        rtu: bool = False,
+        timeout: float = 5,
+        on_broadcast: Callable[[bytes], None] | None = None,
+    ):
+        self._host = host
+        self._port = port
+        self._rtu = rtu
+        self._timeout = timeout
+        self._transport: asyncio.Transport | None = None
+        self._lock = asyncio.Lock()
+        self._rx = bytearray()
+        self._pending: asyncio.Future | None = None
+        self._expected_function = 0
+        self._tid = 0
+        self.fc20_splitter = Fc20FrameSplitter(unit_id, rtu, on_broadcast)
+
+    @property
+    def connected(self) -> bool:
+        return self._transport is not None and not self._transport.is_closing()
+
+    async def connect(self) -> bool:
+        """Open the TCP connection. Returns False if the gateway is unreachable."""
+        loop = asyncio.get_running_loop()
+        try:
+            self._transport, _ = await asyncio.wait_for(
+                loop.create_connection(
+                    lambda: _ModbusProtocol(self), self._host, self._port
+                ),
+                timeout=self._timeout,
+            )
+        except (OSError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Connection to %s:%s failed: %s", self._host, self._port, err)
+            return False
+        self._rx.clear()
+        self.fc20_splitter.reset()
+        return True
+
+    def close(self) -> None:
+        """Close the connection and fail a pending request."""
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        self._fail_pending(ConnectionError("Connection closed"))
+
+    def resync(self) -> None:
+        """Drop buffered bytes so the next response is parsed from a frame start."""
+        self._rx.clear()
+        self.fc20_splitter.reset()
+
+    # ── Requests ─────────────────────────────────────────────────────────────
+
+    async def read_holding_registers(
+        self, address: int, *, count: int = 1, device_id: int = 1
+    ) -> ModbusResponse:
+        return await self._execute(
+            device_id, struct.pack(">BHH", FC_READ_HOLDING_REGISTERS, address, count)
+        )
+
+    async def read_input_registers(
+        self, address: int, *, count: int = 1, device_id: int = 1
+    ) -> ModbusResponse:
+        return await self._execute(
+            device_id, struct.pack(">BHH", FC_READ_INPUT_REGISTERS, address, count)
+        )
+
+    async def write_registers(
+        self, address: int, values: list[int], *, device_id: int = 1
+    ) -> ModbusResponse:
+        count = len(values)
+        pdu = struct.pack(
+            f">BHHB{count}H",
+            FC_WRITE_MULTIPLE_REGISTERS,
+            address,
+            count,
+            count * 2,
+            *values,
+        )
+        return await self._execute(device_id, pdu)
+
+    async def _execute(self, unit: int, pdu: bytes) -> ModbusResponse:
+        async with self._lock:
+            if not self.connected:
+                raise ConnectionError(f"Not connected to {self._host}:{self._port}")
+            if self._rtu:
+                adu = bytes([unit]) + pdu
+                adu += struct.pack("<H", crc16(adu))
+            else:
+                self._tid = self._tid % 0xFFFF + 1
+                adu = struct.pack(">HHHB", self._tid, 0, len(pdu) + 1, unit) + pdu
+            self._expected_function = pdu[0]
+            self._pending = asyncio.get_running_loop().create_future()
+            self._transport.write(adu)
+            try:
+                return await asyncio.wait_for(self._pending, self._timeout)
+            except asyncio.TimeoutError:
+                self._rx.clear()
+                raise TimeoutError(
+                    f"No response from {self._host}:{self._port} "
+                    f"within {self._timeout} s"
+                ) from None
+            finally:
+                self._pending = None
+
+    # ── Responses ────────────────────────────────────────────────────────────
+
+    def _data_received(self, data: bytes) -> None:
+        forward = self.fc20_splitter.feed(data)
+        if not forward:
+            return
+        self._rx += forward
+        while (frame := self._next_frame()) is not None:
+            self._dispatch(*frame)
+
+    def _next_frame(self) -> tuple[int | None, bytes] | None:
+        """Pop one complete frame from the receive buffer as (tid, pdu)."""
+        rx = self._rx
+        length = (rtu_frame_length if self._rtu else mbap_frame_length)(rx, 0)
+        if length is None or len(rx) < length:
+            return None
+        if length == 0:
+            _LOGGER.debug("Discarding unparsable data: %s", rx.hex())
+            rx.clear()
+            return None
+        frame = bytes(rx[:length])
+        del rx[:length]
+        if not self._rtu:
+            return frame[0] << 8 | frame[1], frame[7:]
+        if crc16(frame[:-2]) != frame[-2] | frame[-1] << 8:
+            _LOGGER.debug("Discarding RTU frame with bad CRC: %s", frame.hex())
+            rx.clear()
+            return None
+        return None, frame[1:-2]
+
+    def _dispatch(self, tid: int | None, pdu: bytes) -> None:
+        future = self._pending
+        if future is None or future.done():
+            _LOGGER.debug("Discarding unsolicited response: %s", pdu.hex())
+            return
+        if tid is not None and tid != self._tid:
+            _LOGGER.debug("Discarding response with stale transaction id %d", tid)
+            return
+        function = pdu[0]
+        if function == self._expected_function | 0x80:
+            future.set_result(ModbusResponse(function & 0x7F, exception_code=pdu[1]))
+        elif function != self._expected_function:
+            _LOGGER.debug("Discarding response for function 0x%02X", function)
+        elif function == FC_WRITE_MULTIPLE_REGISTERS:
+            future.set_result(ModbusResponse(function))
+        else:
+            count = pdu[1] // 2
+            future.set_result(
+                ModbusResponse(function, list(struct.unpack_from(f">{count}H", pdu, 2)))
+            )
+
+    def _connection_lost(self, exc: Exception | None) -> None:
+        self._transport = None
+        self._fail_pending(ConnectionError(f"Connection lost: {exc}"))
+
+    def _fail_pending(self, exc: Exception) -> None:
+        if self._pending is not None and not self._pending.done():
+            self._pending.set_exception(exc)
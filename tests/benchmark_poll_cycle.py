@@ -0,0 +1,306 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Poll-cycle benchmark for the VistaPool Modbus client and coordinator.
+
+Runs VistaPoolModbusClient.async_read_all() and VistaPoolCoordinator's
+_async_update_data() against the local NeoPool simulator and measures, per cycle:
+
+- wall time,
+- Modbus requests sent and bytes on the wire (both directions),
+- CPU time spent decoding registers and timer blocks.
+
+It also compares the compiled page decoders (registers.PageDecoder) with the
+address-image decoder (registers.decode_registers) on the full register map.
+
+Scenarios:
+    full_read             first poll after connect (all pages + all timer blocks)
+    notification_partial  device-side change on the USER page (MEASURE + USER)
+    cache_only            nothing changed (MEASURE only, everything else cached)
+
+Each result is compared against THRESHOLDS; an extra range, an extra timer block
+or an extra sleep in the poll path makes the run fail.
+
+Usage:
+    PYTHONPATH=$PWD python tests/benchmark_poll_cycle.py [--output bench.json]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+from neopool_simulator import NeoPoolSimulator
+
+from custom_components.vistapool import modbus as modbus_module
+from custom_components.vistapool.const import TIMER_BLOCKS
+from custom_components.vistapool.coordinator import VistaPoolCoordinator
+from custom_components.vistapool.modbus import VistaPoolModbusClient
+from custom_components.vistapool.registers import (
+    PAGE_DECODERS,
+    PAGE_READ_PLAN,
+    PAGE_REGISTERS,
+    PageDecoder,
+    decode_registers,
+)
+
+SCENARIOS = ("full_read", "notification_partial", "cache_only")
+TARGETS = ("client", "coordinator")
+
+# Per-cycle limits for Modbus TCP framing. Request and byte counts are exact for
+# the simulated device; wall time leaves headroom for slow CI runners and is only
+# gated by the command line run (median of several iterations).
+THRESHOLDS = {
+    "client": {
+        "full_read": {"requests": 11, "bytes": 533, "wall_time": 0.3},
+        "notification_partial": {"requests": 3, "bytes": 133, "wall_time": 0.05},
+        "cache_only": {"requests": 1, "bytes": 57, "wall_time": 0.05},
+    },
+    "coordinator": {
+        "full_read": {"requests": 17, "bytes": 1019, "wall_time": 0.5},
+        "notification_partial": {"requests": 3, "bytes": 133, "wall_time": 0.05},
+        "cache_only": {"requests": 1, "bytes": 57, "wall_time": 0.05},
+    },
+}
+
+# Deterministic metrics, gated by the pytest suite
+EXACT_METRICS = ("requests", "bytes")
+
+# Filtration idle (relay off, MBF_PAR_FILTRATION_STATE off), so timer blocks are
+# not force-read in the cache-only cycle
+BENCHMARK_REGISTERS = {0x010E: 0x0000, 0x0421: 0}
+
+
+def _timer_options() -> dict:
+    """Entry options enabling every timer block."""
+    options = {}
+    for key in TIMER_BLOCKS:
+        if key.startswith("relay_aux"):
+            options[f"use_aux{key[len('relay_aux')]}"] = True
+        elif key == "relay_light":
+            options["use_light"] = True
+        else:
+            options[f"use_{key}"] = True
+    return options
+
+
+@contextmanager
+def _decode_timer(totals: dict):
+    """Accumulate CPU time spent in the register and timer decoders."""
+    decode = PageDecoder.decode
+    parse_timer_block = modbus_module.parse_timer_block
+
+    def _timed(func):
+        def wrapper(*args, **kwargs):
+            start = time.thread_time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                totals["decode_cpu"] += time.thread_time() - start
+
+        return wrapper
+
+    with (
+        patch.object(PageDecoder, "decode", _timed(decode)),
+        patch.object(modbus_module, "parse_timer_block", _timed(parse_timer_block)),
+    ):
+        yield
+
+
+async def _prepare(sim, client, target: str, scenario: str):
+    """Bring the client into the state preceding the measured cycle."""
+    coordinator = None
+    if target == "coordinator":
+        entry = MagicMock()
+        entry.options = _timer_options()
+        entry.data = {"name": "Benchmark Pool"}
+        coordinator = VistaPoolCoordinator(MagicMock(), client, entry, "benchmark")
+    if scenario == "full_read":
+        return coordinator
+    # Warm up with a full cycle, then the measured cycle is a partial one
+    coordinator_data = await _cycle(client, coordinator)
+    if coordinator is not None:
+        coordinator.data = coordinator_data
+    if scenario == "notification_partial":
+        sim.set_registers(0x0504, sim.get_register(0x0504) + 1)  # MBF_PAR_PH1
+    return coordinator
+
+
+async def _cycle(client, coordinator):
+    if coordinator is not None:
+        return await coordinator._async_update_data()
+    return await client.async_read_all()
+
+
+async def _measure_once(
+    target: str, scenario: str, framer: str, latency: float, transport: str
+):
+    sim = NeoPoolSimulator(
+        framer=framer, latency=latency, registers=BENCHMARK_REGISTERS
+    )
+    port = await sim.start()
+    client = VistaPoolModbusClient(
+        {
+            "host": "127.0.0.1",
+            "port": port,
+            "slave_id": 1,
+            "modbus_framer": framer,
+            "modbus_transport": transport,
+        }
+    )
+    totals = {"decode_cpu": 0.0}
+    try:
+        coordinator = await _prepare(sim, client, target, scenario)
+        sim.reset_stats()
+        with _decode_timer(totals):
+            start = time.perf_counter()
+            await _cycle(client, coordinator)
+            wall_time = time.perf_counter() - start
+        return {
+            "wall_time": wall_time,
+            "requests": sim.stats["requests"],
+            "bytes": sim.stats["bytes_in"] + sim.stats["bytes_out"],
+            "registers_read": sim.stats["registers_read"],
+            "decode_cpu": totals["decode_cpu"],
+        }
+    finally:
+        await client.close()
+        await sim.stop()
+
+
+def benchmark_decoders(rounds: int = 200) -> dict:
+    """CPU time [s] to decode every page once, compiled vs. address image."""
+    responses = {
+        page: [
+            (address * 7) & 0xFFFF
+            for start, count in ranges
+            for address in range(start, start + count)
+        ]
+        for page, ranges in PAGE_READ_PLAN.items()
+    }
+
+    def image_path():
+        for page, registers in responses.items():
+            addresses = [
+                address
+                for start, count in PAGE_READ_PLAN[page]
+                for address in range(start, start + count)
+            ]
+            decode_registers(PAGE_REGISTERS[page], dict(zip(addresses, registers)))
+
+    def compiled_path():
+        for page, registers in responses.items():
+            PAGE_DECODERS[page].decode(registers)
+
+    timings = {}
+    for name, path in (("image", image_path), ("compiled", compiled_path)):
+        start = time.thread_time()
+        for _ in range(rounds):
+            path()
+        timings[name] = (time.thread_time() - start) / rounds
+    return timings
+
+
+async def run_benchmark(
+    iterations: int = 3,
+    framer: str = "tcp",
+    latency: float = 0.0,
+    transport: str = "pymodbus",
+) -> dict:
+    """Run all scenarios and return the results with threshold violations."""
+    results = {}
+    for target in TARGETS:
+        results[target] = {}
+        for scenario in SCENARIOS:
+            runs = [
+                await _measure_once(target, scenario, framer, latency, transport)
+                for _ in range(iterations)
+            ]
+            results[target][scenario] = {
+                "wall_time": statistics.median(r["wall_time"] for r in runs),
+                "wall_time_max": max(r["wall_time"] for r in runs),
+                "requests": max(r["requests"] for r in runs),
+                "bytes": max(r["bytes"] for r in runs),
+                "registers_read": max(r["registers_read"] for r in runs),
+                "decode_cpu": statistics.median(r["decode_cpu"] for r in runs),
+            }
+    return {
+        "framer": framer,
+        "transport": transport,
+        "latency": latency,
+        "iterations": iterations,
+        "results": results,
+        "decoders": benchmark_decoders(),
+        "thresholds": THRESHOLDS,
+        "violations": check_thresholds(results),
+    }
+
+
+def check_thresholds(
+    results: dict, thresholds: dict = THRESHOLDS, metrics=None
+) -> list[str]:
+    """Return a human-readable line for every metric above its threshold.
+
+    metrics limits the check to the given metric names (all by default).
+    """
+    violations = []
+    for target, scenarios in thresholds.items():
+        for scenario, limits in scenarios.items():
+            measured = results.get(target, {}).get(scenario)
+            if measured is None:
+                continue
+            for metric, limit in limits.items():
+                if metrics is not None and metric not in metrics:
+                    continue
+                if measured[metric] > limit:
+                    violations.append(
+                        f"{target}/{scenario}: {metric}={measured[metric]:g} > {limit:g}"
+                    )
+    return violations
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument("--framer", choices=("tcp", "rtu"), default="tcp")
+    parser.add_argument(
+        "--transport", choices=("pymodbus", "native"), default="pymodbus"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="simulated device latency [s]"
+    )
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(
+        run_benchmark(args.iterations, args.framer, args.latency, args.transport)
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            fp.write(text + "\n")
+    else:
+        print(text)
+    for line in report["violations"]:
+        print(f"THRESHOLD EXCEEDED {line}", file=sys.stderr)
+    return 1 if report["violations"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
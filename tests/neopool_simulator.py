@@ -0,0 +1,328 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Local NeoPool Modbus device simulator for tests and benchmarks.
+
+Serves an in-memory register image of all pages (0x0000–0x06FF) over TCP, using
+either Modbus TCP (MBAP) or RTU-over-TCP framing, the way an RS485 gateway such as
+the Elfin EW11 exposes a real NeoPool box. Behaviour modelled after the device:
+
+- FC03/FC04 reads share one register image; at most 31 registers per request.
+- FC06/FC16 writes update the image and raise the MBF_NOTIFICATION (0x0110) bit
+  of the written page, as do changes made "on the panel" via set_registers().
+- Sugar Valley FC20 broadcasts can be injected every N seconds or on demand.
+- Per-request latency and a drop rate (request silently ignored) are configurable.
+
+Usage:
+    sim = NeoPoolSimulator(framer="rtu", latency=0.01)
+    port = await sim.start()
+    ...
+    await sim.stop()
+"""
+
+import asyncio
+import random
+import struct
+
+REGISTER_COUNT = 0x0700
+MAX_READ_COUNT = 31
+NOTIFICATION_REGISTER = 0x0110
+
+# Register page (address >> 8) -> MBF_NOTIFICATION bit (MBMSK_NOTIF_*_CHANGED)
+PAGE_NOTIFICATION_BITS = {
+    0x00: 0x0001,  # MODBUS
+    0x02: 0x0002,  # GLOBAL
+    0x03: 0x0004,  # FACTORY
+    0x04: 0x0008,  # INSTALLER
+    0x05: 0x0010,  # USER
+    0x06: 0x0020,  # MISC
+}
+
+# Modbus exception codes
+ILLEGAL_FUNCTION = 0x01
+ILLEGAL_DATA_ADDRESS = 0x02
+ILLEGAL_DATA_VALUE = 0x03
+
+# Captured Sugar Valley FC20 broadcast (27 bytes incl. CRC, data[6]=0x39)
+FC20_PAYLOAD = bytes(
+    [0x20, 0x02, 0x01, 0x00, 0x01, 0x39, 0x00, 0x5A, 0x00, 0x00, 0x00, 0x00, 0x00]
+    + [0x00] * 11
+)
+
+# A plausible Hidrolife box with pH + redox modules, hydrolysis and a heat pump
+# fmt: off
+DEFAULT_REGISTERS = {
+    0x0002: 1280,                                   # MBF_POWER_MODULE_VERSION (v5.00)
+    0x0004: [88, 47, 16707, 20497, 8248, 12592],    # MBF_POWER_MODULE_NODEID
+    0x0101: 150,                                    # MBF_HIDRO_CURRENT (15.0)
+    0x0102: 720,                                    # MBF_MEASURE_PH (7.20)
+    0x0103: 709,                                    # MBF_MEASURE_RX (709 mV)
+    0x0106: 265,                                    # MBF_MEASURE_TEMPERATURE (26.5 °C)
+    0x0107: 0xC580,                                 # MBF_PH_STATUS
+    0x0108: 0xC180,                                 # MBF_RX_STATUS
+    0x010D: 0x4220,                                 # MBF_HIDRO_STATUS
+    0x010E: 0x0002,                                 # MBF_RELAY_STATE (filtration on)
+    0x0111: 52,                                     # MBF_HIDRO_VOLTAGE (5.2 V)
+    0x0280: 266,                                    # MBF_HIDRO_MODULE_VERSION
+    0x0281: 10000,                                  # MBF_HIDRO_MODULE_CONNECTIVITY
+    0x0300: 2055,                                   # MBF_PAR_VERSION
+    0x0301: 0x0002,                                 # MBF_PAR_MODEL (hydrolysis)
+    0x0306: 1000,                                   # MBF_PAR_HIDRO_NOM (100.0)
+    0x040A: 1,                                      # MBF_PAR_PH_ACID_RELAY_GPIO
+    0x040F: 1,                                      # MBF_PAR_TEMPERATURE_ACTIVE
+    0x0410: 3,                                      # MBF_PAR_LIGHTING_GPIO
+    0x0411: 1,                                      # MBF_PAR_FILT_MODE (auto)
+    0x0412: 2,                                      # MBF_PAR_FILT_GPIO
+    0x0415: 7,                                      # MBF_PAR_HEATING_GPIO
+    0x0416: 28,                                     # MBF_PAR_HEATING_TEMP
+    0x041C: 28,                                     # MBF_PAR_INTELLIGENT_TEMP
+    0x0421: 1,                                      # MBF_PAR_FILTRATION_STATE
+    0x0502: 1000,                                   # MBF_PAR_HIDRO (100.0)
+    0x0504: 750,                                    # MBF_PAR_PH1 (7.50)
+    0x0505: 700,                                    # MBF_PAR_PH2 (7.00)
+    0x0508: 700,                                    # MBF_PAR_RX1
+    0x0600: 1,                                      # MBF_PAR_UICFG_MACHINE (Hidrolife)
+    0x0601: 6,                                      # MBF_PAR_UICFG_LANGUAGE
+}
+# fmt: on
+
+
+def crc16(data: bytes) -> int:
+    """Return the Modbus RTU CRC16 of data (to be appended little-endian)."""
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return crc
+
+
+def rtu_frame(unit: int, pdu: bytes) -> bytes:
+    """Return an RTU ADU (unit + PDU + CRC)."""
+    body = bytes([unit]) + pdu
+    return body + struct.pack("<H", crc16(body))
+
+
+class NeoPoolSimulator:
+    """Simulated NeoPool box behind a Modbus TCP / RTU-over-TCP gateway."""
+
+    def __init__(
+        self,
+        *,
+        framer: str = "tcp",
+        unit: int = 1,
+        latency: float = 0.0,
+        drop_rate: float = 0.0,
+        fc20_interval: float | None = None,
+        registers: dict | None = None,
+        seed: int | None = None,
+    ):
+        if framer not in ("tcp", "rtu"):
+            raise ValueError(f"Unknown framer '{framer}'")
+        self.framer = framer
+        self.unit = unit
+        self.latency = latency
+        self.drop_rate = drop_rate
+        self.fc20_interval = fc20_interval
+        self.image = [0] * REGISTER_COUNT
+        self._random = random.Random(seed)
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self.stats = {
+            "requests": 0,
+            "reads": 0,
+            "writes": 0,
+            "dropped": 0,
+            "exceptions": 0,
+            "fc20_sent": 0,
+            "bytes_in": 0,
+            "bytes_out": 0,
+            "registers_read": 0,
+        }
+        self.requests: list[tuple[int, int, int]] = []  # (function, address, count)
+        for address, value in {**DEFAULT_REGISTERS, **(registers or {})}.items():
+            self._store(address, value)
+
+    # ── Register image ────────────────────────────────────────────────────────
+
+    def _store(self, address: int, value) -> None:
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for i, v in enumerate(values):
+            self.image[address + i] = int(v) & 0xFFFF
+
+    def set_registers(self, address: int, value) -> None:
+        """Change registers as the device itself would (e.g. from the panel)."""
+        self._store(address, value)
+        self._notify(address)
+
+    def get_register(self, address: int) -> int:
+        return self.image[address]
+
+    def _notify(self, address: int) -> None:
+        bit = PAGE_NOTIFICATION_BITS.get(address >> 8)
+        if bit:
+            self.image[NOTIFICATION_REGISTER] |= bit
+
+    def reset_stats(self) -> None:
+        for key in self.stats:
+            self.stats[key] = 0
+        self.requests.clear()
+
+    # ── Server lifecycle ──────────────────────────────────────────────────────
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start listening and return the bound port."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        for writer in list(self._writers):
+            writer.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def broadcast_fc20(self) -> None:
+        """Send one Sugar Valley FC20 broadcast to all connected masters.
+
+        Gateways forward the raw RTU bytes without an MBAP header in both modes.
+        """
+        frame = rtu_frame(self.unit, FC20_PAYLOAD)
+        for writer in list(self._writers):
+            writer.write(frame)
+            self.stats["fc20_sent"] += 1
+            self.stats["bytes_out"] += len(frame)
+
+    async def _fc20_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.fc20_interval)
+            self.broadcast_fc20()
+
+    async def _handle_connection(self, reader, writer) -> None:
+        self._writers.add(writer)
+        fc20_task = None
+        if self.fc20_interval:
+            fc20_task = asyncio.create_task(self._fc20_loop())
+            self._tasks.add(fc20_task)
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                header, unit, pdu = request
+                self.stats["requests"] += 1
+                if self._random.random() < self.drop_rate:
+                    self.stats["dropped"] += 1
+                    continue
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                response = self._frame_response(header, unit, self._process(pdu))
+                self.stats["bytes_out"] += len(response)
+                writer.write(response)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            if fc20_task is not None:
+                fc20_task.cancel()
+                self._tasks.discard(fc20_task)
+            self._writers.discard(writer)
+            writer.close()
+
+    # ── Framing ───────────────────────────────────────────────────────────────
+
+    async def _read_request(self, reader):
+        """Read one request. Returns (header, unit, pdu) or None on EOF."""
+        if self.framer == "tcp":
+            try:
+                mbap = await reader.readexactly(7)
+            except asyncio.IncompleteReadError:
+                return None
+            tid, pid, length, unit = struct.unpack(">HHHB", mbap)
+            pdu = await reader.readexactly(length - 1)
+            self.stats["bytes_in"] += 7 + len(pdu)
+            return tid, unit, pdu
+        try:
+            head = await reader.readexactly(2)
+        except asyncio.IncompleteReadError:
+            return None
+        unit, function = head
+        if function == 0x10:
+            fixed = await reader.readexactly(5)
+            rest = await reader.readexactly(fixed[4] + 2)
+            body = fixed + rest
+        else:
+            body = await reader.readexactly(6)
+        frame = head + body
+        self.stats["bytes_in"] += len(frame)
+        if crc16(frame[:-2]) != struct.unpack("<H", frame[-2:])[0]:
+            return await self._read_request(reader)  # real devices ignore bad CRCs
+        return None, unit, frame[1:-2]
+
+    def _frame_response(self, tid, unit: int, pdu: bytes) -> bytes:
+        if self.framer == "tcp":
+            return struct.pack(">HHHB", tid, 0, len(pdu) + 1, unit) + pdu
+        return rtu_frame(unit, pdu)
+
+    # ── Function codes ────────────────────────────────────────────────────────
+
+    def _exception(self, function: int, code: int) -> bytes:
+        self.stats["exceptions"] += 1
+        return bytes([function | 0x80, code])
+
+    def _process(self, pdu: bytes) -> bytes:
+        function = pdu[0]
+        if function in (0x03, 0x04):
+            address, count = struct.unpack(">HH", pdu[1:5])
+            self.requests.append((function, address, count))
+            if not 1 <= count <= MAX_READ_COUNT:
+                return self._exception(function, ILLEGAL_DATA_VALUE)
+            if address + count > REGISTER_COUNT:
+                return self._exception(function, ILLEGAL_DATA_ADDRESS)
+            self.stats["reads"] += 1
+            self.stats["registers_read"] += count
+            values = self.image[address : address + count]
+            return struct.pack(f">BB{count}H", function, count * 2, *values)
+        if function == 0x06:
+            address, value = struct.unpack(">HH", pdu[1:5])
+            self.requests.append((function, address, 1))
+            if address >= REGISTER_COUNT:
+                return self._exception(function, ILLEGAL_DATA_ADDRESS)
+            self._write(address, [value])
+            return pdu[:5]
+        if function == 0x10:
+            address, count, _ = struct.unpack(">HHB", pdu[1:6])
+            self.requests.append((function, address, count))
+            if address + count > REGISTER_COUNT:
+                return self._exception(function, ILLEGAL_DATA_ADDRESS)
+            self._write(
+                address, list(struct.unpack(f">{count}H", pdu[6 : 6 + count * 2]))
+            )
+            return pdu[:5]
+        self.requests.append((function, 0, 0))
+        return self._exception(function, ILLEGAL_FUNCTION)
+
+    def _write(self, address: int, values: list[int]) -> None:
+        self.stats["writes"] += 1
+        if address == NOTIFICATION_REGISTER:
+            # The master acknowledges page changes by clearing MBF_NOTIFICATION
+            self.image[NOTIFICATION_REGISTER] = values[0]
+            return
+        self._store(address, values)
+        self._notify(address)
@@ -0,0 +1,82 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Poll-cycle regression gate: fails when a cycle needs more requests or bytes.
+
+Wall time is reported but not asserted here; a single iteration on a loaded
+runner is too noisy (the command line run gates on the median instead).
+"""
+
+import json
+
+import pytest
+from benchmark_poll_cycle import (
+    EXACT_METRICS,
+    THRESHOLDS,
+    check_thresholds,
+    main,
+    run_benchmark,
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", ["pymodbus", "native"])
+async def test_poll_cycles_stay_within_thresholds(transport):
+    report = await run_benchmark(iterations=1, transport=transport)
+    assert check_thresholds(report["results"], metrics=EXACT_METRICS) == []
+    for target, scenarios in report["results"].items():
+        for scenario, measured in scenarios.items():
+            assert measured["requests"] > 0, f"{target}/{scenario}"
+            assert measured["wall_time"] >= 0
+            assert measured["decode_cpu"] >= 0
+    assert set(report["decoders"]) == {"image", "compiled"}
+
+
+def test_check_thresholds_reports_extra_request():
+    results = {
+        "client": {
+            "cache_only": {
+                "requests": THRESHOLDS["client"]["cache_only"]["requests"] + 1,
+                "bytes": 0,
+                "wall_time": 0.0,
+            }
+        }
+    }
+    assert check_thresholds(results) == [
+        "client/cache_only: requests=2 > 1",
+    ]
+
+
+def test_check_thresholds_can_skip_wall_time():
+    results = {
+        "client": {
+            "cache_only": {
+                "requests": 1,
+                "bytes": 57,
+                "wall_time": THRESHOLDS["client"]["cache_only"]["wall_time"] * 10,
+            }
+        }
+    }
+    assert check_thresholds(results, metrics=EXACT_METRICS) == []
+    assert len(check_thresholds(results)) == 1
+
+
+def test_main_writes_json_and_sets_exit_code(tmp_path, monkeypatch):
+    async def fake_run(iterations, framer, latency, transport):
+        return {"results": {}, "violations": ["client/full_read: requests=99 > 11"]}
+
+    monkeypatch.setattr("benchmark_poll_cycle.run_benchmark", fake_run)
+    output = tmp_path / "bench.json"
+    assert main(["--output", str(output), "--iterations", "1"]) == 1
+    assert json.loads(output.read_text())["violations"]
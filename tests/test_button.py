@@ -27,6 +27,7 @@ def mock_coordinator():
     mock.winter_mode = False
     mock.client = AsyncMock()
     mock.async_request_refresh = AsyncMock()
+    mock.async_refresh_registers = AsyncMock()
     config_entry = MagicMock()
     config_entry.entry_id = "test_entry"
     config_entry.unique_id = "test_slug"
@@ -53,6 +54,7 @@ async def test_button_press_sync_time(mock_coordinator, button_props):
     ent.hass.config.time_zone = "Europe/Prague"
     await ent.async_press()
     assert mock_coordinator.client.async_write_register.called
+    mock_coordinator.async_refresh_registers.assert_awaited_once_with(0x0408)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,122 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from custom_components.vistapool.commit import CommitScheduler
+
+
+@pytest.mark.asyncio
+async def test_burst_of_writes_is_committed_once():
+    commit = AsyncMock(return_value=True)
+    scheduler = CommitScheduler(commit, quiet_delay=0.02, max_delay=1.0)
+    for _ in range(5):
+        scheduler.mark_dirty()
+        await asyncio.sleep(0.005)
+    commit.assert_not_awaited()
+    await asyncio.sleep(0.05)
+    commit.assert_awaited_once()
+    assert not scheduler.dirty
+    stats = scheduler.stats
+    assert stats["commits"] == 1
+    assert stats["coalesced_writes"] == 5
+    assert stats["average_latency"] is not None
+
+
+@pytest.mark.asyncio
+async def test_max_delay_bounds_a_continuous_burst():
+    commit = AsyncMock(return_value=True)
+    scheduler = CommitScheduler(commit, quiet_delay=0.05, max_delay=0.03)
+    scheduler.mark_dirty()
+    for _ in range(6):
+        await asyncio.sleep(0.01)
+        scheduler.mark_dirty()
+    assert commit.await_count >= 1
+    scheduler.cancel()
+
+
+@pytest.mark.asyncio
+async def test_flush_commits_immediately_and_only_when_dirty():
+    commit = AsyncMock(return_value=True)
+    scheduler = CommitScheduler(commit, quiet_delay=10, max_delay=10)
+    assert await scheduler.flush() is True
+    commit.assert_not_awaited()
+    scheduler.mark_dirty()
+    assert await scheduler.flush() is True
+    commit.assert_awaited_once()
+    assert scheduler.stats["pending"] is False
+    scheduler.cancel()
+
+
+@pytest.mark.asyncio
+async def test_failed_commit_stays_dirty():
+    commit = AsyncMock(side_effect=[Exception("timeout"), True])
+    scheduler = CommitScheduler(commit, quiet_delay=10, max_delay=10)
+    scheduler.mark_dirty()
+    assert await scheduler.flush() is False
+    assert scheduler.dirty
+    assert scheduler.stats["failed_commits"] == 1
+    assert scheduler.stats["pending_writes"] == 1
+    assert await scheduler.flush() is True
+    assert scheduler.stats["coalesced_writes"] == 1
+    scheduler.cancel()
+
+
+@pytest.mark.asyncio
+async def test_deferred_commit_gives_up_after_max_failures(caplog):
+    commit = AsyncMock(side_effect=Exception("timeout"))
+    scheduler = CommitScheduler(
+        commit, quiet_delay=0.001, max_delay=0.001, max_failures=3
+    )
+    scheduler.mark_dirty()
+    await asyncio.sleep(0.05)
+    assert commit.await_count == 3
+    assert scheduler.dirty
+    stats = scheduler.stats
+    assert stats["gave_up"] is True
+    assert stats["failed_commits"] == 3
+    assert stats["last_error"] == "timeout"
+    assert "failed 3 times in a row" in caplog.text
+
+    # A new write starts retrying again
+    commit.side_effect = None
+    commit.return_value = True
+    scheduler.mark_dirty()
+    await asyncio.sleep(0.05)
+    assert not scheduler.dirty
+    assert scheduler.stats["gave_up"] is False
+    assert scheduler.stats["coalesced_writes"] == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_commit_stays_dirty():
+    started = asyncio.Event()
+
+    async def commit():
+        started.set()
+        await asyncio.Event().wait()
+
+    scheduler = CommitScheduler(commit, quiet_delay=10, max_delay=10)
+    scheduler.mark_dirty()
+    task = asyncio.create_task(scheduler.flush())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert scheduler.dirty
+    assert scheduler.stats["pending_writes"] == 1
+    scheduler.cancel()
@@ -39,6 +39,7 @@ async def test_show_user_form_on_init():
     assert "slave_id" in str(schema)
     assert "name" in str(schema)
     assert "modbus_framer" in str(schema)
+    assert "modbus_transport" in str(schema)
 
 
 @pytest.mark.asyncio
@@ -81,6 +82,26 @@ async def test_create_entry_with_rtu_framer():
         assert result["data"]["modbus_framer"] == "rtu"
 
 
+@pytest.mark.asyncio
+async def test_create_entry_with_native_transport():
+    """Test that modbus_transport='native' is accepted and stored in config entry."""
+    flow = config_flow.VistaPoolConfigFlow()
+    user_input = {
+        "host": "192.168.1.100",
+        "port": DEFAULT_PORT,
+        "slave_id": 1,
+        "name": "Test Pool Native",
+        "modbus_transport": "native",
+    }
+    with patch(
+        "custom_components.vistapool.config_flow.is_host_port_open",
+        new=AsyncMock(return_value=True),
+    ):
+        result = await flow.async_step_user(user_input)
+        assert result["type"] == "create_entry"
+        assert result["data"]["modbus_transport"] == "native"
+
+
 @pytest.mark.asyncio
 async def test_create_entry_failure():
     flow = config_flow.VistaPoolConfigFlow()
@@ -131,6 +152,7 @@ async def test_reconfigure_shows_form_with_current_data():
         "port": 502,
         "slave_id": 2,
         "modbus_framer": "rtu",
+        "modbus_transport": "native",
         "name": "MyPool",
         "scan_interval": 30,
     }
@@ -157,6 +179,7 @@ async def test_reconfigure_shows_form_with_current_data():
     assert schema_defaults["port"] == existing_data["port"]
     assert schema_defaults["slave_id"] == existing_data["slave_id"]
     assert schema_defaults["modbus_framer"] == existing_data["modbus_framer"]
+    assert schema_defaults["modbus_transport"] == existing_data["modbus_transport"]
 
 
 @pytest.mark.asyncio
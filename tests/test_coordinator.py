@@ -19,7 +19,18 @@ from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
 from custom_components.vistapool.const import FOLLOW_UP_REFRESH_DELAY
-from custom_components.vistapool.coordinator import VistaPoolCoordinator
+from custom_components.vistapool.coordinator import (
+    CoordinatorData,
+    VistaPoolCoordinator,
+)
+from custom_components.vistapool.modbus import WriteTransaction
+
+
+def _mock_client():
+    """Client mock whose register image is taken over as a whole every poll."""
+    client = AsyncMock()
+    client.take_changed_keys = MagicMock(return_value=None)
+    return client
 
 
 @pytest.fixture
@@ -34,7 +45,7 @@ def mock_entry():
 
 @pytest.mark.asyncio
 async def test_async_update_data_success(mock_entry):
-    client = AsyncMock()
+    client = _mock_client()
     # Simulate async_read_all returns base dict
     client.async_read_all = AsyncMock(return_value={"MBF_POWER_MODULE_VERSION": 0x1234})
     client.read_all_timers = AsyncMock(return_value={})
@@ -47,10 +58,19 @@ async def test_async_update_data_success(mock_entry):
     assert coordinator.model == "VistaPool"
 
 
+def test_verify_interval_option_sets_client_window(mock_entry):
+    client = MagicMock()
+    VistaPoolCoordinator(MagicMock(), client, mock_entry, mock_entry.entry_id)
+    assert client.verify_window == 30 * 60
+    mock_entry.options = {"verify_interval": 120}
+    VistaPoolCoordinator(MagicMock(), client, mock_entry, mock_entry.entry_id)
+    assert client.verify_window == 120 * 60
+
+
 @pytest.mark.asyncio
 async def test_async_update_data_raises_UpdateFailed_on_subsequent_error(mock_entry):
     """When cached data exists, a Modbus error raises UpdateFailed (not a silent cache return)."""
-    client = AsyncMock()
+    client = _mock_client()
     client.async_read_all = AsyncMock(side_effect=Exception("Modbus fail"))
     client.read_all_timers = AsyncMock()
     coordinator = VistaPoolCoordinator(
@@ -64,7 +84,7 @@ async def test_async_update_data_raises_UpdateFailed_on_subsequent_error(mock_en
 
 @pytest.mark.asyncio
 async def test_async_update_data_raises_ConfigEntryNotReady_on_first_error(mock_entry):
-    client = AsyncMock()
+    client = _mock_client()
     client.async_read_all = AsyncMock(side_effect=Exception("fail"))
     client.read_all_timers = AsyncMock()
     coordinator = VistaPoolCoordinator(
@@ -80,7 +100,7 @@ async def test_async_update_data_raises_UpdateFailed_when_data_is_empty_dict(
     mock_entry,
 ):
     """An empty dict ({}) is treated as 'data was received' — subsequent errors raise UpdateFailed."""
-    client = AsyncMock()
+    client = _mock_client()
     client.async_read_all = AsyncMock(side_effect=Exception("fail"))
     client.read_all_timers = AsyncMock()
     coordinator = VistaPoolCoordinator(
@@ -101,7 +121,7 @@ async def test_async_update_data_time_sync(mock_entry):
     entry.data = {"name": "Test Pool"}
     entry.entry_id = "entry_id_321"
     entry.unique_id = "test_slug"
-    client = AsyncMock()
+    client = _mock_client()
     client.async_read_all = AsyncMock(return_value={"MBF_POWER_MODULE_VERSION": 0x2345})
     client.read_all_timers = AsyncMock(return_value={})
     client.async_write_register = AsyncMock()
@@ -148,7 +168,7 @@ def test_firmware_and_model_property(mock_entry):
 @pytest.mark.asyncio
 async def test_async_update_data_timer_processing(mock_entry):
     # Prepare a fake timer block with different value combinations
-    client = AsyncMock()
+    client = _mock_client()
     client.async_read_all = AsyncMock(
         return_value={
             "MBF_POWER_MODULE_VERSION": 0x1234,
@@ -224,9 +244,137 @@ async def test_async_update_data_timer_processing(mock_entry):
     assert data["FILTRATION_REMAINING"] == 1200
 
 
+@pytest.mark.asyncio
+async def test_filtration_countdown_extrapolated_between_resyncs(mock_entry):
+    client = _mock_client()
+    client.async_read_all = AsyncMock(return_value={"Filtration Pump": True})
+    timer = {"enable": 1, "on": 0, "interval": 3600, "period": 0, "countdown": 1200}
+    client.read_all_timers = AsyncMock(
+        return_value={
+            ft: dict(timer) for ft in ("filtration1", "filtration2", "filtration3")
+        }
+    )
+    coordinator = VistaPoolCoordinator(
+        MagicMock(), client, mock_entry, mock_entry.entry_id
+    )
+    with patch("custom_components.vistapool.countdown.time.monotonic") as clock:
+        clock.return_value = 1000.0
+        coordinator.data = await coordinator._async_update_data()
+        assert client.read_all_timers.call_args.kwargs["force_read"] is not None
+
+        # Cached blocks are served by the client, the countdown runs locally
+        clock.return_value = 1060.0
+        coordinator.data = await coordinator._async_update_data()
+        assert client.read_all_timers.call_args.kwargs["force_read"] is None
+        assert coordinator.data["filtration1_countdown"] == 1140
+        assert coordinator.data["FILTRATION_REMAINING"] == 1140
+
+        # Relay switching off resynchronises from the device
+        client.async_read_all.return_value = {"Filtration Pump": False}
+        data = await coordinator._async_update_data()
+        assert client.read_all_timers.call_args.kwargs["force_read"] is not None
+        assert data["filtration1_countdown"] == 1200
+
+
+@pytest.mark.asyncio
+async def test_refresh_registers_reads_only_affected_page(mock_entry):
+    client = _mock_client()
+    client.async_refresh_pages = AsyncMock(return_value=({"MBF_PAR_PH1": 7.5}, {}))
+    client.take_changed_keys.return_value = frozenset({"MBF_PAR_PH1"})
+    coordinator = VistaPoolCoordinator(
+        MagicMock(), client, mock_entry, mock_entry.entry_id
+    )
+    coordinator.data = coordinator._client_data = CoordinatorData(
+        {"MBF_PAR_PH1": 7.2, "MBF_MEASURE_PH": 7.3}
+    )
+    coordinator.async_set_updated_data = MagicMock()
+    coordinator.async_request_refresh = AsyncMock()
+
+    await coordinator.async_refresh_registers(0x0504)
+
+    client.async_refresh_pages.assert_awaited_once_with({"USER"}, set())
+    coordinator.async_request_refresh.assert_not_awaited()
+    data = coordinator.async_set_updated_data.call_args.args[0]
+    assert data is coordinator.data  # updated in place
+    assert data["MBF_PAR_PH1"] == 7.5
+    assert data["MBF_MEASURE_PH"] == 7.3
+
+
+@pytest.mark.asyncio
+async def test_refresh_registers_refreshes_all_when_image_was_replaced(mock_entry):
+    client = _mock_client()
+    client.async_refresh_pages = AsyncMock(return_value=({"MBF_PAR_PH1": 7.5}, {}))
+    coordinator = VistaPoolCoordinator(
+        MagicMock(), client, mock_entry, mock_entry.entry_id
+    )
+    coordinator.data = coordinator._client_data = CoordinatorData({"MBF_PAR_PH1": 7})
+    coordinator.async_set_updated_data = MagicMock()
+    coordinator.async_request_refresh = AsyncMock()
+
+    await coordinator.async_refresh_registers(0x0504)
+
+    coordinator.async_set_updated_data.assert_not_called()
+    coordinator.async_request_refresh.assert_awaited_once()
+    assert coordinator._client_data is None  # the next poll rebuilds the data
+
+
+@pytest.mark.asyncio
+async def test_refresh_registers_updates_timer_keys(mock_entry):
+    client = _mock_client()
+    timer = {"enable": 1, "on": 3600, "interval": 1800, "period": 0, "countdown": 0}
+    client.async_refresh_pages = AsyncMock(return_value=({}, {"filtration1": timer}))
+    client.take_changed_keys.return_value = frozenset()
+    coordinator = VistaPoolCoordinator(
+        MagicMock(), client, mock_entry, mock_entry.entry_id
+    )
+    coordinator.data = coordinator._client_data = CoordinatorData(
+        {"filtration1_interval": 600}
+    )
+    coordinator.async_set_updated_data = MagicMock()
+
+    await coordinator.async_refresh_registers(0x0434)
+
+    client.async_refresh_pages.assert_awaited_once_with(set(), {"filtration1"})
+    data = coordinator.async_set_updated_data.call_args.args[0]
+    assert data["filtration1_interval"] == 1800
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("address", [0x0102, 0xFFFF])
+async def test_refresh_registers_falls_back_for_unpaged_register(mock_entry, address):
+    client = _mock_client()
+    coordinator = VistaPoolCoordinator(
+        MagicMock(), client, mock_entry, mock_entry.entry_id
+    )
+    coordinator.data = {}
+    coordinator.async_request_refresh = AsyncMock()
+
+    await coordinator.async_refresh_registers(address)
+
+    client.async_refresh_pages.assert_not_awaited()
+    coordinator.async_request_refresh.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_refresh_registers_falls_back_on_read_error(mock_entry):
+    client = _mock_client()
+    client.async_refresh_pages = AsyncMock(side_effect=TimeoutError("no response"))
+    coordinator = VistaPoolCoordinator(
+        MagicMock(), client, mock_entry, mock_entry.entry_id
+    )
+    coordinator.data = {}
+    coordinator.async_set_updated_data = MagicMock()
+    coordinator.async_request_refresh = AsyncMock()
+
+    await coordinator.async_refresh_registers(0x0504)
+
+    coordinator.async_request_refresh.assert_awaited_once()
+    coordinator.async_set_updated_data.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_setpoint_sync_on_mismatch(mock_entry):
-    client = AsyncMock()
+    client = _mock_client()
     # Return differing setpoints to trigger sync
     client.async_read_all = AsyncMock(
         return_value={
@@ -261,7 +409,7 @@ async def test_setpoint_sync_on_mismatch(mock_entry):
 
 @pytest.mark.asyncio
 async def test_setpoint_sync_on_mismatch_intel_changed(mock_entry):
-    client = AsyncMock()
+    client = _mock_client()
     # Return differing setpoints to trigger sync
     client.async_read_all = AsyncMock(
         return_value={
@@ -293,7 +441,7 @@ async def test_setpoint_sync_on_mismatch_intel_changed(mock_entry):
 
 @pytest.mark.asyncio
 async def test_setpoint_sync_both_changed_conflict(mock_entry):
-    client = AsyncMock()
+    client = _mock_client()
     # Both changed to different values in this cycle
     client.async_read_all = AsyncMock(
         return_value={
@@ -304,6 +452,9 @@ async def test_setpoint_sync_both_changed_conflict(mock_entry):
     )
     client.read_all_timers = AsyncMock(return_value={})
     client.async_write_register = AsyncMock()
+    client.transaction = MagicMock(
+        side_effect=lambda apply=False: WriteTransaction(client, apply)
+    )
     coordinator = VistaPoolCoordinator(
         MagicMock(), client, mock_entry, mock_entry.entry_id
     )
@@ -313,13 +464,13 @@ async def test_setpoint_sync_both_changed_conflict(mock_entry):
         "MBF_PAR_INTELLIGENT_TEMP": 27,
     }
     data = await coordinator._async_update_data()
-    # Both changed simultaneously → revert both to previous values
-    # Expect 2 writes: one for heating (apply=False), one for intelligent (apply=True)
-    assert client.async_write_register.await_count == 2
-    # First write: revert heating to 27 (apply=False)
-    client.async_write_register.assert_any_await(0x0416, 27, apply=False)
-    # Second write: revert intelligent to 27 (apply=True)
-    client.async_write_register.assert_any_await(0x041C, 27, apply=True)
+    # Both changed simultaneously → revert both to previous values in one
+    # transaction, saved and executed once
+    client.async_write_register.assert_not_awaited()
+    client.async_write_transaction.assert_awaited_once()
+    tx = client.async_write_transaction.await_args.args[0]
+    assert tx.blocks == [(0x0416, [27]), (0x041C, [27])]
+    assert tx.save and tx.execute
     # Data should be reverted to previous values
     assert data["MBF_PAR_HEATING_TEMP"] == 27
     assert data["MBF_PAR_INTELLIGENT_TEMP"] == 27
@@ -327,7 +478,7 @@ async def test_setpoint_sync_both_changed_conflict(mock_entry):
 
 @pytest.mark.asyncio
 async def test_setpoint_sync_both_equal_no_conflict(mock_entry):
-    client = AsyncMock()
+    client = _mock_client()
     # Both setpoints are equal, so no conflict even if both changed
     client.async_read_all = AsyncMock(
         return_value={
@@ -356,7 +507,7 @@ async def test_setpoint_sync_both_equal_no_conflict(mock_entry):
 
 @pytest.mark.asyncio
 async def test_setpoint_sync_initial_mismatch(mock_entry):
-    client = AsyncMock()
+    client = _mock_client()
     # Setpoints differ but neither changed (initial state or manual device change)
     client.async_read_all = AsyncMock(
         return_value={
@@ -396,7 +547,7 @@ async def test_dev_overrides_applied_valid_json(mock_entry):
     entry.entry_id = "entry_id_dev1"
     entry.unique_id = "test_slug"
 
-    client = AsyncMock()
+    client = _mock_client()
     client.async_read_all = AsyncMock(
         return_value={
             "MBF_POWER_MODULE_VERSION": 0x1234,
@@ -424,7 +575,7 @@ async def test_dev_overrides_invalid_json_ignored(mock_entry):
     entry.entry_id = "entry_id_dev2"
     entry.unique_id = "test_slug"
 
-    client = AsyncMock()
+    client = _mock_client()
     client.async_read_all = AsyncMock(return_value={"X": 1})
     client.read_all_timers = AsyncMock(return_value={})
 
@@ -450,7 +601,7 @@ async def test_winter_mode_returns_empty_dict_when_no_cached_data(mock_entry):
     """Winter mode with no data and no saved capabilities returns {} without calling Modbus."""
     mock_entry.options = {"winter_mode": True}
 
-    client = AsyncMock()
+    client = _mock_client()
     client.async_read_all = AsyncMock()
     client.read_all_timers = AsyncMock()
 
@@ -472,7 +623,7 @@ async def test_winter_mode_returns_frozen_cached_data(mock_entry):
     """Winter mode with existing cached data returns that data unchanged."""
     mock_entry.options = {"winter_mode": True}
 
-    client = AsyncMock()
+    client = _mock_client()
     client.async_read_all = AsyncMock()
     client.read_all_timers = AsyncMock()
 
@@ -493,7 +644,7 @@ async def test_winter_mode_disabled_resumes_modbus(mock_entry):
     """When winter_mode is False the coordinator communicates normally."""
     mock_entry.options = {"winter_mode": False}
 
-    client = AsyncMock()
+    client = _mock_client()
     client.async_read_all = AsyncMock(return_value={"MBF_POWER_MODULE_VERSION": 0x0100})
     client.read_all_timers = AsyncMock(return_value={})
 
@@ -584,7 +735,7 @@ async def test_winter_mode_restores_capabilities_from_options_on_restart(mock_en
     saved_caps = {"MBF_PAR_MODEL": 3, "MBF_PAR_TEMPERATURE_ACTIVE": 1}
     mock_entry.options = {"winter_mode": True, "_capabilities": saved_caps}
 
-    client = AsyncMock()
+    client = _mock_client()
     client.async_read_all = AsyncMock()
 
     coordinator = VistaPoolCoordinator(
@@ -606,7 +757,7 @@ async def test_async_update_data_updates_capability_snapshot(mock_entry):
     and persists it to entry.options so it survives HA restarts while Modbus is down."""
     mock_entry.options = {"winter_mode": False}
 
-    client = AsyncMock()
+    client = _mock_client()
     client.async_read_all = AsyncMock(
         return_value={
             "MBF_POWER_MODULE_VERSION": 0x0100,
@@ -638,7 +789,7 @@ async def test_async_update_data_updates_capability_snapshot(mock_entry):
 @pytest.mark.asyncio
 async def test_request_refresh_with_followup(mock_entry, monkeypatch):
     """request_refresh_with_followup schedules a follow-up without immediate refresh."""
-    client = AsyncMock()
+    client = _mock_client()
     hass = MagicMock()
     coordinator = VistaPoolCoordinator(hass, client, mock_entry, mock_entry.entry_id)
     coordinator.async_request_refresh = AsyncMock()
@@ -662,7 +813,7 @@ async def test_request_refresh_with_followup(mock_entry, monkeypatch):
 @pytest.mark.asyncio
 async def test_request_refresh_with_followup_custom_delay(mock_entry, monkeypatch):
     """Follow-up delay can be customized."""
-    client = AsyncMock()
+    client = _mock_client()
     hass = MagicMock()
     coordinator = VistaPoolCoordinator(hass, client, mock_entry, mock_entry.entry_id)
     coordinator.async_request_refresh = AsyncMock()
@@ -684,7 +835,7 @@ async def test_request_refresh_with_followup_custom_delay(mock_entry, monkeypatc
 @pytest.mark.asyncio
 async def test_follow_up_cancels_previous(mock_entry, monkeypatch):
     """A new follow-up refresh cancels any previously scheduled one."""
-    client = AsyncMock()
+    client = _mock_client()
     hass = MagicMock()
     coordinator = VistaPoolCoordinator(hass, client, mock_entry, mock_entry.entry_id)
     coordinator.async_request_refresh = AsyncMock()
@@ -708,7 +859,7 @@ async def test_follow_up_cancels_previous(mock_entry, monkeypatch):
 @pytest.mark.asyncio
 async def test_follow_up_callback_triggers_refresh(mock_entry, monkeypatch):
     """The scheduled follow-up callback clears unsub and creates a refresh task."""
-    client = AsyncMock()
+    client = _mock_client()
     hass = MagicMock()
     coordinator = VistaPoolCoordinator(hass, client, mock_entry, mock_entry.entry_id)
     coordinator.async_request_refresh = AsyncMock()
@@ -737,7 +888,7 @@ async def test_follow_up_callback_triggers_refresh(mock_entry, monkeypatch):
 @pytest.mark.asyncio
 async def test_cancel_follow_up_refresh(mock_entry, monkeypatch):
     """cancel_follow_up_refresh cancels a pending follow-up and clears the handle."""
-    client = AsyncMock()
+    client = _mock_client()
     hass = MagicMock()
     coordinator = VistaPoolCoordinator(hass, client, mock_entry, mock_entry.entry_id)
     coordinator.async_request_refresh = AsyncMock()
@@ -762,9 +913,181 @@ async def test_cancel_follow_up_refresh(mock_entry, monkeypatch):
 @pytest.mark.asyncio
 async def test_cancel_follow_up_refresh_noop_when_none(mock_entry):
     """cancel_follow_up_refresh is safe to call when no follow-up is pending."""
-    client = AsyncMock()
+    client = _mock_client()
     hass = MagicMock()
     coordinator = VistaPoolCoordinator(hass, client, mock_entry, mock_entry.entry_id)
     assert coordinator._follow_up_unsub is None
     coordinator.cancel_follow_up_refresh()  # should not raise
     assert coordinator._follow_up_unsub is None
+
+
+def test_register_entity_keys_updates_client_required_keys(mock_entry):
+    """Registering/unregistering entity keys recomputes the client's required keys."""
+    client = MagicMock()
+    client.required_keys = None
+    coordinator = VistaPoolCoordinator(
+        MagicMock(), client, mock_entry, mock_entry.entry_id
+    )
+
+    unregister = coordinator.async_register_entity_keys(("MBF_CELL_BOOST",))
+    assert "MBF_CELL_BOOST" in client.required_keys
+    assert "MBF_PAR_MODEL" in client.required_keys  # capability key always kept
+
+    unregister()
+    assert "MBF_CELL_BOOST" not in client.required_keys
+    assert "MBF_PAR_MODEL" in client.required_keys
+    # Unregistering twice is harmless
+    unregister()
+
+
+@pytest.mark.asyncio
+async def test_register_cache_restored_and_saved_on_change(mock_entry):
+    """The saved image seeds the client; a new image is saved only after page reads."""
+    client = MagicMock()
+    client.restore_cache = MagicMock(return_value=True)
+    client.cache_generation = 0
+    client.export_cache = MagicMock(return_value={"result": {"a": 1}})
+    client.async_read_all = AsyncMock(return_value={})
+    client.read_all_timers = AsyncMock(return_value={})
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value={"result": {"a": 0}})
+    coordinator = VistaPoolCoordinator(
+        MagicMock(), client, mock_entry, mock_entry.entry_id
+    )
+    with patch(
+        "custom_components.vistapool.coordinator.register_cache_store",
+        return_value=store,
+    ):
+        await coordinator.async_load_register_cache()
+    client.restore_cache.assert_called_once_with({"result": {"a": 0}})
+
+    await coordinator._async_update_data()
+    store.async_delay_save.assert_not_called()
+
+    client.cache_generation = 1
+    await coordinator._async_update_data()
+    store.async_delay_save.assert_called_once()
+    assert store.async_delay_save.call_args[0][0]() == {"result": {"a": 1}}
+
+    await coordinator._async_update_data()
+    store.async_delay_save.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_register_cache_missing_on_first_start(mock_entry):
+    client = MagicMock()
+    client.restore_cache = MagicMock()
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=None)
+    coordinator = VistaPoolCoordinator(
+        MagicMock(), client, mock_entry, mock_entry.entry_id
+    )
+    with patch(
+        "custom_components.vistapool.coordinator.register_cache_store",
+        return_value=store,
+    ):
+        await coordinator.async_load_register_cache()
+    client.restore_cache.assert_not_called()
+
+
+def test_changed_keys_follow_data_and_context(mock_entry):
+    """Listeners learn which keys changed; context changes wake every entity."""
+    coordinator = VistaPoolCoordinator(
+        MagicMock(), MagicMock(), mock_entry, mock_entry.entry_id
+    )
+    coordinator.async_set_updated_data({"a": 1, "b": [1, 2]})
+    assert coordinator.changed_keys is None
+    assert isinstance(coordinator.data, CoordinatorData)
+
+    coordinator.async_set_updated_data({"a": 1, "b": [1, 3], "c": 0})
+    assert coordinator.changed_keys == frozenset({"b", "c"})
+
+    # Optimistic update: data mutated in place and pushed again
+    coordinator.data["a"] = 2
+    coordinator.async_set_updated_data(coordinator.data)
+    assert coordinator.changed_keys == frozenset({"a"})
+
+    coordinator.async_set_updated_data(dict(coordinator.data))
+    assert coordinator.changed_keys == frozenset()
+
+    coordinator.winter_mode = True
+    coordinator.async_set_updated_data(dict(coordinator.data))
+    assert coordinator.changed_keys is None
+
+
+@pytest.mark.asyncio
+async def test_poll_updates_data_in_place_with_changed_registers(mock_entry):
+    """Later polls take over only the changed registers, without copying the data."""
+    image = {"MBF_POWER_MODULE_VERSION": 0x1234, "a": 1, "b": 2}
+    client = _mock_client()
+    client.async_read_all = AsyncMock(return_value=image)
+    client.read_all_timers = AsyncMock(return_value={})
+    coordinator = VistaPoolCoordinator(
+        MagicMock(), client, mock_entry, mock_entry.entry_id
+    )
+    coordinator.async_set_updated_data(await coordinator._async_update_data())
+    data = coordinator.data
+
+    image["a"] = 10
+    client.take_changed_keys.return_value = frozenset({"a"})
+    # Optimistic value never confirmed by the device
+    data["b"] = 5
+    coordinator.async_set_updated_data(data)
+    assert coordinator.changed_keys == frozenset({"b"})
+
+    coordinator.async_set_updated_data(await coordinator._async_update_data())
+    assert coordinator.data is data
+    assert data["a"] == 10
+    assert data["b"] == 2  # reset to the device value
+    assert coordinator.changed_keys == frozenset({"a", "b"})
+
+    # A replaced register image is taken over as a whole
+    client.take_changed_keys.return_value = None
+    coordinator.async_set_updated_data(await coordinator._async_update_data())
+    assert coordinator.data is not data
+    assert coordinator.changed_keys == frozenset()
+
+
+def test_derived_keys_are_computed_on_first_access():
+    calls = []
+
+    def compute(a, b):
+        calls.append((a, b))
+        return {"SUM": a + b, "DIFF": a - b}
+
+    data = CoordinatorData({"a": 1})
+    data.add_derived(("SUM", "DIFF"), compute, 3, 1)
+    assert len(data) == 3 and "SUM" in data
+    assert calls == []
+    assert data["SUM"] == 4
+    assert data.get("DIFF") == 2
+    assert calls == [(3, 1)]
+    assert data == {"a": 1, "SUM": 4, "DIFF": 2}
+
+    # Writing a derived key turns it into a plain value
+    data["SUM"] = 10
+    assert data.derived_tokens == {"DIFF": (3, 1)}
+
+
+def test_changed_keys_compare_derived_arguments(mock_entry):
+    coordinator = VistaPoolCoordinator(
+        MagicMock(), MagicMock(), mock_entry, mock_entry.entry_id
+    )
+    compute = MagicMock(side_effect=lambda v: {"T_on": v})
+
+    def update(value):
+        data = CoordinatorData({"a": 1})
+        data.add_derived(("T_on",), compute, value)
+        coordinator.async_set_updated_data(data)
+
+    update(5)
+    update(5)
+    assert coordinator.changed_keys == frozenset()
+    update(6)
+    assert coordinator.changed_keys == frozenset({"T_on"})
+    compute.assert_not_called()
+
+    # Optimistic in-place write of a derived key
+    coordinator.data["T_on"] = 7
+    coordinator.async_set_updated_data(coordinator.data)
+    assert coordinator.changed_keys == frozenset({"T_on"})
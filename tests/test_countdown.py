@@ -0,0 +1,100 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from custom_components.vistapool import countdown
+from custom_components.vistapool.countdown import RESYNC_INTERVAL, CountdownModel
+
+NAMES = ("filtration1", "filtration2")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(countdown.time, "monotonic", fake)
+    return fake
+
+
+def _sync(model, running=True):
+    """Resync both timers as the coordinator does after a forced read."""
+    assert model.resync_due(NAMES, running)
+    model.countdown("filtration1", 1200, fresh=True)
+    model.countdown("filtration2", 0, fresh=True)
+
+
+def test_first_running_poll_needs_resync(clock):
+    model = CountdownModel()
+    assert model.resync_due(NAMES, running=True)
+
+
+def test_idle_timers_are_not_resynced(clock):
+    model = CountdownModel()
+    assert not model.resync_due(NAMES, running=False)
+    assert model.countdown("filtration1", 300, fresh=False) == 300
+    clock.now += 60
+    assert not model.resync_due(NAMES, running=False)
+    assert model.countdown("filtration1", 300, fresh=False) == 300
+
+
+def test_running_countdown_is_extrapolated_between_reads(clock):
+    model = CountdownModel()
+    _sync(model)
+    clock.now += 90.5
+    assert not model.resync_due(NAMES, running=True)
+    assert model.countdown("filtration1", 1200, fresh=False) == 1110
+    assert model.countdown("filtration2", 0, fresh=False) == 0
+    clock.now += 5000
+    assert model.countdown("filtration1", 1200, fresh=False) == 0
+
+
+def test_resync_after_interval(clock):
+    model = CountdownModel()
+    _sync(model)
+    clock.now += RESYNC_INTERVAL - 1
+    assert not model.resync_due(NAMES, running=True)
+    clock.now += 1
+    assert model.resync_due(NAMES, running=True)
+
+
+def test_resync_when_running_state_changes(clock):
+    model = CountdownModel()
+    _sync(model)
+    assert model.resync_due(NAMES, running=False)
+    assert not model.resync_due(NAMES, running=False)
+
+
+def test_changed_value_becomes_new_anchor(clock):
+    """A value read by the client on its own (e.g. INSTALLER notification)."""
+    model = CountdownModel()
+    _sync(model)
+    clock.now += 100
+    assert model.countdown("filtration1", 1000, fresh=False) == 1000
+    clock.now += 10
+    assert model.countdown("filtration1", 1000, fresh=False) == 990
+
+
+def test_reset_forgets_anchors(clock):
+    model = CountdownModel()
+    _sync(model)
+    model.reset()
+    assert model.resync_due(NAMES, running=True)
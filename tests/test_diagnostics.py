@@ -44,6 +44,7 @@ async def test_async_get_config_entry_diagnostics_filters_sensitive_data():
         "unit_id": 1,
         "connected": True,
     }
+    client.register_snapshot.raw_pages.return_value = {"MEASURE": [0, 820]}
 
     # Prepare a mock coordinator
     coordinator = MagicMock()
@@ -75,6 +76,7 @@ async def test_async_get_config_entry_diagnostics_filters_sensitive_data():
     assert diagnostics["coordinator"]["firmware"] == "1.0"
     assert diagnostics["coordinator"]["model"] == "Vistapool"
     assert diagnostics["connection_stats"]["retries"] == 3
+    assert diagnostics["raw_registers"] == {"MEASURE": [0, 820]}
 
 
 @pytest.mark.asyncio
@@ -15,7 +15,9 @@
 from unittest.mock import MagicMock
 
 import pytest
+from homeassistant.helpers.entity import Entity
 
+from custom_components.vistapool.coordinator import CoordinatorData
 from custom_components.vistapool.entity import VistaPoolEntity
 
 
@@ -101,3 +103,84 @@ def test_available_unaffected_by_winter_mode():
     entity = _make_entity(winter_mode=True)
     entity._winter_mode_active = False
     assert entity.available is True
+
+
+def test_data_keys_prefers_data_key():
+    """data_keys returns _data_key when set, otherwise _key."""
+    entity = _make_entity(winter_mode=False)
+    entity._key = "MBF_PAR_HIDRO_TEMP_SHUTDOWN"
+    assert entity.data_keys == ("MBF_PAR_HIDRO_TEMP_SHUTDOWN",)
+    entity._data_key = "MBF_PAR_HIDRO_COVER_ENABLE"
+    assert entity.data_keys == ("MBF_PAR_HIDRO_COVER_ENABLE",)
+
+
+def test_data_keys_empty_without_key():
+    assert _make_entity(winter_mode=False).data_keys == ()
+
+
+class _ValueEntity(VistaPoolEntity):
+    """Entity whose state reads 'value', and 'extra' only when value is set."""
+
+    def __init__(self, coordinator):
+        self.coordinator = coordinator
+        self.states = []
+
+    def _state(self):
+        data = self.coordinator.data
+        return (data.get("value"), data.get("extra") if data.get("value") else None)
+
+
+def _tracked_entity(data):
+    coordinator = MagicMock()
+    coordinator.data = CoordinatorData(data)
+    coordinator.changed_keys = None
+    entity = _ValueEntity(coordinator)
+    return entity, coordinator
+
+
+def _fake_write(self):
+    self.states.append(self._state())
+
+
+def test_state_write_records_keys_read(monkeypatch):
+    monkeypatch.setattr(Entity, "async_write_ha_state", _fake_write)
+    entity, coordinator = _tracked_entity({"value": 0, "extra": 5, "other": 1})
+    entity.async_write_ha_state()
+    assert entity._read_keys == frozenset({"value"})
+
+    coordinator.data["value"] = 1
+    entity.async_write_ha_state()
+    assert entity._read_keys == frozenset({"value", "extra"})
+
+
+def test_coordinator_update_skips_unaffected_entity(monkeypatch):
+    monkeypatch.setattr(Entity, "async_write_ha_state", _fake_write)
+    entity, coordinator = _tracked_entity({"value": 0, "extra": 5, "other": 1})
+    entity.async_write_ha_state()
+
+    coordinator.changed_keys = frozenset({"other", "extra"})
+    entity._handle_coordinator_update()
+    assert len(entity.states) == 1
+
+    coordinator.changed_keys = frozenset({"value"})
+    entity._handle_coordinator_update()
+    assert len(entity.states) == 2
+
+    coordinator.changed_keys = None  # e.g. availability changed
+    entity._handle_coordinator_update()
+    assert len(entity.states) == 3
+
+
+def test_iterating_data_depends_on_every_key():
+    data = CoordinatorData({"a": 1, "b": 2})
+    data.start_tracking()
+    assert "a" in data
+    assert data["b"] == 2
+    assert data.stop_tracking() == frozenset({"a", "b"})
+
+    data.start_tracking()
+    dict(data)
+    assert data.stop_tracking() is None
+    # Reads outside tracking are not recorded
+    data.get("a")
+    assert data.stop_tracking() is None
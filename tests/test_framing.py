@@ -0,0 +1,130 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+
+from custom_components.vistapool.framing import (
+    MAX_FC20_LENGTH,
+    Fc20FrameSplitter,
+    crc16,
+    mbap_frame_length,
+    rtu_frame_length,
+)
+
+
+def _rtu(*body: int) -> bytes:
+    data = bytes(body)
+    return data + struct.pack("<H", crc16(data))
+
+
+# Observed 27-byte Sugar Valley broadcast (data[6]=0x39, no usable length field)
+FC20_OBSERVED = _rtu(
+    0x01, 0x20, 0x02, 0x01, 0x00, 0x01, 0x39, 0x00, 0x5A, *([0x00] * 16)
+)
+FC03_RESPONSE = _rtu(0x01, 0x03, 0x04, 0x01, 0x20, 0x00, 0x64)
+MBAP_RESPONSE = bytes(
+    [0x00, 0x07, 0x00, 0x00, 0x00, 0x05, 0x01, 0x03, 0x02, 0x00, 0x64]
+)
+
+
+def test_crc16_known_vector():
+    assert crc16(bytes([0x01, 0x03, 0x02, 0x00, 0x64])) == 0xAFB9
+
+
+def test_frame_lengths():
+    assert rtu_frame_length(FC03_RESPONSE, 0) == len(FC03_RESPONSE)
+    assert rtu_frame_length(bytes([0x01, 0x83, 0x02]), 0) == 5
+    assert rtu_frame_length(bytes([0x01, 0x10]), 0) == 8
+    assert rtu_frame_length(bytes([0x01, 0x03]), 0) is None
+    assert rtu_frame_length(bytes([0x01, 0x2B, 0x00]), 0) == 0
+    assert mbap_frame_length(MBAP_RESPONSE, 0) == len(MBAP_RESPONSE)
+    assert mbap_frame_length(MBAP_RESPONSE[:5], 0) is None
+    assert mbap_frame_length(FC20_OBSERVED, 0) == 0
+
+
+def test_chunk_without_broadcast_is_forwarded_as_is():
+    splitter = Fc20FrameSplitter(1, rtu=True)
+    assert splitter.feed(FC03_RESPONSE) is FC03_RESPONSE
+
+
+def test_observed_broadcast_is_stripped_by_crc():
+    events = []
+    splitter = Fc20FrameSplitter(1, rtu=True, on_broadcast=events.append)
+    assert len(FC20_OBSERVED) == 27
+    assert splitter.feed(FC20_OBSERVED + FC03_RESPONSE) == FC03_RESPONSE
+    assert events == [FC20_OBSERVED]
+    assert splitter.stats == {
+        "filtered_frames": 1,
+        "recovered_responses": 1,
+        "discarded_bytes": 0,
+        "buffered_bytes": 0,
+    }
+
+
+def test_broadcast_between_two_responses_in_one_chunk():
+    splitter = Fc20FrameSplitter(1, rtu=True)
+    chunk = FC03_RESPONSE + FC20_OBSERVED + FC03_RESPONSE
+    assert splitter.feed(chunk) == FC03_RESPONSE + FC03_RESPONSE
+
+
+def test_response_continuation_looking_like_fc20_is_not_dropped():
+    """Register data [0x01, 0x20] at the start of a chunk is not a broadcast when
+    the splitter knows it is in the middle of a response."""
+    splitter = Fc20FrameSplitter(1, rtu=True)
+    assert splitter.feed(FC03_RESPONSE[:3]) == FC03_RESPONSE[:3]
+    assert splitter.feed(FC03_RESPONSE[3:]) == FC03_RESPONSE[3:]
+    assert splitter.filtered_frames == 0
+
+
+def test_broadcast_split_across_chunks_is_held_back():
+    splitter = Fc20FrameSplitter(1, rtu=True)
+    assert splitter.feed(FC20_OBSERVED[:10]) == b""
+    assert splitter.stats["buffered_bytes"] == 10
+    assert splitter.feed(FC20_OBSERVED[10:] + FC03_RESPONSE) == FC03_RESPONSE
+    assert splitter.stats["buffered_bytes"] == 0
+
+
+def test_partial_header_is_held_until_complete():
+    splitter = Fc20FrameSplitter(1, rtu=True)
+    assert splitter.feed(FC03_RESPONSE[:1]) == b""
+    assert splitter.feed(FC03_RESPONSE[1:]) == FC03_RESPONSE
+
+
+def test_socket_broadcast_and_tid_collision():
+    splitter = Fc20FrameSplitter(1, rtu=False)
+    tid_0120 = bytes([0x01, 0x20]) + MBAP_RESPONSE[2:]
+    assert splitter.feed(tid_0120) is tid_0120
+    assert splitter.feed(FC20_OBSERVED + MBAP_RESPONSE) == MBAP_RESPONSE
+    assert splitter.filtered_frames == 1
+
+
+def test_unknown_function_forwards_remaining_bytes():
+    splitter = Fc20FrameSplitter(1, rtu=True)
+    chunk = bytes([0x01, 0x2B, 0x0E, 0x01])
+    assert splitter.feed(chunk) == chunk
+
+
+def test_unterminated_broadcast_is_discarded_after_maximum_length():
+    splitter = Fc20FrameSplitter(1, rtu=True)
+    junk = bytes([0x01, 0x20]) + bytes([0xFF] * MAX_FC20_LENGTH)
+    assert splitter.feed(junk) == b""
+    assert splitter.discarded_bytes == len(junk)
+    assert splitter.feed(FC03_RESPONSE) is FC03_RESPONSE
+
+
+def test_reset_drops_partial_frame():
+    splitter = Fc20FrameSplitter(1, rtu=True)
+    splitter.feed(FC20_OBSERVED[:10])
+    splitter.reset()
+    assert splitter.feed(FC03_RESPONSE) is FC03_RESPONSE
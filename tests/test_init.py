@@ -19,6 +19,7 @@ from homeassistant.exceptions import ServiceValidationError
 
 from custom_components.vistapool import (
     _cleanup_removed_entities,
+    async_remove_entry,
     async_setup,
     async_setup_entry,
     async_unload_entry,
@@ -34,7 +35,7 @@ async def test_async_handle_set_timer_happy(monkeypatch):
     coordinator = hass.data["vistapool"]["entry1"]
     coordinator.client.write_timer = AsyncMock(return_value=True)
     coordinator.async_request_refresh = AsyncMock()
-    coordinator.request_refresh_with_followup = MagicMock()
+    coordinator.async_refresh_registers = AsyncMock()
 
     # Prepare call mock
     call = MagicMock()
@@ -59,7 +60,7 @@ async def test_async_handle_set_timer_happy(monkeypatch):
         {"on": 30600, "interval": 6300, "period": 1234, "enable": 1},
     )
     coordinator.async_request_refresh.assert_not_awaited()
-    coordinator.request_refresh_with_followup.assert_called_once()
+    coordinator.async_refresh_registers.assert_awaited_once_with(0x0434)
 
 
 @pytest.mark.asyncio
@@ -71,7 +72,7 @@ async def test_async_handle_set_timer_entry_id_fallback(monkeypatch):
     coordinator = hass.data["vistapool"]["fallback"]
     coordinator.client.write_timer = AsyncMock(return_value=True)
     coordinator.async_request_refresh = AsyncMock()
-    coordinator.request_refresh_with_followup = MagicMock()
+    coordinator.async_refresh_registers = AsyncMock()
 
     call = MagicMock()
     call.data = {
@@ -121,7 +122,7 @@ async def test_async_handle_set_timer_write_timer_exception(monkeypatch):
     coordinator = hass.data["vistapool"]["entryX"]
     coordinator.client.write_timer = AsyncMock(side_effect=Exception("fail!"))
     coordinator.async_request_refresh = AsyncMock()
-    coordinator.request_refresh_with_followup = MagicMock()
+    coordinator.async_refresh_registers = AsyncMock()
 
     call = MagicMock()
     call.data = {
@@ -189,6 +190,7 @@ async def test_async_setup_entry_success():
             mock_coord_instance.async_config_entry_first_refresh = AsyncMock(
                 return_value=None
             )
+            mock_coord_instance.async_load_register_cache = AsyncMock()
             with patch("custom_components.vistapool.er.async_get") as mock_er_get:
                 mock_registry = MagicMock()
                 mock_er_get.return_value = mock_registry
@@ -198,6 +200,23 @@ async def test_async_setup_entry_success():
                 ):
                     result = await async_setup_entry(hass, config_entry)
                     assert result is True
+            mock_coord_instance.async_load_register_cache.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_remove_entry_deletes_register_cache():
+    """Removing the config entry deletes its persisted register image."""
+    config_entry = MagicMock()
+    config_entry.entry_id = "entry1"
+    store = MagicMock()
+    store.async_remove = AsyncMock()
+    with patch(
+        "custom_components.vistapool.register_cache_store", return_value=store
+    ) as factory:
+        await async_remove_entry(MagicMock(), config_entry)
+    factory.assert_called_once()
+    assert factory.call_args[0][1] == "entry1"
+    store.async_remove.assert_awaited_once()
 
 
 @pytest.mark.asyncio
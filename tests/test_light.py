@@ -18,6 +18,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from custom_components.vistapool.light import VistaPoolLight, async_setup_entry
+from custom_components.vistapool.modbus import WriteTransaction
 
 
 @pytest.fixture(autouse=True)
@@ -33,6 +34,9 @@ def mock_coordinator():
     mock.device_slug = "vistapool"
     mock.winter_mode = False
     mock.client = AsyncMock()
+    mock.client.transaction = MagicMock(
+        side_effect=lambda apply=False: WriteTransaction(mock.client, apply)
+    )
     mock.async_request_refresh = AsyncMock()
     mock.request_refresh_with_followup = MagicMock()
     config_entry = MagicMock()
@@ -74,7 +78,9 @@ async def test_light_async_turn_on(mock_coordinator, light_props):
     ent.hass = MagicMock()
     ent.async_write_ha_state = MagicMock()
     await ent.async_turn_on()
-    assert mock_coordinator.client.async_write_register.called
+    tx = mock_coordinator.client.async_write_transaction.await_args.args[0]
+    assert tx.blocks == [(0x0100, [ent.function_code]), (0x0200, [3])]
+    assert tx.execute
 
 
 @pytest.mark.asyncio
@@ -85,7 +91,9 @@ async def test_light_async_turn_off(mock_coordinator, light_props):
     ent.hass = MagicMock()
     ent.async_write_ha_state = MagicMock()
     await ent.async_turn_off()
-    assert mock_coordinator.client.async_write_register.called
+    tx = mock_coordinator.client.async_write_transaction.await_args.args[0]
+    assert tx.blocks == [(0x0200, [4])]
+    assert tx.execute
 
 
 def test_light_icon_on_off(mock_coordinator):
@@ -18,13 +18,15 @@ import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import asyncio
+import time
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from pymodbus.framer import FramerType
 
 import custom_components.vistapool.modbus as vistapool_modbus
+from custom_components.vistapool.framing import crc16
 
 ModbusException = vistapool_modbus.ModbusException
 
@@ -120,6 +122,57 @@ def test_framer_unknown_value_falls_back_to_socket_with_warning(caplog):
     assert "Unknown modbus_framer value 'invalid'" in caplog.text
 
 
+def test_transport_unknown_value_falls_back_to_pymodbus_with_warning(caplog):
+    """An unknown modbus_transport value falls back to pymodbus and logs a warning."""
+    import logging
+
+    with caplog.at_level(logging.WARNING, logger="custom_components.vistapool.modbus"):
+        client = vistapool_modbus.VistaPoolModbusClient(
+            {"host": "127.0.0.1", "modbus_transport": "serial"}
+        )
+    assert client._transport == "pymodbus"
+    assert "Unknown modbus_transport value 'serial'" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_establish_connection_native_transport():
+    """modbus_transport='native' uses NativeModbusClient without patching pymodbus."""
+    client = vistapool_modbus.VistaPoolModbusClient(
+        {
+            "host": "127.0.0.1",
+            "slave_id": 3,
+            "modbus_framer": "rtu",
+            "modbus_transport": "native",
+        }
+    )
+    with (
+        patch.object(vistapool_modbus, "NativeModbusClient") as MockNative,
+        patch.object(vistapool_modbus, "AsyncModbusTcpClient") as MockPymodbus,
+        patch.object(client, "_install_fc20_filter") as mock_filter,
+    ):
+        mock_instance = MockNative.return_value
+        mock_instance.connect = AsyncMock(return_value=True)
+        mock_instance.connected = True
+        await client._establish_connection_with_retry()
+
+        MockNative.assert_called_once_with(
+            "127.0.0.1",
+            port=502,
+            unit_id=3,
+            rtu=True,
+            timeout=5,
+            on_broadcast=client._on_fc20_broadcast,
+        )
+        MockPymodbus.assert_not_called()
+        mock_filter.assert_not_called()
+
+    # Native methods receive device_id directly
+    func = AsyncMock(return_value="response")
+    assert await client._request(func, address=0x0100, count=1) == "response"
+    func.assert_awaited_once_with(device_id=3, address=0x0100, count=1)
+    assert client.connection_stats["transport"] == "native"
+
+
 @pytest.mark.asyncio
 async def test_establish_connection_passes_framer_to_client():
     """Test that _establish_connection_with_retry passes correct framer to AsyncModbusTcpClient."""
@@ -312,6 +365,7 @@ def test_connection_stats_content(config):
         "write_average_response_time",
         "failed_writes_by_address",
         "last_successful_writes",
+        "request_pacing",
     ]:
         assert key in stats
 
@@ -339,9 +393,7 @@ async def test_perform_read_all_happy_path(config, monkeypatch):
         side_effect=[
             DummyResp(
                 [
-                    1,
-                    3,
-                    1280,
+                    1280,  # 0x0002 MBF_POWER_MODULE_VERSION
                     32768,
                     88,
                     47,
@@ -352,11 +404,9 @@ async def test_perform_read_all_happy_path(config, monkeypatch):
                     0,
                     0,
                     0,
-                    22069,
-                    0,
-                    0,  # 0x000F (unused)
+                    22069,  # 0x000D MBF_POWER_MODULE_DATA
                 ]
-            ),  # rr00
+            ),  # rr00 (0x0002, 12)
             DummyResp(
                 [
                     23971,
@@ -448,7 +498,7 @@ async def test_perform_read_all_happy_path(config, monkeypatch):
     "fail_block,modbus_method,address,error_type",
     [
         # (block, method, address, error type)
-        ("rr00", "read_holding_registers", "0x0000", "exception"),
+        ("rr00", "read_holding_registers", "0x0002", "exception"),
         ("rr01", "read_input_registers", "0x0100", "exception"),
         ("rr02", "read_holding_registers", "0x0206", "iserror"),
         ("rr02_hidro", "read_holding_registers", "0x0280", "iserror"),
@@ -464,7 +514,10 @@ async def test_perform_read_all_happy_path(config, monkeypatch):
 async def test_perform_read_all_raises_on_block(
     config, monkeypatch, fail_block, modbus_method, address, error_type
 ):
-    """Parametrized test: _perform_read_all exception and isError branches for all main blocks."""
+    """Parametrized test: _perform_read_all exception and isError branches for all main blocks.
+
+    Exceptions fail the cycle; exception responses (isError) fail only their page.
+    """
 
     from custom_components.vistapool.modbus import VistaPoolModbusClient
 
@@ -542,8 +595,14 @@ async def test_perform_read_all_raises_on_block(
     monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
 
     # Run test
-    with pytest.raises(ModbusException):
+    if error_type == "exception":
+        with pytest.raises(ModbusException):
+            await client._perform_read_all()
+    else:
+        # An exception response only fails its own page (partial success)
         await client._perform_read_all()
+        assert len(client.connection_stats["last_failed_pages"]) == 1
+        assert client.connection_stats["partial_reads"] == 1
 
     # Always check that the error was logged
     assert client._failed_reads.get(address, 0) == 1
@@ -553,7 +612,7 @@ async def test_perform_read_all_raises_on_block(
 @pytest.mark.parametrize(
     "block_label, address",
     [
-        ("rr00", 0x0000),
+        ("rr00", 0x0002),
         ("rr01", 0x0100),
         ("rr02", 0x0206),
         ("rr02_hidro", 0x0280),
@@ -611,7 +670,7 @@ async def test_perform_read_all_block_exception(
     # input: rr01 (only one call)
     fake_modbus.read_holding_registers = AsyncMock(
         side_effect=[
-            rh_side_effect[0],  # rr00 (0x0000)
+            rh_side_effect[0],  # rr00 (0x0002)
             rh_side_effect[2],  # rr02 (0x0206)
             rh_side_effect[3],  # rr02_hidro (0x0280)
             rh_side_effect[4],  # rr03-1 (0x0300)
@@ -683,9 +742,11 @@ async def test_perform_read_all_timers_all_enabled(config, monkeypatch):
             self.registers = regs
             self.isError = lambda: is_error
 
-    # All timer blocks should return this
+    # Every register holds its own address, so the slicing can be checked
     fake_modbus.read_holding_registers = AsyncMock(
-        return_value=DummyResp(list(range(15)))
+        side_effect=lambda address, count, **kw: DummyResp(
+            list(range(address, address + count))
+        )
     )
 
     # Patch get_client() to always return our fake_modbus
@@ -704,8 +765,16 @@ async def test_perform_read_all_timers_all_enabled(config, monkeypatch):
         assert "on" in data
         assert "interval" in data
 
-    # Ensure correct number of calls (one per block)
-    assert fake_modbus.read_holding_registers.await_count == len(TIMER_BLOCKS)
+    for timer, address in TIMER_BLOCKS.items():
+        assert result[timer]["enable"] == address
+        assert result[timer]["function"] == address + 11
+
+    # The contiguous 12 x 15 register region is read in 31-register chunks
+    assert fake_modbus.read_holding_registers.await_count == 6
+    counts = [
+        c.kwargs["count"] for c in fake_modbus.read_holding_registers.await_args_list
+    ]
+    assert counts == [31, 31, 31, 31, 31, 25]
 
 
 @pytest.mark.asyncio
@@ -732,6 +801,29 @@ async def test_perform_read_all_timers_only_selected(config, monkeypatch):
     assert fake_modbus.read_holding_registers.await_count == len(enabled)
 
 
+@pytest.mark.asyncio
+async def test_perform_read_all_timers_failed_chunk_drops_only_its_blocks(
+    config, monkeypatch
+):
+    """A rejected chunk only loses the blocks (partially) covered by it."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+
+    async def read_holding(address, count, **kwargs):
+        # filtration1-3: chunks (0x0434, 31) and (0x0453, 14)
+        return _DummyResp([0] * count, is_error=address == 0x0453)
+
+    fake_modbus.read_holding_registers = read_holding
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    result = await client._perform_read_all_timers(
+        enabled_timers=["filtration1", "filtration2", "filtration3"]
+    )
+    assert set(result) == {"filtration1", "filtration2"}
+    assert client.connection_stats["rejected_ranges"] == {"0x0453": None}
+
+
 @pytest.mark.asyncio
 async def test_perform_read_all_timers_modbus_error(config, monkeypatch):
     """Test _perform_read_all_timers skips block if isError is True."""
@@ -808,6 +900,273 @@ async def test_perform_write_register_happy_path(config, monkeypatch):
     assert result["confirmed"] == 123
 
 
+@pytest.mark.asyncio
+async def test_confirmed_write_updates_cached_registers(config, monkeypatch):
+    """The read-back of a write is decoded into the cache with the register map."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client._cached_result = {"MBF_PAR_PH1": 7.2, "MBF_PAR_HIDRO": 10.0}
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.write_registers = AsyncMock(return_value=_DummyResp([]))
+    fake_modbus.read_holding_registers = AsyncMock(return_value=_DummyResp([750]))
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+    generation = client.cache_generation
+
+    await client._perform_write_register(0x0504, 750)
+
+    assert client._cached_result == {"MBF_PAR_PH1": 7.5, "MBF_PAR_HIDRO": 10.0}
+    assert client.cache_generation == generation + 1
+
+
+@pytest.mark.asyncio
+async def test_confirmed_write_patches_cached_timer_block(config, monkeypatch):
+    """A write into a timer block (e.g. its function register) patches the cache."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    timer = {"enable": 1, "on": 3600, "interval": 7200, "function": 3}
+    client._cached_timers = {
+        "relay_light": vistapool_modbus.parse_timer_block(
+            vistapool_modbus.build_timer_block(timer)
+        )
+    }
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.write_registers = AsyncMock(return_value=_DummyResp([]))
+    fake_modbus.read_holding_registers = AsyncMock(return_value=_DummyResp([4]))
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    await client._perform_write_register(0x0470 + 11, 4)
+
+    cached = client._cached_timers["relay_light"]
+    assert cached["function"] == 4
+    assert cached["on"] == 3600 and cached["interval"] == 7200
+    assert client._cached_result == {}
+
+
+def test_write_transaction_merges_adjacent_addresses(config):
+    """Adjacent writes share one FC16 block; 0x02F0/0x02F5 only flag the commit."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    tx = client.transaction()
+    tx.write(0x0416, 28)
+    tx.write(0x0418, 1)
+    tx.write(0x0417, 0)
+    tx.write(0x0413, [1, 2])
+    tx.write(0x0418, 5)
+    tx.write(0x02F5, 1)
+    assert tx.blocks == [(0x0416, [28, 0, 5]), (0x0413, [1, 2])]
+    assert tx.addresses == [0x0413, 0x0414, 0x0416, 0x0417, 0x0418]
+    assert tx.execute and not tx.save
+
+
+@pytest.mark.asyncio
+async def test_write_transaction_confirms_and_applies_once(config, monkeypatch):
+    """A transaction reads its writes back in one request and commits once."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client._cached_result = {"MBF_PAR_HEATING_TEMP": 27, "MBF_PAR_INTELLIGENT_TEMP": 27}
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.write_registers = AsyncMock(return_value=_DummyResp([]))
+    readback = [28] + [0] * 5 + [28]
+    fake_modbus.read_holding_registers = AsyncMock(return_value=_DummyResp(readback))
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    async with client.transaction(apply=True) as tx:
+        tx.write(0x0416, 28)
+        tx.write(0x041C, 28)
+
+    assert tx.result == {0x0416: 28, 0x041C: 28}
+    await client.async_commit()
+    assert [
+        c.kwargs["address"] for c in fake_modbus.write_registers.await_args_list
+    ] == [
+        0x0416,
+        0x041C,
+        0x02F0,
+        0x02F5,
+    ]
+    fake_modbus.read_holding_registers.assert_awaited_once()
+    read = fake_modbus.read_holding_registers.await_args.kwargs
+    assert (read["address"], read["count"]) == (0x0416, 7)
+    assert client._cached_result["MBF_PAR_HEATING_TEMP"] == 28
+    assert client._cached_result["MBF_PAR_INTELLIGENT_TEMP"] == 28
+
+
+@pytest.mark.asyncio
+async def test_write_transaction_not_sent_on_exception(config):
+    """Nothing is written when the async with block raises."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client.async_write_transaction = AsyncMock()
+    with pytest.raises(ValueError):
+        async with client.transaction() as tx:
+            tx.write(0x0416, 28)
+            raise ValueError("abort")
+    client.async_write_transaction.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_write_transaction_stops_on_write_error(config, monkeypatch):
+    """A rejected block aborts the transaction before readback and EXEC."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.write_registers = AsyncMock(return_value=_DummyResp([], is_error=True))
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    async with client.transaction(apply=True) as tx:
+        tx.write(0x0416, 28)
+
+    assert tx.result is None
+    fake_modbus.write_registers.assert_awaited_once()
+    fake_modbus.read_holding_registers.assert_not_awaited()
+    assert client._failed_writes == {"0x0416": 1}
+
+
+@pytest.mark.asyncio
+async def test_timer_write_updates_cached_timer(config, monkeypatch):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.read_holding_registers = AsyncMock(return_value=_DummyResp([0] * 15))
+    fake_modbus.write_registers = AsyncMock(return_value=_DummyResp([]))
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    assert await client._perform_write_timer("filtration2", {"on": 3600})
+
+    assert client._cached_timers["filtration2"]["on"] == 3600
+    assert await client.async_commit()
+
+
+def _timer_client(config, monkeypatch, block):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client._full_read_due = False
+    client._cached_timers = {"filtration1": vistapool_modbus.parse_timer_block(block)}
+    client._timer_epochs = {"filtration1": client._installer_epoch}
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.read_holding_registers = AsyncMock(return_value=_DummyResp(block))
+    fake_modbus.write_registers = AsyncMock(return_value=_DummyResp([]))
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+    return client, fake_modbus
+
+
+_TIMER_BLOCK = vistapool_modbus.build_timer_block(
+    {"enable": 1, "on": 3600, "period": 86400, "interval": 7200, "countdown": 50}
+)
+
+
+@pytest.mark.asyncio
+async def test_timer_write_from_fresh_cache_writes_changed_registers(
+    config, monkeypatch
+):
+    """A fresh cached block replaces the read; only the changed registers go out."""
+    client, fake_modbus = _timer_client(config, monkeypatch, _TIMER_BLOCK)
+
+    assert await client._perform_write_timer("filtration1", {"on": 7200})
+
+    fake_modbus.read_holding_registers.assert_not_awaited()
+    fake_modbus.write_registers.assert_awaited_once()
+    written = fake_modbus.write_registers.await_args.kwargs
+    assert written["address"] == vistapool_modbus.TIMER_BLOCKS["filtration1"] + 1
+    assert written["values"] == [7200]  # the high word is unchanged
+    assert client._cached_timers["filtration1"]["on"] == 7200
+    assert client.connection_stats["timer_writes"]["from_cache"] == 1
+    assert await client.async_commit()
+
+
+@pytest.mark.asyncio
+async def test_timer_write_skipped_when_unchanged(config, monkeypatch):
+    client, fake_modbus = _timer_client(config, monkeypatch, _TIMER_BLOCK)
+
+    assert await client._perform_write_timer("filtration1", {"on": 3600})
+
+    fake_modbus.read_holding_registers.assert_not_awaited()
+    fake_modbus.write_registers.assert_not_awaited()
+    assert client.connection_stats["eeprom_commits"]["pending"] is False
+    assert client.connection_stats["timer_writes"]["skipped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_timer_write_reads_block_after_installer_notification(
+    config, monkeypatch
+):
+    """An INSTALLER change notification makes the cached blocks stale."""
+    client, fake_modbus = _timer_client(config, monkeypatch, _TIMER_BLOCK)
+    fake_modbus.read_input_registers = AsyncMock(
+        return_value=_DummyResp(_measure_regs(vistapool_modbus._NOTIF_INSTALLER))
+    )
+    client._cached_result = {"MBF_PAR_FILT_GPIO": 0}
+    await client._perform_read_all()
+
+    assert await client._perform_write_timer("filtration1", {"on": 7200})
+
+    read = fake_modbus.read_holding_registers.await_args.kwargs
+    assert (read["address"], read["count"]) == (
+        vistapool_modbus.TIMER_BLOCKS["filtration1"],
+        15,
+    )
+    written = fake_modbus.write_registers.await_args_list[-1].kwargs
+    assert written["address"] == vistapool_modbus.TIMER_BLOCKS["filtration1"]
+    assert len(written["values"]) == 15
+    assert client.connection_stats["timer_writes"]["read_first"] == 1
+    assert await client.async_commit()
+
+
+@pytest.mark.asyncio
+async def test_timer_write_spanning_countdown_reads_block(config, monkeypatch):
+    """Changes around the countdown registers are written from a fresh read."""
+    client, fake_modbus = _timer_client(config, monkeypatch, _TIMER_BLOCK)
+
+    assert await client._perform_write_timer(
+        "filtration1", {"enable": 0, "function": 2}
+    )
+
+    fake_modbus.read_holding_registers.assert_awaited_once()
+    written = fake_modbus.write_registers.await_args.kwargs
+    assert written["values"][9] == 50  # countdown as read from the device
+    assert await client.async_commit()
+
+
+@pytest.mark.asyncio
+async def test_refresh_pages_reads_only_requested_page(config, monkeypatch):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client._cached_result = {"MBF_PAR_PH1": 7.2, "MBF_MEASURE_PH": 7.3}
+    client.required_keys = ["MBF_PAR_PH1"]
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.read_holding_registers = AsyncMock(return_value=_DummyResp([750]))
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    result, timers = await client.async_refresh_pages(["USER"])
+
+    fake_modbus.read_holding_registers.assert_awaited_once()
+    assert fake_modbus.read_holding_registers.await_args.kwargs["address"] == 0x0504
+    assert result["MBF_PAR_PH1"] == 7.5
+    assert result["MBF_MEASURE_PH"] == 7.3
+    assert timers == {}
+    assert client._cached_result["MBF_PAR_PH1"] == 7.5
+
+
+@pytest.mark.asyncio
+async def test_refresh_pages_commits_pending_writes_first(config, monkeypatch):
+    """Pages are read back after the deferred save + EXEC of applied writes."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client.required_keys = ["MBF_PAR_PH1"]
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.write_registers = AsyncMock(return_value=_DummyResp([]))
+    fake_modbus.read_holding_registers = AsyncMock(return_value=_DummyResp([750]))
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    await client._perform_write_register(0x0504, 750, apply=True)
+    fake_modbus.reset_mock()
+    await client.async_refresh_pages(["USER"])
+
+    calls = [c[0] for c in fake_modbus.method_calls]
+    assert calls == ["write_registers", "write_registers", "read_holding_registers"]
+    addrs = [c.kwargs["address"] for c in fake_modbus.write_registers.await_args_list]
+    assert addrs == [0x02F0, 0x02F5]
+    assert client.connection_stats["eeprom_commits"]["pending"] is False
+
+
 @pytest.mark.asyncio
 async def test_perform_write_register_write_isError(config, monkeypatch):
     """Test _perform_write_register returns None if write_registers returns error."""
@@ -873,7 +1232,7 @@ async def test_perform_write_register_exception(config, monkeypatch):
 
 @pytest.mark.asyncio
 async def test_perform_write_register_apply(config, monkeypatch):
-    """Test _perform_write_register triggers EEPROM/EXEC writes when apply=True."""
+    """Test _perform_write_register schedules the EEPROM/EXEC commit when apply=True."""
 
     client = vistapool_modbus.VistaPoolModbusClient(config)
     fake_modbus = AsyncMock()
@@ -893,14 +1252,100 @@ async def test_perform_write_register_apply(config, monkeypatch):
     result = await client._perform_write_register(0x0100, 123, apply=True)
     # Should still succeed, as happy path
     assert result is not None
-    # Check that EEPROM and EXEC writes were triggered
+    # The commit is deferred ...
+    assert fake_modbus.write_registers.await_count == 1
+    assert client.connection_stats["eeprom_commits"]["pending"] is True
+
+    # ... until it is flushed: EEPROM save, then EXEC
+    assert await client.async_commit() is True
     addrs = [
         call.kwargs["address"] for call in fake_modbus.write_registers.await_args_list
     ]
-    assert 0x02F0 in addrs and 0x02F5 in addrs
+    assert addrs == [0x0100, 0x02F0, 0x02F5]
+    assert client.connection_stats["eeprom_commits"]["commits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_write_preempts_poll_between_requests(config):
+    """A write issued during a poll goes out right after the request in flight."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    sent = []
+    in_flight = asyncio.Event()
+    release = asyncio.Event()
 
-    # There should be at least 3 write_registers calls (register, EEPROM, EXEC)
-    assert fake_modbus.write_registers.await_count >= 3
+    async def read(address, count, **kwargs):
+        sent.append(f"read 0x{address:04X}")
+        if len(sent) == 1:
+            in_flight.set()
+            await release.wait()
+        return _DummyResp([0] * count)
+
+    async def write(address, values, **kwargs):
+        sent.append(f"write 0x{address:04X}")
+        return _DummyResp([])
+
+    fake_modbus = AsyncMock()
+    fake_modbus.read_holding_registers = read
+    fake_modbus.write_registers = write
+
+    poll = asyncio.create_task(
+        client._read_register_ranges(
+            fake_modbus,
+            [(0x0400, 31), (0x041F, 31)],
+            priority=vistapool_modbus.PRIORITY_CONFIG,
+        )
+    )
+    await in_flight.wait()
+    user = asyncio.create_task(
+        client._request(fake_modbus.write_registers, address=0x0413, values=[1])
+    )
+    # The write queues up before the read in flight is answered
+    asyncio.get_running_loop().call_soon(release.set)
+    await asyncio.gather(poll, user)
+
+    assert sent == ["read 0x0400", "write 0x0413", "read 0x041F"]
+    stats = client.connection_stats["request_scheduling"]
+    assert stats["granted"]["write"] == 1 and stats["granted"]["config"] == 2
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending_commit(config, monkeypatch):
+    """Applied writes are saved to EEPROM before the connection is closed."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.write_registers = AsyncMock(return_value=_DummyResp([]))
+    fake_modbus.read_holding_registers = AsyncMock(return_value=_DummyResp([5]))
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    await client._perform_write_register(0x0100, 5, apply=True)
+    await client._perform_write_register(0x0101, 5, apply=True)
+    await client.close()
+
+    addrs = [c.kwargs["address"] for c in fake_modbus.write_registers.await_args_list]
+    assert addrs == [0x0100, 0x0101, 0x02F0, 0x02F5]
+    assert client.connection_stats["eeprom_commits"]["coalesced_writes"] == 2
+
+
+@pytest.mark.asyncio
+async def test_close_does_not_wait_for_an_unreachable_device(
+    config, monkeypatch, caplog
+):
+    """A commit that hangs in reconnect/backoff is abandoned after a timeout."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client._commit_scheduler.mark_dirty()
+    client._commit_scheduler.cancel()
+
+    async def hang():
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(client, "get_client", hang)
+    monkeypatch.setattr(vistapool_modbus, "_CLOSE_COMMIT_TIMEOUT", 0.01)
+
+    await client.close()
+
+    assert "could not be saved to EEPROM" in caplog.text
+    assert client._client is None
 
 
 @pytest.mark.asyncio
@@ -947,7 +1392,9 @@ async def test_perform_write_timer_happy_path(config, monkeypatch):
 
     # Verify correct addresses used
     assert fake_modbus.read_holding_registers.await_count >= 1
-    assert fake_modbus.write_registers.await_count >= 3  # timer write + eeprom + exec
+    assert fake_modbus.write_registers.await_count == 1  # timer write, commit deferred
+    await client.async_commit()
+    assert fake_modbus.write_registers.await_count == 3  # + eeprom + exec
 
 
 @pytest.mark.asyncio
@@ -1058,23 +1505,178 @@ async def test_async_write_aux_relay_on_and_off(config, monkeypatch):
     # Patch get_client() to always return fake_modbus
     monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
 
-    # Test turning AUX1 ON (relay_index=1, on=True)
+    # Test turning AUX1 ON (relay_index=1, on=True); no relay state known yet,
+    # so it is read from 0x010E first
     await client.async_write_aux_relay(1, True)
-    # Test turning AUX1 OFF (relay_index=1, on=False)
-    # Set initial relay state as ON (bit 0x0008 set)
-    fake_modbus.read_input_registers = AsyncMock(return_value=DummyResp([0x0008]))
-    await client.async_write_aux_relay(1, False)
-
-    # Verify read and write calls for ON
-    # read_input_registers should be called for 0x010E (relay state)
+    fake_modbus.read_input_registers.assert_awaited_once()
     args, kwargs = fake_modbus.read_input_registers.await_args
     assert kwargs["address"] == 0x010E
     assert kwargs["count"] == 1
-
-    # write_registers is called for the sequence to update relay state and execute config
     # Order of calls: enable register, relay write, disable, execute
+    assert [
+        (c.kwargs["address"], c.kwargs["values"])
+        for c in fake_modbus.write_registers.await_args_list
+    ] == [(0x010E, [1]), (0x010E, [0x0008]), (0x0289, [0]), (0x02F5, [1])]
+
+    # Test turning AUX1 OFF (relay_index=1, on=False): the controller may have
+    # switched relays after the write above, so the state is read again
+    fake_modbus.read_input_registers = AsyncMock(return_value=DummyResp([0x0009]))
+    await client.async_write_aux_relay(1, False)
+    fake_modbus.read_input_registers.assert_awaited_once()
+    assert fake_modbus.write_registers.await_args_list[5].kwargs["values"] == [0x0001]
     assert fake_modbus.write_registers.await_count == 8  # should be 4 per call
 
+    stats = client.connection_stats["aux_relay_writes"]
+    assert stats["toggles"] == 2
+    assert stats["cached_state_used"] == 0
+    assert stats["requests_per_toggle"] == 5
+
+
+@pytest.mark.asyncio
+async def test_aux_relay_write_uses_stable_measure_state(config, monkeypatch):
+    """An unchanged relay state without notification replaces the pre-read until the next poll."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    measure = _measure_regs()
+    measure[0x010E - 0x0100] = 0x0041  # filtration relay and AUX4 on
+    fake_modbus.read_input_registers = AsyncMock(return_value=_DummyResp(measure))
+    fake_modbus.write_registers = AsyncMock(return_value=_DummyResp([]))
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+    # The previous poll, 30 s ago, saw the same relays
+    client._relay_state = (0x0041, time.monotonic() - 30, 0.0)
+    await client._read_page(fake_modbus, "MEASURE")
+    assert 29 < client._relay_state[2] < 31
+    fake_modbus.read_input_registers.reset_mock()
+
+    await client.async_write_aux_relay(2, True)
+    fake_modbus.read_input_registers.assert_not_awaited()
+    assert fake_modbus.write_registers.await_args_list[1].kwargs["values"] == [0x0051]
+    assert client.connection_stats["aux_relay_writes"]["cached_state_used"] == 1
+
+    # The write itself invalidates the state
+    fake_modbus.read_input_registers = AsyncMock(return_value=_DummyResp([0x0020]))
+    await client.async_write_aux_relay(2, False)
+    fake_modbus.read_input_registers.assert_awaited_once()
+    assert fake_modbus.write_registers.await_args_list[5].kwargs["values"] == [0x0020]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "previous, notification",
+    [
+        (None, 0),  # first MEASURE read
+        (0x0001, 0),  # relays switched since the previous read
+        (0x0041, 0x0004),  # MBF_NOTIFICATION reports a change
+    ],
+)
+async def test_aux_relay_write_reads_changed_state_again(
+    config, monkeypatch, previous, notification
+):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    measure = _measure_regs()
+    measure[0x010E - 0x0100] = 0x0041
+    measure[0x0110 - 0x0100] = notification
+    fake_modbus.read_input_registers = AsyncMock(return_value=_DummyResp(measure))
+    fake_modbus.write_registers = AsyncMock(return_value=_DummyResp([]))
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+    if previous is not None:
+        client._relay_state = (previous, time.monotonic() - 30, 0.0)
+    await client._read_page(fake_modbus, "MEASURE")
+    assert client._relay_state[2] == 0.0
+
+    fake_modbus.read_input_registers = AsyncMock(return_value=_DummyResp([0x0041]))
+    await client.async_write_aux_relay(2, True)
+    fake_modbus.read_input_registers.assert_awaited_once()
+    assert client.connection_stats["aux_relay_writes"]["cached_state_used"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_poll_drops_relay_state(config, monkeypatch):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client._relay_state = (0, time.monotonic(), 60.0)
+    monkeypatch.setattr(
+        client, "_perform_read_all", AsyncMock(side_effect=ModbusException("fail"))
+    )
+    with pytest.raises(ModbusException):
+        await client.async_read_all()
+    assert client._relay_state is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "failing, address", [(0, 0x010E), (1, 0x010E), (2, 0x0289), (3, 0x02F5)]
+)
+async def test_aux_relay_write_error_response_is_raised(
+    config, monkeypatch, failing, address
+):
+    """An error response to any write of the sequence stops it and is reported."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client._relay_state = (0, time.monotonic(), 60.0)
+    responses = [_DummyResp([]) for _ in range(4)]
+    responses[failing] = _DummyResp([], is_error=True)
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.write_registers = AsyncMock(side_effect=responses)
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    with pytest.raises(ModbusException, match=f"0x{address:04X}"):
+        await client.async_write_aux_relay(1, True)
+    assert fake_modbus.write_registers.await_count == failing + 1
+    assert client.connection_stats["aux_relay_writes"]["toggles"] == 0
+    assert client._relay_state is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_aux_toggles_share_one_sequence(config, monkeypatch):
+    """AUX toggles issued while a sequence is written are merged into the next one."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client._relay_state = (0, time.monotonic(), 60.0)
+    loop = asyncio.get_running_loop()
+
+    async def write(**kwargs):
+        answered = loop.create_future()  # the gateway answers on the next loop pass
+        loop.call_soon(answered.set_result, None)
+        await answered
+        return _DummyResp([])
+
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.write_registers = AsyncMock(side_effect=write)
+    fake_modbus.read_input_registers = AsyncMock(return_value=_DummyResp([0x0008]))
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    await asyncio.gather(
+        client.async_write_aux_relay(1, True),
+        client.async_write_aux_relay(3, True),
+        client.async_write_aux_relay(4, True),
+    )
+
+    values = [c.kwargs["values"] for c in fake_modbus.write_registers.await_args_list]
+    # The first toggle is sent on its own, the two queued behind it together
+    assert values[1] == [0x0008]
+    assert values[5] == [0x0008 | 0x0020 | 0x0040]
+    assert fake_modbus.write_registers.await_count == 8
+    fake_modbus.read_input_registers.assert_awaited_once()  # state after 1st write
+    assert client.connection_stats["aux_relay_writes"]["sequences"] == 2
+
+
+@pytest.mark.asyncio
+async def test_aux_relays_batch_failure_is_raised_to_every_caller(config, monkeypatch):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client._relay_state = (0, time.monotonic(), 60.0)
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.write_registers = AsyncMock(side_effect=Exception("write fail"))
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    with pytest.raises(ModbusException):
+        await client.async_write_aux_relays({1: True, 2: False})
+    # The state is unknown after a failed sequence
+    assert client._relay_state is None
+
 
 @pytest.mark.asyncio
 async def test_async_write_aux_relay_not_connected(config, monkeypatch):
@@ -1147,6 +1749,12 @@ RTU_CONFIG = {"host": "127.0.0.1", "port": 502, "slave_id": 1, "modbus_framer":
 TCP_CONFIG = {"host": "127.0.0.1", "port": 502, "slave_id": 1, "modbus_framer": "tcp"}
 
 
+def _fc20(payload=bytes([0x02, 0x01, 0x5A, 0xBB, 0x39]), unit=1):
+    """Return a CRC-terminated FC20 broadcast frame."""
+    body = bytes([unit, 0x20]) + payload
+    return body + crc16(body).to_bytes(2, "little")
+
+
 def _client_with_ctx(cfg):
     """Return a (VistaPoolModbusClient, mock_ctx, mock_client, received) tuple."""
     client = vistapool_modbus.VistaPoolModbusClient(cfg)
@@ -1171,6 +1779,27 @@ def test_install_fc20_filter_rtu_filters_fc20_frames():
     assert received == [], "FC20 frame should have been filtered out"
 
 
+def test_install_fc20_filter_reports_collisions_to_pacer():
+    """Filtered FC20 frames are counted by the request pacer."""
+    client, mock_ctx, mock_client, received = _client_with_ctx(RTU_CONFIG)
+    client._install_fc20_filter(mock_client)
+    mock_ctx.data_received(_fc20())
+    assert client.connection_stats["request_pacing"]["fc20_collisions"] == 1
+    assert client.connection_stats["fc20_filter"]["filtered_frames"] == 1
+
+
+@pytest.mark.asyncio
+async def test_request_failure_backs_off_pacer(config):
+    """A request raising (e.g. timeout) widens the inter-request gap."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    gap = client._pacer.gap
+    func = AsyncMock(side_effect=TimeoutError("no response"))
+    with pytest.raises(TimeoutError):
+        await client._request(func, address=0x0100, count=1)
+    assert client._pacer.gap > gap
+    assert client.connection_stats["request_pacing"]["errors"] == 1
+
+
 def test_install_fc20_filter_rtu_filters_fc20_frames_with_debug_logging(caplog):
     """FC20 broadcast frames are dropped and debug-logged when DEBUG is enabled."""
     import logging
@@ -1178,23 +1807,29 @@ def test_install_fc20_filter_rtu_filters_fc20_frames_with_debug_logging(caplog):
     client, mock_ctx, mock_client, received = _client_with_ctx(RTU_CONFIG)
     client._install_fc20_filter(mock_client)
 
-    fc20_frame = bytes([1, 0x20, 0x02, 0x01, 0x5A, 0xBB, 0x39])
     with caplog.at_level(logging.DEBUG, logger="custom_components.vistapool.modbus"):
-        mock_ctx.data_received(fc20_frame)
+        mock_ctx.data_received(_fc20())
 
     assert received == [], "FC20 frame should have been filtered out"
     assert any("FC20 broadcast frame filtered" in m for m in caplog.messages)
 
 
-def test_install_fc20_filter_rtu_drops_coalesced_chunk_entirely():
+def test_install_fc20_filter_rtu_keeps_response_coalesced_with_fc20():
     """When an FC20 broadcast and a valid FC03 response arrive in the same TCP chunk,
-    the entire chunk is dropped.
+    only the broadcast is stripped and the response is forwarded.
+    """
+    client, mock_ctx, mock_client, received = _client_with_ctx(RTU_CONFIG)
+    client._install_fc20_filter(mock_client)
+
+    fc03_tail = bytes([0x01, 0x03, 0x02, 0x00, 0x64, 0xB9, 0xAF])
+    mock_ctx.data_received(_fc20() + fc03_tail)
+    assert received == [fc03_tail]
+    assert client.connection_stats["fc20_filter"]["recovered_responses"] == 1
+
 
-    The FC20 proprietary frame layout cannot be reliably parsed to determine its
-    length (the observed 27-byte frame has data[6]=0x39=57, yielding a bogus
-    fc20_len=66), so forwarding trailing bytes based on a miscomputed offset
-    would corrupt pymodbus.  Dropping the whole chunk is the safe choice;
-    pymodbus will retry and the next poll cycle will succeed.
+def test_install_fc20_filter_rtu_resyncs_after_corrupted_fc20():
+    """An FC20 frame whose CRC never matches (the observed 27-byte frame layout has
+    no usable length field) is skipped up to the next CRC-valid response.
     """
     client, mock_ctx, mock_client, received = _client_with_ctx(RTU_CONFIG)
     client._install_fc20_filter(mock_client)
@@ -1202,7 +1837,7 @@ def test_install_fc20_filter_rtu_drops_coalesced_chunk_entirely():
     fc20_frame = bytes([0x01, 0x20, 0x02, 0x01, 0x00, 0x01, 0x00, 0xAA, 0xBB])
     fc03_tail = bytes([0x01, 0x03, 0x02, 0x00, 0x64, 0xB9, 0xAF])
     mock_ctx.data_received(fc20_frame + fc03_tail)
-    assert received == [], "Entire chunk must be dropped when FC20 is detected"
+    assert received == [fc03_tail]
 
 
 def test_install_fc20_filter_rtu_drops_partial_fc20_frame():
@@ -1216,12 +1851,8 @@ def test_install_fc20_filter_rtu_drops_partial_fc20_frame():
 
 
 def test_install_fc20_filter_rtu_split_fc20_second_chunk_not_dropped():
-    """When an FC20 frame is split across two calls, the second chunk (FC20 tail +
-    any coalesced valid response) is forwarded so valid data is never silently lost.
-
-    The first call contains a partial FC20 and is filtered; the second call starts
-    with the remaining FC20 bytes which do not match the FC20 pattern (data[1] != 0x20),
-    so the entire second chunk — including any trailing valid response — is forwarded.
+    """When an FC20 frame is split across two calls, the partial broadcast is held
+    back and the response following its tail is forwarded without the FC20 bytes.
     """
     client, mock_ctx, mock_client, received = _client_with_ctx(RTU_CONFIG)
     client._install_fc20_filter(mock_client)
@@ -1235,11 +1866,11 @@ def test_install_fc20_filter_rtu_split_fc20_second_chunk_not_dropped():
     )
 
     mock_ctx.data_received(fc20_first)
-    assert received == [], "First partial-FC20 chunk must be dropped"
+    assert received == [], "First partial-FC20 chunk must be held back"
 
     mock_ctx.data_received(fc20_tail_plus_response)
-    assert received == [fc20_tail_plus_response], (
-        "Second chunk (FC20 tail + valid response) must be forwarded — valid data must not be lost"
+    assert received == [fc20_tail_plus_response[4:]], (
+        "Valid response after the FC20 tail must be forwarded — valid data must not be lost"
     )
 
 
@@ -1317,14 +1948,9 @@ def test_install_fc20_filter_socket_passes_normal_frames():
     assert received == [normal_frame], "Normal Modbus TCP frame must pass through"
 
 
-def test_install_fc20_filter_socket_drops_coalesced_chunk_entirely():
+def test_install_fc20_filter_socket_keeps_response_coalesced_with_fc20():
     """With SOCKET framing, when an FC20 broadcast and a valid Modbus TCP response
-    arrive in the same TCP chunk, the entire chunk is dropped.
-
-    Same rationale as the RTU coalesced case: the FC20 frame length cannot be
-    reliably computed from the proprietary payload, so forwarding trailing bytes
-    would risk passing garbage to pymodbus.  The entire chunk is dropped and
-    pymodbus retries on the next poll cycle.
+    arrive in the same TCP chunk, only the broadcast is stripped.
     """
     client, mock_ctx, mock_client, received = _client_with_ctx(TCP_CONFIG)
     client._install_fc20_filter(mock_client)
@@ -1335,7 +1961,12 @@ def test_install_fc20_filter_socket_drops_coalesced_chunk_entirely():
         [0x00, 0x01, 0x00, 0x00, 0x00, 0x05, 0x01, 0x03, 0x02, 0x00, 0x64]
     )
     mock_ctx.data_received(fc20_frame + mbap_response)
-    assert received == [], "Entire chunk must be dropped when FC20 is detected"
+    assert received == [mbap_response]
+
+    # A CRC-valid broadcast following a response in the same chunk
+    received.clear()
+    mock_ctx.data_received(mbap_response + _fc20())
+    assert received == [mbap_response]
 
 
 def test_install_fc20_filter_socket_buffers_short_ambiguous_prefix_then_drops():
@@ -1449,13 +2080,87 @@ def _measure_regs(notification: int = 0) -> list:
     return regs
 
 
+@pytest.mark.asyncio
+async def test_perform_read_all_reports_changed_status_flags(config, monkeypatch):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client._full_read_due = False
+    regs = _measure_regs()
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.read_input_registers = AsyncMock(
+        side_effect=lambda **kwargs: _DummyResp(list(regs))
+    )
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    await client._perform_read_all()
+    assert "Pool Cover" in client.changed_status_keys
+    await client._perform_read_all()
+    assert client.changed_status_keys == frozenset()
+
+    regs[0x010D - 0x0100] = 0x0010  # MBF_HIDRO_STATUS: pool cover input active
+    result = await client._perform_read_all()
+    assert client.changed_status_keys == {"Pool Cover"}
+    assert result["Pool Cover"] is True
+
+
+@pytest.mark.asyncio
+async def test_unchanged_measure_response_is_not_decoded_again(config, monkeypatch):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client._full_read_due = False
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.read_input_registers = AsyncMock(
+        side_effect=lambda **kwargs: _DummyResp(_measure_regs())
+    )
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+    decode = MagicMock(wraps=vistapool_modbus.PageDecoder.decode)
+    monkeypatch.setattr(
+        vistapool_modbus.PageDecoder,
+        "decode",
+        lambda self, *args, **kwargs: decode(self, *args, **kwargs),
+    )
+
+    await client._perform_read_all()
+    result = await client._perform_read_all()
+
+    assert decode.call_count == 1
+    assert result is client._cached_result  # updated in place, not copied
+    assert client.register_snapshot.raw_pages()["MEASURE"] == _measure_regs()
+
+
+@pytest.mark.asyncio
+async def test_take_changed_keys_reports_changed_registers(config, monkeypatch):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client._full_read_due = False
+    regs = _measure_regs()
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.read_input_registers = AsyncMock(
+        side_effect=lambda **kwargs: _DummyResp(regs)
+    )
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    assert client.take_changed_keys() is None  # nothing taken over yet
+    await client._perform_read_all()
+    assert "MBF_NOTIFICATION" in client.take_changed_keys()
+    await client._perform_read_all()
+    assert client.take_changed_keys() == frozenset()
+
+    regs[0x010D - 0x0100] = 0x0010  # MBF_HIDRO_STATUS: pool cover input active
+    await client._perform_read_all()
+    assert {"MBF_HIDRO_STATUS", "Pool Cover"} <= client.take_changed_keys()
+
+    await client.close()
+    assert client.take_changed_keys() is None
+
+
 @pytest.mark.asyncio
 async def test_perform_read_all_skips_config_pages_when_no_notification(
     config, monkeypatch
 ):
-    """When notification=0 and not at full-read interval, all config page reads are skipped."""
+    """When notification=0 and no full read is due, all config page reads are skipped."""
     client = vistapool_modbus.VistaPoolModbusClient(config)
-    client._polls_since_full_read = 0  # not at interval → partial read allowed
+    client._full_read_due = False  # partial read allowed
 
     fake_modbus = AsyncMock()
     fake_modbus.connected = True
@@ -1471,7 +2176,86 @@ async def test_perform_read_all_skips_config_pages_when_no_notification(
 
     assert isinstance(result, dict)
     fake_modbus.read_holding_registers.assert_not_called()
-    assert client._polls_since_full_read == 1  # incremented, not reset
+    assert client._full_read_due is False
+
+
+@pytest.mark.asyncio
+async def test_background_verification_reads_one_page_per_slot(config, monkeypatch):
+    """Without notifications, cached pages are re-read one at a time in rotation."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client._full_read_due = False
+
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.read_input_registers = AsyncMock(
+        return_value=_DummyResp(_measure_regs(notification=0))
+    )
+    fake_modbus.read_holding_registers = AsyncMock(
+        side_effect=lambda **kw: _DummyResp([0] * kw["count"])
+    )
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    # One slot is verify_window / 6 pages; make the next one due
+    client._last_verification -= client.verify_window
+    await client._perform_read_all()
+    addresses = [
+        c.kwargs["address"] for c in fake_modbus.read_holding_registers.call_args_list
+    ]
+    assert addresses and all(a < 0x0100 for a in addresses)  # MODBUS page only
+    assert client.connection_stats["verification"]["last_item"] == "MODBUS"
+
+    # Slot not elapsed yet → nothing verified
+    fake_modbus.read_holding_registers.reset_mock()
+    await client._perform_read_all()
+    fake_modbus.read_holding_registers.assert_not_called()
+
+    client._last_verification -= client.verify_window
+    await client._perform_read_all()
+    addresses = [
+        c.kwargs["address"] for c in fake_modbus.read_holding_registers.call_args_list
+    ]
+    assert addresses and all(0x0200 <= a < 0x0300 for a in addresses)  # GLOBAL
+    assert client._full_read_due is False
+
+
+@pytest.mark.asyncio
+async def test_background_verification_of_timer_block(config, monkeypatch):
+    """A timer block due for verification bypasses the timer cache once."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client._full_read_due = False
+    client._last_was_full_read = False
+    client._verify_timers = frozenset({"filtration1", "relay_light"})
+    client._verify_position = 6  # after the six configuration pages
+    cached = {"enable": 1, "on": 0, "interval": 3600}
+    client._cached_timers = {"filtration1": cached, "relay_light": cached}
+
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.read_input_registers = AsyncMock(
+        return_value=_DummyResp(_measure_regs(notification=0))
+    )
+    fake_modbus.read_holding_registers = AsyncMock(return_value=_DummyResp([0] * 15))
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    client._last_verification -= client.verify_window
+    await client._perform_read_all()
+    fake_modbus.read_holding_registers.assert_not_called()
+    assert client._pending_timer_verification == "filtration1"
+
+    timers = await client._perform_read_all_timers(["filtration1", "relay_light"])
+    fake_modbus.read_holding_registers.assert_awaited_once()
+    assert fake_modbus.read_holding_registers.await_args.kwargs["address"] == 0x0434
+    assert timers["relay_light"] is cached
+    assert timers["filtration1"]["enable"] == 0
+    assert client.connection_stats["verification"]["changed_items"] == 1
+    assert client._pending_timer_verification is None
+
+
+def test_verify_window_has_lower_bound(config):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    assert client.verify_window == 30 * 60
+    client.verify_window = 5
+    assert client.verify_window == vistapool_modbus._MIN_VERIFY_WINDOW
 
 
 @pytest.mark.asyncio
@@ -1480,7 +2264,7 @@ async def test_perform_read_all_reads_only_factory_when_factory_notified(
 ):
     """When only FACTORY notification bit is set, only FACTORY holding regs are read (2 calls)."""
     client = vistapool_modbus.VistaPoolModbusClient(config)
-    client._polls_since_full_read = 0
+    client._full_read_due = False
 
     fake_modbus = AsyncMock()
     fake_modbus.connected = True
@@ -1506,12 +2290,10 @@ async def test_perform_read_all_reads_only_factory_when_factory_notified(
 
 
 @pytest.mark.asyncio
-async def test_perform_read_all_force_full_after_interval(config, monkeypatch):
-    """When _polls_since_full_read reaches _FULL_READ_INTERVAL, all pages are read."""
+async def test_perform_read_all_force_full_when_due(config, monkeypatch):
+    """When a full read is due (e.g. after close()), all pages are read."""
     client = vistapool_modbus.VistaPoolModbusClient(config)
-    client._polls_since_full_read = (
-        vistapool_modbus._FULL_READ_INTERVAL
-    )  # force_full=True
+    client._full_read_due = True  # force_full=True
 
     fake_modbus = AsyncMock()
     fake_modbus.connected = True
@@ -1541,7 +2323,7 @@ async def test_perform_read_all_force_full_after_interval(config, monkeypatch):
     result = await client._perform_read_all()
 
     assert fake_modbus.read_holding_registers.await_count == 10
-    assert client._polls_since_full_read == 0  # was reset after full read
+    assert client._full_read_due is False  # cleared after full read
     assert isinstance(result, dict)
 
 
@@ -1549,7 +2331,7 @@ async def test_perform_read_all_force_full_after_interval(config, monkeypatch):
 async def test_perform_read_all_clears_notification_register(config, monkeypatch):
     """When notification != 0, write_registers is called to clear MBF_NOTIFICATION (0x0110)."""
     client = vistapool_modbus.VistaPoolModbusClient(config)
-    client._polls_since_full_read = 0
+    client._full_read_due = False
 
     fake_modbus = AsyncMock()
     fake_modbus.connected = True
@@ -1583,7 +2365,7 @@ async def test_perform_read_all_does_not_clear_when_notification_zero(
 ):
     """When notification == 0, write_registers is NOT called."""
     client = vistapool_modbus.VistaPoolModbusClient(config)
-    client._polls_since_full_read = 0
+    client._full_read_due = False
 
     fake_modbus = AsyncMock()
     fake_modbus.connected = True
@@ -1603,7 +2385,7 @@ async def test_perform_read_all_does_not_clear_when_notification_zero(
 async def test_perform_read_all_cache_serves_unread_pages(config, monkeypatch):
     """Cached values for pages not re-read are carried forward in the result."""
     client = vistapool_modbus.VistaPoolModbusClient(config)
-    client._polls_since_full_read = 0
+    client._full_read_due = False
     # Pre-populate cache with a known FACTORY value
     client._cached_result = {"MBF_PAR_VERSION": 2055, "MBF_PAR_MODEL": 10}
 
@@ -1625,11 +2407,11 @@ async def test_perform_read_all_cache_serves_unread_pages(config, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_perform_read_all_poll_counter_resets_on_full_read(config, monkeypatch):
-    """After a forced full read, _polls_since_full_read is reset to 0."""
+async def test_perform_read_all_full_read_due_cleared_on_full_read(config, monkeypatch):
+    """After a complete full read, no further full read is due."""
     client = vistapool_modbus.VistaPoolModbusClient(config)
-    # A new client starts at _FULL_READ_INTERVAL → first poll is always a full read
-    assert client._polls_since_full_read == vistapool_modbus._FULL_READ_INTERVAL
+    # A new client → first poll is always a full read
+    assert client._full_read_due is True
 
     fake_modbus = AsyncMock()
     fake_modbus.connected = True
@@ -1655,14 +2437,14 @@ async def test_perform_read_all_poll_counter_resets_on_full_read(config, monkeyp
 
     await client._perform_read_all()
 
-    assert client._polls_since_full_read == 0
+    assert client._full_read_due is False
 
 
 @pytest.mark.asyncio
 async def test_perform_read_all_cached_result_updated_after_read(config, monkeypatch):
     """After each _perform_read_all call, _cached_result is updated with the latest data."""
     client = vistapool_modbus.VistaPoolModbusClient(config)
-    client._polls_since_full_read = 0
+    client._full_read_due = False
 
     measure_regs = _measure_regs(notification=vistapool_modbus._NOTIF_FACTORY)
     # Set MBF_MEASURE_PH (index 2) to a known value → 820 = 8.20 pH
@@ -1694,7 +2476,7 @@ async def test_perform_read_all_notification_clear_failure_is_silently_ignored(
     import logging
 
     client = vistapool_modbus.VistaPoolModbusClient(config)
-    client._polls_since_full_read = 0
+    client._full_read_due = False
 
     fake_modbus = AsyncMock()
     fake_modbus.connected = True
@@ -1729,7 +2511,7 @@ async def test_perform_read_all_reads_installer_and_user_when_both_notified(
 ):
     """When both INSTALLER and USER notification bits are set, both page blocks are read."""
     client = vistapool_modbus.VistaPoolModbusClient(config)
-    client._polls_since_full_read = 0
+    client._full_read_due = False
 
     notification = vistapool_modbus._NOTIF_INSTALLER | vistapool_modbus._NOTIF_USER
 
@@ -1969,7 +2751,7 @@ async def test_filtration_fixup_skipped_on_partial_read(config, monkeypatch):
 
     # --- Second poll: partial read (no notification), pump now ON in relay ---
     # Simulate enough polls so this is NOT a full read
-    client._polls_since_full_read = 1  # just after full read
+    client._full_read_due = False  # just after full read
 
     reg01_on = [0] * 18
     reg01_on[14] = 0x0002  # MBF_RELAY_STATE — bit 1 set (pump ON)
@@ -2224,3 +3006,306 @@ async def test_hydrolysis_detected_via_status_ctrl_active(config, monkeypatch):
     result = await client._perform_read_all()
 
     assert result["Hydrolysis module detected"] is True
+
+
+@pytest.mark.asyncio
+async def test_perform_read_all_reads_only_required_registers(config, monkeypatch):
+    """With required_keys set, only registers backing enabled entities are read."""
+    from custom_components.vistapool.registers import resolve_required_keys
+
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client.required_keys = resolve_required_keys(["MBF_PAR_HIDRO"])
+
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.read_input_registers = AsyncMock(
+        return_value=_DummyResp(_measure_regs(notification=0))
+    )
+    fake_modbus.read_holding_registers = AsyncMock(
+        side_effect=lambda *args, **kwargs: _DummyResp([0] * kwargs["count"])
+    )
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    result = await client._perform_read_all()
+
+    addresses = [
+        c.kwargs["address"] for c in fake_modbus.read_holding_registers.call_args_list
+    ]
+    # GLOBAL page has no required register and is skipped entirely
+    assert not any(0x0200 <= a < 0x0300 for a in addresses)
+    # USER page reads only MBF_PAR_HIDRO (0x0502) and MBF_PAR_FILTRATION_CONF (0x050F)
+    assert 0x0502 in addresses
+    assert result["MBF_PAR_HIDRO"] == 0
+    assert "MBF_CELL_RUNTIME_LOW" not in result
+    assert fake_modbus.read_holding_registers.await_count < 10
+
+
+def test_required_keys_none_restores_full_plan(config):
+    """Resetting required_keys to None restores the full compiled read plan."""
+    from custom_components.vistapool.registers import PAGE_READ_PLAN
+
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client.required_keys = {"MBF_PAR_MODEL"}
+    assert client._page_plans["GLOBAL"][1] == []
+    assert client._page_plans["MEASURE"][1] == PAGE_READ_PLAN["MEASURE"]
+    client.required_keys = None
+    assert client.required_keys is None
+    assert client._page_plans["GLOBAL"][1] == PAGE_READ_PLAN["GLOBAL"]
+
+
+# ---- Error classification ----
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (vistapool_modbus.ModbusProtocolError("rejected", 0x0100, 2), "protocol"),
+        (TimeoutError("no response"), "timeout"),
+        (vistapool_modbus.ModbusIOException("No response received"), "timeout"),
+        (vistapool_modbus.ConnectionException("lost"), "transport"),
+        (ConnectionResetError("reset"), "transport"),
+        (ValueError("unexpected"), "transport"),
+    ],
+)
+def test_classify_error(error, expected):
+    assert vistapool_modbus.classify_error(error) == expected
+
+
+def test_classify_error_follows_cause_chain():
+    """Wrapped errors (e.g. 'Modbus TCP read error') are classified by their cause."""
+    try:
+        try:
+            raise TimeoutError("no response")
+        except TimeoutError as inner:
+            raise ModbusException("Modbus TCP read error") from inner
+    except ModbusException as wrapped:
+        assert vistapool_modbus.classify_error(wrapped) == "timeout"
+
+
+def _client_with_session(config):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    session = MagicMock()
+    session.ctx.recv_buffer = b"\x01\x03"
+    client._client = session
+    return client, session
+
+
+@pytest.mark.asyncio
+async def test_protocol_error_keeps_session(config):
+    """A Modbus exception response does not close the TCP session."""
+    client, session = _client_with_session(config)
+    client._perform_read_all = AsyncMock(
+        side_effect=vistapool_modbus.ModbusProtocolError("rejected", 0x0100, 2)
+    )
+    with pytest.raises(ModbusException):
+        await client.async_read_all()
+    assert client._client is session
+    session.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_timeout_resyncs_framer_then_reconnects(config):
+    """Timeouts drop buffered bytes; only repeated timeouts reopen the session."""
+    client, session = _client_with_session(config)
+    client._perform_read_all = AsyncMock(side_effect=TimeoutError("no response"))
+    with pytest.raises(TimeoutError):
+        await client.async_read_all()
+    assert client._client is session
+    assert session.ctx.recv_buffer == b""
+    assert client.connection_stats["errors_by_class"]["timeout"] == 2
+
+    with pytest.raises(TimeoutError):
+        await client.async_read_all()
+    assert client._client is None
+    session.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_successful_request_resets_timeout_streak(config):
+    client, session = _client_with_session(config)
+    client._consecutive_timeouts = 2
+    await client._request(AsyncMock(return_value=_DummyResp([1])), address=0, count=1)
+    assert client._consecutive_timeouts == 0
+
+
+@pytest.mark.asyncio
+async def test_transport_error_closes_session(config):
+    client, session = _client_with_session(config)
+    client._perform_write_register = AsyncMock(
+        side_effect=vistapool_modbus.ConnectionException("connection lost")
+    )
+    with pytest.raises(vistapool_modbus.ConnectionException):
+        await client.async_write_register(0x0100, 1)
+    assert client._client is None
+    assert client.connection_stats["errors_by_class"] == {
+        "transport": 1,
+        "protocol": 0,
+        "timeout": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_exception_response_marks_rejected_range(config, monkeypatch):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    rejected = _DummyResp([], is_error=True)
+    rejected.exception_code = 2
+    fake_modbus = AsyncMock()
+    fake_modbus.read_holding_registers = AsyncMock(return_value=rejected)
+    with pytest.raises(vistapool_modbus.ModbusProtocolError) as err:
+        await client._read_register_ranges(fake_modbus, [(0x0600, 2)])
+    assert err.value.address == 0x0600
+    stats = client.connection_stats
+    assert stats["rejected_ranges"] == {"0x0600": 2}
+    assert stats["errors_by_class"]["protocol"] == 1
+
+
+@pytest.mark.asyncio
+async def test_timer_read_stops_after_transport_error(config, monkeypatch):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.read_holding_registers = AsyncMock(
+        side_effect=ConnectionResetError("reset")
+    )
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+    assert await client.read_all_timers() == {}
+    assert fake_modbus.read_holding_registers.await_count == 1
+    assert client.connection_stats["errors_by_class"]["transport"] == 1
+
+
+# ---- Per-range retry and partial reads ----
+
+
+@pytest.mark.asyncio
+async def test_timed_out_range_is_retried_alone(config):
+    """Only the range that timed out is requested again; earlier ranges are kept."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client._client = MagicMock()
+    read = AsyncMock(
+        side_effect=[_DummyResp([1, 2]), TimeoutError("no response"), _DummyResp([3])]
+    )
+    registers = await client._read_register_ranges(
+        client._client, [(0x0200, 2), (0x0210, 1)], read_func=read
+    )
+    assert registers == [1, 2, 3]
+    assert [c.kwargs["address"] for c in read.call_args_list] == [
+        0x0200,
+        0x0210,
+        0x0210,
+    ]
+    assert client.connection_stats["errors_by_class"]["timeout"] == 1
+
+
+@pytest.mark.asyncio
+async def test_range_retry_budget_is_limited(config):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    client._client = MagicMock()
+    read = AsyncMock(side_effect=TimeoutError("no response"))
+    with pytest.raises(ModbusException):
+        await client._read_register_ranges(client._client, [(0x0200, 2)], read)
+    assert read.await_count == vistapool_modbus._RANGE_ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_retried_cycle_reuses_pages_already_read(config, monkeypatch):
+    """After a lost connection the cycle resumes without re-reading MEASURE."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.read_input_registers = AsyncMock(
+        return_value=_DummyResp(_measure_regs())
+    )
+    calls = []
+
+    async def read_holding(*args, **kwargs):
+        calls.append(kwargs["address"])
+        if len(calls) == 2:
+            raise ConnectionResetError("reset")
+        return _DummyResp([0] * kwargs["count"])
+
+    fake_modbus.read_holding_registers = read_holding
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    await client.async_read_all()
+
+    assert fake_modbus.read_input_registers.await_count == 1
+    # Only the page that failed is requested again
+    assert calls.count(calls[0]) == 1
+    assert calls.count(calls[1]) == 2
+    assert client._cycle_pages is None
+
+
+@pytest.mark.asyncio
+async def test_partial_full_read_is_repeated(config, monkeypatch):
+    """A full read with a failed page keeps the notification and stays due."""
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    fake_modbus = AsyncMock()
+    fake_modbus.connected = True
+    fake_modbus.read_input_registers = AsyncMock(
+        return_value=_DummyResp(_measure_regs(notification=0x0010))
+    )
+
+    async def read_holding(*args, **kwargs):
+        if 0x0500 <= kwargs["address"] < 0x0600:
+            return _DummyResp([], is_error=True)
+        return _DummyResp([0] * kwargs["count"])
+
+    fake_modbus.read_holding_registers = read_holding
+    monkeypatch.setattr(client, "get_client", AsyncMock(return_value=fake_modbus))
+
+    result = await client._perform_read_all()
+
+    assert "MBF_MEASURE_PH" in result
+    assert client.connection_stats["last_failed_pages"] == ["USER"]
+    assert client._full_read_due is True
+    fake_modbus.write_registers.assert_not_called()
+
+
+# ---- Persistent register cache ----
+
+
+def test_export_cache_requires_device_identity(config):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    assert client.export_cache() is None
+    client._cached_result = {
+        "MBF_POWER_MODULE_VERSION": 1280,
+        "MBF_POWER_MODULE_NODEID": [1, 2, 3, 4, 5, 6],
+        "MBF_PAR_PH1": 7.5,
+    }
+    client._cached_timers = {"filtration1": {"enable": 1}}
+    assert client.export_cache() == {
+        "identity": [1280, [1, 2, 3, 4, 5, 6]],
+        "result": client._cached_result,
+        "timers": {"filtration1": {"enable": 1}},
+    }
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"identity": [None, []], "result": {}, "timers": {}},
+        {"identity": 5, "result": {}, "timers": {}},
+        {"identity": [1, []], "result": 5, "timers": {}},
+    ],
+)
+def test_restore_cache_rejects_invalid_data(config, data):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    assert client.restore_cache(data) is False
+    assert client._cached_result == {}
+    assert client._full_read_due is True
+
+
+def test_restore_cache_turns_next_poll_into_partial_read(config):
+    client = vistapool_modbus.VistaPoolModbusClient(config)
+    assert client.restore_cache(
+        {
+            "identity": [1280, [1, 2, 3, 4, 5, 6]],
+            "result": {"MBF_PAR_PH1": 7.5},
+            "timers": {"filtration1": {"enable": 1}},
+        }
+    )
+    assert client._cached_result == {"MBF_PAR_PH1": 7.5}
+    assert client._full_read_due is False
+    assert client._last_was_full_read is False
+    assert client._restored_identity == [1280, [1, 2, 3, 4, 5, 6]]
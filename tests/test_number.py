@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from unittest.mock import AsyncMock, MagicMock, call, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -20,6 +20,7 @@ from custom_components.vistapool.const import (
     HEATING_SETPOINT_REGISTER,
     INTELLIGENT_SETPOINT_REGISTER,
 )
+from custom_components.vistapool.modbus import WriteTransaction
 from custom_components.vistapool.number import VistaPoolNumber, async_setup_entry
 
 
@@ -166,7 +167,7 @@ async def test_async_set_native_value_and_debounce(mock_coordinator):
     props = make_props(register=0x0210, scale=2.0)
     ent = VistaPoolNumber(mock_coordinator, "test_entry", "MBF_PAR_PH1", props)
     ent.coordinator.client = AsyncMock()
-    ent.coordinator.async_request_refresh = AsyncMock()
+    ent.coordinator.async_refresh_registers = AsyncMock()
     ent.async_write_ha_state = MagicMock()
     # Patch asyncio.sleep to run immediately
     with patch("custom_components.vistapool.number.asyncio.sleep", AsyncMock()):
@@ -176,7 +177,7 @@ async def test_async_set_native_value_and_debounce(mock_coordinator):
     ent.coordinator.client.async_write_register.assert_awaited_with(
         0x0210, 13, apply=True
     )
-    ent.coordinator.async_request_refresh.assert_awaited()
+    ent.coordinator.async_refresh_registers.assert_awaited_with(0x0210)
 
 
 @pytest.mark.asyncio
@@ -186,20 +187,24 @@ async def test_debounced_write_mirrors_setpoints_from_heating_register(
     """When editing heating setpoint, both HEATING and INTELLIGENT registers must be written."""
     props = make_props(register=HEATING_SETPOINT_REGISTER, scale=1.0)
     ent = VistaPoolNumber(mock_coordinator, "test_entry", "MBF_PAR_HEATING_TEMP", props)
-    ent.coordinator.client = AsyncMock()
-    ent.coordinator.async_request_refresh = AsyncMock()
+    ent.coordinator.client = client = AsyncMock()
+    client.transaction = MagicMock(
+        side_effect=lambda apply=False: WriteTransaction(client, apply)
+    )
+    ent.coordinator.async_refresh_registers = AsyncMock()
     ent.async_write_ha_state = MagicMock()
     with patch("custom_components.vistapool.number.asyncio.sleep", AsyncMock()):
         await ent.async_set_native_value(28)
         await ent._pending_write_task
-    # Expect two ordered writes: first to HEATING, then to INTELLIGENT with apply=True
-    ent.coordinator.client.async_write_register.assert_has_awaits(
-        [
-            call(HEATING_SETPOINT_REGISTER, 28),
-            call(INTELLIGENT_SETPOINT_REGISTER, 28, apply=True),
-        ]
-    )
-    ent.coordinator.async_request_refresh.assert_awaited()
+    # Expect one transaction writing HEATING, then INTELLIGENT, applied once
+    client.async_write_register.assert_not_awaited()
+    tx = client.async_write_transaction.await_args.args[0]
+    assert tx.blocks == [
+        (HEATING_SETPOINT_REGISTER, [28]),
+        (INTELLIGENT_SETPOINT_REGISTER, [28]),
+    ]
+    assert tx.save and tx.execute
+    ent.coordinator.async_refresh_registers.assert_awaited()
 
 
 @pytest.mark.asyncio
@@ -211,19 +216,23 @@ async def test_debounced_write_mirrors_setpoints_from_intelligent_register(
     ent = VistaPoolNumber(
         mock_coordinator, "test_entry", "MBF_PAR_INTELLIGENT_TEMP", props
     )
-    ent.coordinator.client = AsyncMock()
-    ent.coordinator.async_request_refresh = AsyncMock()
+    ent.coordinator.client = client = AsyncMock()
+    client.transaction = MagicMock(
+        side_effect=lambda apply=False: WriteTransaction(client, apply)
+    )
+    ent.coordinator.async_refresh_registers = AsyncMock()
     ent.async_write_ha_state = MagicMock()
     with patch("custom_components.vistapool.number.asyncio.sleep", AsyncMock()):
         await ent.async_set_native_value(26)
         await ent._pending_write_task
-    ent.coordinator.client.async_write_register.assert_has_awaits(
-        [
-            call(HEATING_SETPOINT_REGISTER, 26),
-            call(INTELLIGENT_SETPOINT_REGISTER, 26, apply=True),
-        ]
-    )
-    ent.coordinator.async_request_refresh.assert_awaited()
+    client.async_write_register.assert_not_awaited()
+    tx = client.async_write_transaction.await_args.args[0]
+    assert tx.blocks == [
+        (HEATING_SETPOINT_REGISTER, [26]),
+        (INTELLIGENT_SETPOINT_REGISTER, [26]),
+    ]
+    assert tx.save and tx.execute
+    ent.coordinator.async_refresh_registers.assert_awaited()
 
 
 @pytest.mark.asyncio
@@ -244,7 +253,7 @@ async def test_debounced_write_cancelled_when_winter_mode_enabled_during_delay(
     ent = VistaPoolNumber(mock_coordinator, "test_entry", "MBF_PAR_PH1", props)
     ent._pending_value = 7.2
     ent.coordinator.client = AsyncMock()
-    ent.coordinator.async_request_refresh = AsyncMock()
+    ent.coordinator.async_refresh_registers = AsyncMock()
 
     async def enable_winter_mode_during_sleep(_delay):
         """Simulate winter mode being enabled while the debounce timer is running."""
@@ -680,7 +689,7 @@ async def test_debounced_write_bitmask_lsb(mock_coordinator):
     # Current register value has 0x1E in upper byte (30°C shutdown)
     mock_coordinator.data = {"MBF_PAR_HIDRO_COVER_REDUCTION": 0x1E28}
     ent.coordinator.client = AsyncMock()
-    ent.coordinator.async_request_refresh = AsyncMock()
+    ent.coordinator.async_refresh_registers = AsyncMock()
     ent.async_write_ha_state = MagicMock()
     ent._pending_value = 50  # set cover reduction to 50%
     with patch("custom_components.vistapool.number.asyncio.sleep", AsyncMock()):
@@ -707,7 +716,7 @@ async def test_debounced_write_bitmask_msb(mock_coordinator):
     # Current register value has 0x28 = 40% in lower byte
     mock_coordinator.data = {"MBF_PAR_HIDRO_COVER_REDUCTION": 0x1E28}
     ent.coordinator.client = AsyncMock()
-    ent.coordinator.async_request_refresh = AsyncMock()
+    ent.coordinator.async_refresh_registers = AsyncMock()
     ent.async_write_ha_state = MagicMock()
     ent._pending_value = 25  # set shutdown temperature to 25°C
     with patch("custom_components.vistapool.number.asyncio.sleep", AsyncMock()):
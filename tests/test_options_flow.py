@@ -263,13 +263,14 @@ async def test_async_step_init_show_form():
 
 @pytest.mark.asyncio
 async def test_options_selector_values_coerced_to_int():
-    """scan_interval and timer_resolution submitted as strings must be saved as int."""
+    """Interval selector values submitted as strings must be saved as int."""
     mock_config_entry = MagicMock()
     mock_config_entry.options = {}
     flow = make_flow(mock_config_entry)
     user_input = {
         "scan_interval": "60",  # SelectSelector returns strings
         "timer_resolution": "15",
+        "verify_interval": "60",
         "measure_when_filtration_off": False,
     }
     result = await flow.async_step_init(user_input=user_input)
@@ -278,6 +279,7 @@ async def test_options_selector_values_coerced_to_int():
     assert isinstance(result["data"]["scan_interval"], int)
     assert result["data"]["timer_resolution"] == 15
     assert isinstance(result["data"]["timer_resolution"], int)
+    assert result["data"]["verify_interval"] == 60
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,126 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.vistapool import pacing
+from custom_components.vistapool.pacing import (
+    BACKOFF_STEP,
+    INITIAL_GAP,
+    MAX_GAP,
+    AdaptivePacer,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(pacing.time, "monotonic", fake)
+    return fake
+
+
+async def _request(pacer, clock, turnaround):
+    await pacer.wait()
+    clock.now += turnaround
+    pacer.record_success()
+
+
+@pytest.mark.asyncio
+async def test_first_request_is_not_delayed(clock):
+    pacer = AdaptivePacer()
+    with patch.object(pacing.asyncio, "sleep", AsyncMock()) as sleep:
+        await pacer.wait()
+    sleep.assert_not_awaited()
+    assert pacer.in_flight
+
+
+@pytest.mark.asyncio
+async def test_gap_shrinks_to_zero_on_fast_gateway(clock):
+    pacer = AdaptivePacer()
+    with patch.object(pacing.asyncio, "sleep", AsyncMock()) as sleep:
+        for _ in range(10):
+            await _request(pacer, clock, 0.001)
+        assert pacer.gap == pytest.approx(0.00025)  # turnaround floor
+        sleep.reset_mock()
+        await pacer.wait()
+    sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_slow_gateway_keeps_turnaround_floor(clock):
+    pacer = AdaptivePacer()
+    with patch.object(pacing.asyncio, "sleep", AsyncMock()) as sleep:
+        for _ in range(10):
+            await _request(pacer, clock, 0.08)
+        assert pacer.gap == pytest.approx(0.02)
+        sleep.reset_mock()
+        await pacer.wait()
+    sleep.assert_awaited_once_with(pytest.approx(0.02))
+
+
+@pytest.mark.asyncio
+async def test_only_the_remaining_gap_is_slept(clock):
+    pacer = AdaptivePacer()
+    with patch.object(pacing.asyncio, "sleep", AsyncMock()) as sleep:
+        await pacer.wait()
+        pacer.record_error()
+        clock.now += 0.03
+        await pacer.wait()
+    sleep.assert_awaited_once_with(pytest.approx(INITIAL_GAP * 2 - 0.03))
+
+
+def test_errors_back_off_up_to_max_gap(clock):
+    pacer = AdaptivePacer(initial_gap=0.0)
+    pacer.record_error()
+    assert pacer.gap == BACKOFF_STEP
+    for _ in range(20):
+        pacer.record_error()
+    assert pacer.gap == MAX_GAP
+    assert pacer.errors == 21
+    assert pacer.stats["error_rate"] > 0.9
+
+
+@pytest.mark.asyncio
+async def test_fc20_collision_backs_off_only_while_request_pending(clock):
+    pacer = AdaptivePacer(initial_gap=0.0)
+    pacer.record_collision()
+    assert pacer.gap == 0.0
+
+    with patch.object(pacing.asyncio, "sleep", AsyncMock()):
+        await pacer.wait()
+    pacer.record_collision()
+    assert pacer.gap == BACKOFF_STEP
+    assert pacer.stats["fc20_collisions"] == 2
+
+
+@pytest.mark.asyncio
+async def test_reset_connection_keeps_learned_gap(clock):
+    pacer = AdaptivePacer()
+    with patch.object(pacing.asyncio, "sleep", AsyncMock()) as sleep:
+        await _request(pacer, clock, 0.08)
+        pacer.reset_connection()
+        await pacer.wait()
+    sleep.assert_not_awaited()
+    assert pacer.gap == pytest.approx(0.025)
+    assert pacer.stats["average_turnaround"] == pytest.approx(0.08)
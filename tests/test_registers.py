@@ -0,0 +1,204 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from custom_components.vistapool.const import TIMER_BLOCKS
+from custom_components.vistapool.registers import (
+    KIND_ASCII,
+    KIND_LIST,
+    MAX_READ_COUNT,
+    PAGE_DECODERS,
+    PAGE_READ_PLAN,
+    PAGE_REGISTERS,
+    PAGES,
+    REGISTER_MAP,
+    PageDecoder,
+    RegisterSnapshot,
+    RegisterSpec,
+    decode_registers,
+    page_of_register,
+    plan_reads,
+    plan_timer_reads,
+    resolve_required_keys,
+    timer_of_register,
+)
+
+
+def test_register_map_keys_are_unique():
+    keys = [spec.key for spec in REGISTER_MAP]
+    assert len(keys) == len(set(keys))
+
+
+def test_register_map_pages_are_known():
+    assert {spec.page for spec in REGISTER_MAP} == set(PAGES)
+
+
+def test_page_read_plan_matches_device_layout():
+    """The compiled plan must cover each page with the minimal number of requests."""
+    assert PAGE_READ_PLAN == {
+        "MEASURE": [(0x0100, 18)],
+        "MODBUS": [(0x0002, 12)],
+        "GLOBAL": [(0x0206, 20), (0x0280, 2)],
+        "FACTORY": [(0x0300, 13), (0x0322, 4)],
+        "INSTALLER": [(0x0408, 31), (0x0427, 13), (0x04E8, 8)],
+        "USER": [(0x0502, 14)],
+        "MISC": [(0x0600, 16)],
+    }
+
+
+def test_page_read_plan_respects_device_limit_and_covers_all_registers():
+    for page, ranges in PAGE_READ_PLAN.items():
+        covered = {a for start, count in ranges for a in range(start, start + count)}
+        assert all(count <= MAX_READ_COUNT for _, count in ranges)
+        for spec in PAGE_REGISTERS[page]:
+            assert set(range(spec.address, spec.address + spec.width)) <= covered
+
+
+def test_plan_reads_bridges_small_gaps_only():
+    specs = [
+        RegisterSpec("A", 0x0100, "X"),
+        RegisterSpec("B", 0x0105, "X"),  # gap of 4 → bridged
+        RegisterSpec("C", 0x0120, "X"),  # gap of 26 → new request
+    ]
+    assert plan_reads(specs, max_gap=8) == [(0x0100, 6), (0x0120, 1)]
+    assert plan_reads(specs, max_gap=0) == [(0x0100, 1), (0x0105, 1), (0x0120, 1)]
+
+
+def test_plan_reads_splits_at_max_count():
+    specs = [RegisterSpec(f"R{i}", 0x0400 + i, "X") for i in range(40)]
+    assert plan_reads(specs, max_count=31) == [(0x0400, 31), (0x041F, 9)]
+
+
+def test_plan_reads_empty():
+    assert plan_reads([]) == []
+
+
+def test_plan_timer_reads_chunks_contiguous_blocks():
+    assert plan_timer_reads(TIMER_BLOCKS) == [
+        (0x0434, 31),
+        (0x0453, 31),
+        (0x0472, 31),
+        (0x0491, 31),
+        (0x04B0, 31),
+        (0x04CF, 25),
+    ]
+    # Non-adjacent blocks are not bridged (15 unused registers between them)
+    assert plan_timer_reads(["filtration1", "filtration3"]) == [
+        (0x0434, 15),
+        (0x0452, 15),
+    ]
+    assert plan_timer_reads([]) == []
+
+
+def test_decode_registers_scaling_sign_and_offset():
+    specs = [
+        RegisterSpec("PH", 0x0102, "X", divisor=100.0),
+        RegisterSpec("DELAY", 0x0433, "X", offset=10),
+        RegisterSpec("SIGNED", 0x0001, "X", signed=True),
+        RegisterSpec("MISSING", 0x0002, "X"),
+    ]
+    result = decode_registers(specs, {0x0102: 820, 0x0433: 5, 0x0001: 0xFFFE})
+    assert result["PH"] == pytest.approx(8.20)
+    assert result["DELAY"] == 15
+    assert result["SIGNED"] == -2
+    assert result["MISSING"] is None
+
+
+def test_decode_registers_list_and_ascii():
+    specs = [
+        RegisterSpec("IDS", 0x0004, "X", width=3, kind=KIND_LIST),
+        RegisterSpec("NAME", 0x0608, "X", width=2, kind=KIND_ASCII),
+    ]
+    image = {0x0004: 1, 0x0005: 2, 0x0006: 3, 0x0608: 0x6162, 0x0609: 0x6300}
+    result = decode_registers(specs, image)
+    assert result["IDS"] == [1, 2, 3]
+    assert result["NAME"] == "abc"
+
+
+@pytest.mark.parametrize("page", list(PAGES))
+def test_page_decoder_matches_image_decoder(page):
+    ranges = PAGE_READ_PLAN[page]
+    addresses = [a for start, count in ranges for a in range(start, start + count)]
+    registers = [(a * 7) & 0xFFFF for a in addresses]
+    expected = decode_registers(PAGE_REGISTERS[page], dict(zip(addresses, registers)))
+    assert PAGE_DECODERS[page].decode(registers) == expected
+    # Short response: the missing tail decodes like in the image decoder
+    short = registers[: len(registers) // 2]
+    expected = decode_registers(PAGE_REGISTERS[page], dict(zip(addresses, short)))
+    assert PAGE_DECODERS[page].decode(short) == expected
+
+
+def test_page_decoder_writes_into_given_mapping():
+    specs = [
+        RegisterSpec("PH", 0x0102, "X", divisor=100.0),
+        RegisterSpec("SIGNED", 0x0104, "X", signed=True),
+        RegisterSpec("NAME", 0x0106, "X", width=2, kind=KIND_ASCII),
+    ]
+    decoder = PageDecoder(specs, [(0x0102, 6)])
+    target = {"KEPT": 1}
+    assert decoder.decode([820, 0, 0xFFFE, 0, 0x6162, 0x6300], target) is target
+    assert target == {"KEPT": 1, "PH": pytest.approx(8.2), "SIGNED": -2, "NAME": "abc"}
+
+
+def test_register_snapshot_keeps_values_of_unchanged_pages():
+    specs = [
+        RegisterSpec("PH", 0x0102, "X", divisor=100.0),
+        RegisterSpec("RX", 0x0103, "X"),
+    ]
+    decoder = PageDecoder(specs, [(0x0102, 2)])
+    snapshot = RegisterSnapshot()
+    values = snapshot.set_page("X", decoder, [820, 700])
+    assert values == {"PH": pytest.approx(8.2), "RX": 700}
+
+    # Same registers: nothing is decoded again
+    assert snapshot.set_page("X", decoder, [820, 700]) is values
+    # ... unless the read plan changed
+    other = PageDecoder(specs, [(0x0102, 2)])
+    assert snapshot.set_page("X", other, [820, 700]) is not values
+
+    assert snapshot.set_page("X", other, [750, 700])["PH"] == pytest.approx(7.5)
+    assert snapshot.raw_pages() == {"X": [750, 700]}
+
+
+def test_resolve_required_keys_always_includes_capabilities():
+    required = resolve_required_keys([])
+    assert "MBF_PAR_MODEL" in required
+    assert "MBF_PAR_FILT_GPIO" in required
+    # Registers behind the entities' device info
+    assert "MBF_PAR_VERSION" in required
+    assert "MBF_PAR_UICFG_MACHINE" in required
+    assert "MBF_PAR_UICFG_MACH_NAME_BOLD" in required
+    assert "MBF_PAR_UICFG_MACH_NAME_LIGHT" in required
+    assert "MBF_CELL_RUNTIME_LOW" not in required
+    # Non-register capability keys are not returned
+    assert "Hydrolysis module detected" not in required
+
+
+def test_resolve_required_keys_entity_and_derived_keys():
+    required = resolve_required_keys(
+        ["MBF_CELL_BOOST", "MBF_PAR_HIDRO_SHUTDOWN_TEMPERATURE", "filtration1_start"]
+    )
+    assert "MBF_CELL_BOOST" in required
+    assert "MBF_PAR_HIDRO_COVER_REDUCTION" in required
+    assert "filtration1_start" not in required
+
+
+def test_page_and_timer_of_register():
+    assert page_of_register(0x0504) == "USER"
+    assert page_of_register(0x0102) == "MEASURE"
+    assert page_of_register(0xFFFF) is None
+    assert timer_of_register(TIMER_BLOCKS["filtration1"]) == "filtration1"
+    assert timer_of_register(TIMER_BLOCKS["relay_light"] + 14) == "relay_light"
+    assert timer_of_register(0x0504) is None
@@ -0,0 +1,83 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+
+from custom_components.vistapool.scheduler import (
+    PRIORITY_CONFIG,
+    PRIORITY_MEASURE,
+    PRIORITY_TIMERS,
+    PRIORITY_WRITE,
+    RequestScheduler,
+)
+
+
+async def _hold(scheduler, priority, order, name, release=None):
+    async with scheduler.slot(priority):
+        order.append(name)
+        if release is not None:
+            await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_by_priority():
+    scheduler = RequestScheduler()
+    order = []
+    release = asyncio.Event()
+    first = asyncio.create_task(
+        _hold(scheduler, PRIORITY_TIMERS, order, "timer1", release)
+    )
+    await asyncio.sleep(0)
+    tasks = [
+        asyncio.create_task(_hold(scheduler, priority, order, name))
+        for priority, name in (
+            (PRIORITY_TIMERS, "timer2"),
+            (PRIORITY_CONFIG, "config"),
+            (PRIORITY_MEASURE, "measure"),
+            (PRIORITY_WRITE, "write1"),
+            (PRIORITY_WRITE, "write2"),
+        )
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.queued == 5
+    release.set()
+    await asyncio.gather(first, *tasks)
+    assert order == ["timer1", "write1", "write2", "measure", "config", "timer2"]
+    stats = scheduler.stats
+    assert stats["queued"] == 0
+    assert stats["preemptions"] == 4
+    assert stats["granted"] == {"write": 2, "measure": 1, "config": 1, "timers": 2}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_gives_up_its_place():
+    scheduler = RequestScheduler()
+    order = []
+    release = asyncio.Event()
+    first = asyncio.create_task(
+        _hold(scheduler, PRIORITY_CONFIG, order, "config", release)
+    )
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(_hold(scheduler, PRIORITY_WRITE, order, "write"))
+    waiting = asyncio.create_task(_hold(scheduler, PRIORITY_TIMERS, order, "timer"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, waiting)
+    assert order == ["config", "timer"]
+    # The slot is free again
+    await asyncio.wait_for(_hold(scheduler, PRIORITY_WRITE, order, "late"), 1)
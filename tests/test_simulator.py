@@ -0,0 +1,199 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""End-to-end tests of VistaPoolModbusClient against the local NeoPool simulator."""
+
+import asyncio
+import struct
+
+import pytest
+from neopool_simulator import NeoPoolSimulator, crc16, rtu_frame
+
+from custom_components.vistapool.modbus import VistaPoolModbusClient
+
+
+def _client(sim, port, transport="pymodbus"):
+    return VistaPoolModbusClient(
+        {
+            "host": "127.0.0.1",
+            "port": port,
+            "slave_id": sim.unit,
+            "modbus_framer": sim.framer,
+            "modbus_transport": transport,
+        }
+    )
+
+
+async def _start(transport="pymodbus", **kwargs):
+    sim = NeoPoolSimulator(**kwargs)
+    port = await sim.start()
+    return sim, _client(sim, port, transport)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", ["pymodbus", "native"])
+@pytest.mark.parametrize("framer", ["tcp", "rtu"])
+async def test_full_read_over_the_wire(framer, transport):
+    """A full poll decodes the simulated register image for both framings."""
+    sim, client = await _start(transport, framer=framer)
+    try:
+        result = await client.async_read_all()
+        assert result["MBF_MEASURE_PH"] == pytest.approx(7.20)
+        assert result["MBF_MEASURE_TEMPERATURE"] == pytest.approx(26.5)
+        assert result["MBF_POWER_MODULE_VERSION"] == 1280
+        assert result["MBF_PAR_PH1"] == pytest.approx(7.50)
+        assert result["Filtration Pump"] is True
+        assert result["Hydrolysis module detected"] is True
+        # All requests respect the device limit
+        assert sim.stats["exceptions"] == 0
+        assert all(count <= 31 for _, _, count in sim.requests)
+    finally:
+        await client.close()
+        await sim.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", ["pymodbus", "native"])
+async def test_notification_drives_partial_read(transport):
+    """A panel change raises MBF_NOTIFICATION; only that page is re-read and cleared."""
+    sim, client = await _start(transport)
+    try:
+        await client.async_read_all()
+        sim.reset_stats()
+
+        # No change: only MEASURE is read
+        await client.async_read_all()
+        assert [fc for fc, _, _ in sim.requests] == [0x04]
+
+        sim.set_registers(0x0504, 760)  # MBF_PAR_PH1 changed on the panel
+        sim.reset_stats()
+        result = await client.async_read_all()
+
+        assert result["MBF_PAR_PH1"] == pytest.approx(7.60)
+        reads = [(fc, addr) for fc, addr, _ in sim.requests if fc in (3, 4)]
+        assert reads == [(0x04, 0x0100), (0x03, 0x0502)]
+        assert sim.get_register(0x0110) == 0  # notification acknowledged
+    finally:
+        await client.close()
+        await sim.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", ["pymodbus", "native"])
+async def test_write_register_round_trip(transport):
+    """Writes land in the image and the readback confirms them."""
+    sim, client = await _start(transport, framer="rtu")
+    try:
+        result = await client.async_write_register(0x0416, 30)
+        assert result["confirmed"] == 30
+        assert sim.get_register(0x0416) == 30
+        assert sim.get_register(0x0110) & 0x0008  # INSTALLER page flagged
+    finally:
+        await client.close()
+        await sim.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", ["pymodbus", "native"])
+async def test_fc20_broadcast_between_polls_does_not_break_reads(transport):
+    """Sugar Valley FC20 broadcasts arriving between polls are filtered out."""
+    sim, client = await _start(transport, framer="rtu")
+    try:
+        await client.async_read_all()
+        sim.broadcast_fc20()
+        await asyncio.sleep(0.05)
+        result = await client.async_read_all()
+        assert sim.stats["fc20_sent"] == 1
+        assert result["MBF_MEASURE_PH"] == pytest.approx(7.20)
+        assert client.connection_stats["fc20_filter"]["filtered_frames"] == 1
+    finally:
+        await client.close()
+        await sim.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", ["pymodbus", "native"])
+async def test_exception_response_keeps_session(transport):
+    """A rejected write is counted as a protocol error on the same connection."""
+    sim, client = await _start(transport)
+    try:
+        await client.async_read_all()
+        session = client._client
+        assert await client.async_write_register(0x0700, 1) is None
+        result = await client.async_read_all()
+        assert result["MBF_MEASURE_PH"] == pytest.approx(7.20)
+        assert client._client is session
+        stats = client.connection_stats
+        assert stats["errors_by_class"]["protocol"] == 1
+        assert stats["rejected_ranges"] == {"0x0700": 2}
+    finally:
+        await client.close()
+        await sim.stop()
+
+
+@pytest.mark.asyncio
+async def test_simulator_rejects_oversized_read_and_drops_requests():
+    """Raw protocol checks: 31-register limit, CRC framing and drop rate."""
+    sim = NeoPoolSimulator(framer="rtu", drop_rate=1.0, seed=1)
+    port = await sim.start()
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(rtu_frame(1, struct.pack(">BHH", 0x03, 0x0400, 31)))
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(reader.read(5), timeout=0.1)
+        assert sim.stats["dropped"] == 1
+
+        sim.drop_rate = 0.0
+        writer.write(rtu_frame(1, struct.pack(">BHH", 0x03, 0x0400, 32)))
+        response = await asyncio.wait_for(reader.readexactly(5), timeout=1)
+        assert response[1] == 0x83 and response[2] == 0x03
+        assert crc16(response[:-2]) == struct.unpack("<H", response[-2:])[0]
+    finally:
+        writer.close()
+        await sim.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", ["pymodbus", "native"])
+async def test_restored_register_cache_skips_config_pages(transport):
+    """After a restart the first poll reads MEASURE and the MODBUS identity page only."""
+    sim, client = await _start(transport)
+    try:
+        await client.async_read_all()
+        await client.read_all_timers()
+        saved = client.export_cache()
+        await client.close()
+
+        restarted = _client(sim, client._port, transport)
+        assert restarted.restore_cache(saved)
+        sim.reset_stats()
+        result = await restarted.async_read_all()
+        timers = await restarted.read_all_timers()
+        reads = [(fc, addr) for fc, addr, _ in sim.requests]
+        assert reads == [(0x04, 0x0100), (0x03, 0x0002)]
+        assert result["MBF_PAR_PH1"] == pytest.approx(7.50)
+        assert timers == saved["timers"]
+        await restarted.close()
+
+        # A different firmware invalidates the image and forces a full read
+        sim.set_registers(0x0002, 1281)
+        sim.reset_stats()
+        other = _client(sim, client._port, transport)
+        assert other.restore_cache(saved)
+        await other.async_read_all()
+        assert len(sim.requests) > 3
+        await other.close()
+    finally:
+        await client.close()
+        await sim.stop()
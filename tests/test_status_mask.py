@@ -14,6 +14,7 @@
 
 from custom_components.vistapool.const import is_valid_relay_gpio
 from custom_components.vistapool.status_mask import (
+    StatusDecoder,
     decode_hidro_status_bits,
     decode_ion_status_bits,
     decode_named_relay_states,
@@ -160,3 +161,31 @@ def test_decode_uv_lamp_state_invalid_gpio():
     assert decode_uv_lamp_state(0xFFFF, 0) == {}
     assert decode_uv_lamp_state(0xFFFF, 8) == {}
     assert decode_uv_lamp_state(0xFFFF, 255) == {}
+
+
+def test_status_decoder_reuses_decoding_of_unchanged_words():
+    calls = []
+
+    def counting(status):
+        calls.append(status)
+        return decode_ion_status_bits(status)
+
+    decoder = StatusDecoder()
+    first = decoder.decode("MBF_ION_STATUS", counting, 0x0001)
+    assert decoder.take_changed_keys() == frozenset(first)
+    assert decoder.decode("MBF_ION_STATUS", counting, 0x0001) is first
+    assert decoder.take_changed_keys() == frozenset()
+
+    decoder.decode("MBF_ION_STATUS", counting, 0x0003)
+    assert decoder.take_changed_keys() == {"ION Low Flow"}
+    # Back to a known word: served from the cache, still reported as changed
+    assert decoder.decode("MBF_ION_STATUS", counting, 0x0001) is first
+    assert decoder.take_changed_keys() == {"ION Low Flow"}
+    assert calls == [0x0001, 0x0003]
+
+
+def test_status_decoder_cache_is_bounded():
+    decoder = StatusDecoder(maxsize=2)
+    for value in range(4):
+        decoder.decode("MBF_RELAY_STATE", decode_relay_state, value << 3)
+    assert len(decoder._cache) == 2
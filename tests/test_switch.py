@@ -17,6 +17,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from custom_components.vistapool.modbus import WriteTransaction
 from custom_components.vistapool.switch import VistaPoolSwitch, async_setup_entry
 
 
@@ -37,6 +38,15 @@ def mock_coordinator():
     return mock
 
 
+def transaction_client():
+    """AsyncMock client whose transaction() records real WriteTransactions."""
+    client = AsyncMock()
+    client.transaction = MagicMock(
+        side_effect=lambda apply=False: WriteTransaction(client, apply)
+    )
+    return client
+
+
 def make_props(**kwargs):
     d = {}
     d.update(kwargs)
@@ -118,25 +128,28 @@ async def test_turn_on_relay_timer(mock_coordinator):
         timer_block_addr=0x0200,
     )
     ent = VistaPoolSwitch(mock_coordinator, "test_entry", "aux1", props)
-    ent.coordinator.client = AsyncMock()
+    ent.coordinator.client = client = transaction_client()
     ent.coordinator.async_request_refresh = AsyncMock()
     ent.async_write_ha_state = MagicMock()
     await ent.async_turn_on()
-    ent.coordinator.client.async_write_register.assert_any_await(0x0100, 7)
-    ent.coordinator.client.async_write_register.assert_any_await(0x0200, 3)
-    ent.coordinator.client.async_write_register.assert_any_await(0x02F5, 1)
+    client.async_write_register.assert_not_awaited()
+    client.async_write_transaction.assert_awaited_once()
+    tx = client.async_write_transaction.await_args.args[0]
+    assert tx.blocks == [(0x0100, [7]), (0x0200, [3])]
+    assert tx.execute and not tx.save
 
 
 @pytest.mark.asyncio
 async def test_turn_off_relay_timer(mock_coordinator):
     props = make_props(switch_type="relay_timer", timer_block_addr=0x0200)
     ent = VistaPoolSwitch(mock_coordinator, "test_entry", "aux1", props)
-    ent.coordinator.client = AsyncMock()
+    ent.coordinator.client = client = transaction_client()
     ent.coordinator.async_request_refresh = AsyncMock()
     ent.async_write_ha_state = MagicMock()
     await ent.async_turn_off()
-    ent.coordinator.client.async_write_register.assert_any_await(0x0200, 4)
-    ent.coordinator.client.async_write_register.assert_any_await(0x02F5, 1)
+    tx = client.async_write_transaction.await_args.args[0]
+    assert tx.blocks == [(0x0200, [4])]
+    assert tx.execute and not tx.save
 
 
 @pytest.mark.asyncio
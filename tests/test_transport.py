@@ -0,0 +1,139 @@
+# Copyright 2025 Miloš Svašek
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import struct
+
+import pytest
+from neopool_simulator import NeoPoolSimulator
+
+from custom_components.vistapool.transport import ModbusResponse, NativeModbusClient
+
+
+async def _connect(framer="tcp", timeout=1.0, **kwargs):
+    sim = NeoPoolSimulator(framer=framer, **kwargs)
+    port = await sim.start()
+    events = []
+    client = NativeModbusClient(
+        "127.0.0.1",
+        port,
+        rtu=framer == "rtu",
+        timeout=timeout,
+        on_broadcast=events.append,
+    )
+    assert await client.connect() is True
+    return sim, client, events
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("framer", ["tcp", "rtu"])
+async def test_read_and_write_registers(framer):
+    sim, client, _ = await _connect(framer)
+    try:
+        rr = await client.read_input_registers(0x0102, count=2, device_id=1)
+        assert not rr.isError()
+        assert rr.registers == [720, 709]
+
+        wr = await client.write_registers(0x0504, [760, 710], device_id=1)
+        assert not wr.isError()
+        rr = await client.read_holding_registers(0x0504, count=2, device_id=1)
+        assert rr.registers == [760, 710]
+    finally:
+        client.close()
+        await sim.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("framer", ["tcp", "rtu"])
+async def test_exception_response(framer):
+    sim, client, _ = await _connect(framer)
+    try:
+        rr = await client.read_holding_registers(0x0400, count=32, device_id=1)
+        assert rr.isError()
+        assert rr.function_code == 0x03
+        assert rr.exception_code == 0x03
+        assert "ExceptionResponse" in repr(rr)
+    finally:
+        client.close()
+        await sim.stop()
+
+
+@pytest.mark.asyncio
+async def test_fc20_broadcast_is_stripped_natively():
+    sim, client, events = await _connect("rtu")
+    try:
+        sim.broadcast_fc20()
+        rr = await client.read_input_registers(0x0102, count=1, device_id=1)
+        assert rr.registers == [720]
+        assert len(events) == 1
+        assert client.fc20_splitter.filtered_frames == 1
+    finally:
+        client.close()
+        await sim.stop()
+
+
+@pytest.mark.asyncio
+async def test_timeout_and_stale_transaction_id_discarded():
+    sim, client, _ = await _connect("tcp", timeout=0.1, drop_rate=1.0)
+    try:
+        with pytest.raises(TimeoutError):
+            await client.read_input_registers(0x0102, count=1, device_id=1)
+        # A late answer to the timed-out request carries the old TID
+        stale_tid = client._tid
+        sim.drop_rate = 0.0
+        pending = asyncio.ensure_future(
+            client.read_input_registers(0x0103, count=1, device_id=1)
+        )
+        await asyncio.sleep(0)
+        client._data_received(
+            struct.pack(">HHHBBBH", stale_tid, 0, 5, 1, 0x04, 2, 0xDEAD)
+        )
+        rr = await pending
+        assert rr.registers == [709]
+    finally:
+        client.close()
+        await sim.stop()
+
+
+@pytest.mark.asyncio
+async def test_not_connected_and_connection_lost():
+    client = NativeModbusClient("127.0.0.1", 1, timeout=0.5)
+    assert client.connected is False
+    with pytest.raises(ConnectionError):
+        await client.read_input_registers(0x0100, count=1)
+    assert await client.connect() is False
+
+    sim, client, _ = await _connect("tcp")
+    await sim.stop()
+    with pytest.raises((ConnectionError, TimeoutError)):
+        await client.read_input_registers(0x0100, count=1)
+    client.close()
+    assert client.connected is False
+
+
+def test_resync_drops_partial_frame():
+    client = NativeModbusClient("127.0.0.1", 1, rtu=True)
+    client._rx += bytes([0x01, 0x03])
+    client.fc20_splitter.feed(bytes([0x01, 0x20, 0x02]))
+    client.resync()
+    assert client._rx == bytearray()
+    assert client.fc20_splitter.stats["buffered_bytes"] == 0
+
+
+def test_response_repr():
+    assert (
+        repr(ModbusResponse(0x03, [1, 2]))
+        == "ModbusResponse(fc=0x03, registers=[1, 2])"
+    )
+    assert ModbusResponse(0x10).registers == []